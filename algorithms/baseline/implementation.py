@@ -13,16 +13,15 @@ ALGORITMO GREEDY CONSENSUS:
 ├─────────────────────────────────────────────────────────────────────────────────┤
 │ 1. INICIALIZAÇÃO                                                               │
 │   ├── Valida entrada (strings não vazias, mesmo comprimento)                   │
-│   └── Inicializa string consenso vazia                                         │
+│   └── Inicializa contadores de divergência por string (zerados)                │
 ├─────────────────────────────────────────────────────────────────────────────────┤
 │ 2. CONSTRUÇÃO POSIÇÃO-A-POSIÇÃO                                               │
 │   ├── Para cada posição i de 0 a L-1:                                          │
 │   │   ├── Para cada símbolo c do alfabeto:                                     │
-│   │   │   ├── Calcula string parcial = consenso[0:i] + c                      │
-│   │   │   ├── Calcula distância máxima da string parcial                      │
-│   │   │   └── Armazena se for a melhor opção até agora                        │
+│   │   │   ├── Distância parcial = contador + (s[i] != c) para cada string     │
+│   │   │   └── Armazena se a distância máxima for a melhor até agora           │
 │   │   └── Escolhe símbolo que minimiza distância máxima                       │
-│   └── Adiciona melhor símbolo ao consenso                                      │
+│   └── Adiciona melhor símbolo ao consenso e atualiza os contadores             │
 ├─────────────────────────────────────────────────────────────────────────────────┤
 │ 3. VALIDAÇÃO E RETORNO                                                        │
 │   ├── Calcula distância final da string consenso completa                      │
@@ -75,6 +74,13 @@ Version: Otimizada para clareza e servir como baseline confiável
 
 import logging
 
+try:  # Sem NumPy, o HammingEngine não é vetorizado e usa-se o caminho puro
+    import numpy as np
+except ImportError:  # pragma: no cover - depende do ambiente
+    np = None
+
+from src.domain.metrics import HammingEngine
+
 logger = logging.getLogger(__name__)
 
 
@@ -93,13 +99,15 @@ def greedy_consensus(strings: list[str], alphabet: str) -> str:
        - Assume que todas têm o mesmo comprimento (pré-condição)
 
     2. **CONSTRUÇÃO INCREMENTAL**:
+       - Mantém, para cada string, o número de divergências do prefixo já
+         construído (contador corrente)
        - Para cada posição i de 0 a L-1:
          a) Testa cada símbolo do alfabeto nessa posição
-         b) Para cada símbolo candidato:
-            - Constrói string parcial até posição i
-            - Calcula distância máxima da string parcial
-         c) Escolhe símbolo que minimiza a distância máxima
-         d) Adiciona símbolo escolhido ao consenso
+         b) Para cada símbolo candidato, a distância parcial de cada string
+            é o contador mais (s[i] != símbolo)
+         c) Escolhe símbolo que minimiza a distância máxima (o primeiro do
+            alfabeto em caso de empate)
+         d) Adiciona símbolo escolhido ao consenso e atualiza os contadores
 
     3. **ESTRATÉGIA DE OTIMIZAÇÃO LOCAL**:
        - Em cada posição, escolhe símbolo que resulta na menor
@@ -107,11 +115,11 @@ def greedy_consensus(strings: list[str], alphabet: str) -> str:
        - Não considera impacto futuro (característica gulosa)
 
     COMPLEXIDADE TEMPORAL:
-    - O(L × |Σ| × n × L) onde:
+    - O(L × |Σ| × n) onde:
       - L = comprimento das strings
       - |Σ| = tamanho do alfabeto
       - n = número de strings
-      - Fator L adicional vem do cálculo de distância parcial
+      - Cada posição custa O(|Σ| × n), vetorizado com numpy quando disponível
 
     CARACTERÍSTICAS:
     - **Determinístico**: Sempre produz o mesmo resultado
@@ -146,44 +154,41 @@ def greedy_consensus(strings: list[str], alphabet: str) -> str:
         return ""
 
     # INICIALIZAÇÃO
-    L = len(strings[0])  # Comprimento das strings (assumido uniforme)
+    engine = HammingEngine(strings)
+    columns = engine.columns  # Uma coluna por posição
     consensus = []  # String consenso sendo construída
 
-    # CONSTRUÇÃO POSIÇÃO-A-POSIÇÃO
-    for pos in range(L):
-        best_char = None  # Melhor símbolo para posição atual
-        best_max_dist = float("inf")  # Menor distância máxima encontrada
-
-        # TESTE DE CADA SÍMBOLO DO ALFABETO
-        for char in alphabet:
-            # Construir string parcial com símbolo candidato
-            partial_consensus = consensus + [char]
-
-            # CÁLCULO DA DISTÂNCIA MÁXIMA PARCIAL
-            # Calcula distância apenas considerando posições já decididas
-            max_dist = 0
-            for s in strings:
-                # Distância de Hamming parcial (até posição atual + 1)
-                dist = sum(1 for i in range(pos + 1) if partial_consensus[i] != s[i])
-                max_dist = max(max_dist, dist)
-
-            # ATUALIZAÇÃO DO MELHOR CANDIDATO
-            # Se encontrou símbolo que resulta em menor distância máxima
-            if max_dist < best_max_dist:
-                best_max_dist = max_dist
-                best_char = char
-
-        # DECISÃO GULOSA: Adicionar melhor símbolo encontrado
-        consensus.append(best_char)
+    # CONSTRUÇÃO POSIÇÃO-A-POSIÇÃO COM CONTADORES CORRENTES
+    # dist[j] = divergências entre o prefixo construído e a string j
+    if engine.vectorized:
+        codes = np.array([engine.code_of(char) for char in alphabet], dtype=np.uint8)
+        dist = np.zeros(engine.n, dtype=np.int64)
+        for column in columns:
+            # Divergências de cada símbolo do alfabeto com a coluna (|Σ| × n)
+            mismatch = codes[:, None] != column[None, :]
+            # argmin retorna o primeiro mínimo: mesmo desempate do laço
+            best = int(np.argmin((dist + mismatch).max(axis=1)))
+            consensus.append(alphabet[best])
+            dist += mismatch[best]
+        final_distance = int(dist.max())
+    else:
+        dist = [0] * engine.n
+        for column in columns:
+            best_char = None  # Melhor símbolo para posição atual
+            best_max_dist = float("inf")  # Menor distância máxima encontrada
+            for char in alphabet:
+                max_dist = max(d + (c != char) for d, c in zip(dist, column))
+                if max_dist < best_max_dist:
+                    best_max_dist = max_dist
+                    best_char = char
+            consensus.append(best_char)
+            dist = [d + (c != best_char) for d, c in zip(dist, column)]
+        final_distance = max(dist)
 
     # CONSTRUÇÃO DA STRING FINAL
     result = "".join(consensus)
 
-    # VALIDAÇÃO E LOG DO RESULTADO
-    # Import local para evitar conflito de nomes
-    from src.domain.metrics import max_distance as calc_max_distance
-
-    final_distance = calc_max_distance(result, strings)
+    # LOG DO RESULTADO (distância final = maior contador)
     logger.info("[CONSENSUS] Consenso: %s, distância: %d", result, final_distance)
 
     return result
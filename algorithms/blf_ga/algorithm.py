@@ -11,6 +11,7 @@ from src.domain.algorithms import CSPAlgorithm, register_algorithm
 
 from .config import BLF_GA_DEFAULTS
 from .implementation import BLFGA
+from .islands import IslandModel
 
 
 @register_algorithm
@@ -45,24 +46,29 @@ class BLFGAAlgorithm(CSPAlgorithm):
     default_params = BLF_GA_DEFAULTS
     supports_internal_parallel = True  # BLF-GA pode usar paralelismo interno
     is_deterministic = False  # É estocástico (pode ter seed para reprodutibilidade)
+    relative_cost = 20.0  # Muitas gerações sobre a população
 
     def __init__(self, strings: list[str], alphabet: str, **params):
         super().__init__(strings, alphabet, **params)
 
-        # Filtrar parâmetros para passar apenas os que a implementação BLFGA conhece
+        self.blf_ga_instance = BLFGA(
+            self.strings, self.alphabet, **self._implementation_params()
+        )
+        self.island_model: IslandModel | None = None
+
+        # Configurar callback de histórico se habilitado
+        if self.save_history:
+            self.blf_ga_instance.set_history_callback(self._save_dynamic_history_entry)
+
+    def _implementation_params(self) -> dict:
+        """Parâmetros conhecidos pela implementação BLFGA."""
         # Remover parâmetros específicos do framework de histórico
-        blfga_params = {
+        return {
             k: v
             for k, v in self.params.items()
             if k not in ["save_history", "history_frequency"]
         }
 
-        self.blf_ga_instance = BLFGA(self.strings, self.alphabet, **blfga_params)
-
-        # Configurar callback de histórico se habilitado
-        if self.save_history:
-            self.blf_ga_instance.set_history_callback(self._save_dynamic_history_entry)
-
     def set_params(self, **params) -> None:
         """
         Define novos parâmetros para o algoritmo.
@@ -125,7 +131,23 @@ class BLFGAAlgorithm(CSPAlgorithm):
                 initial_fitness=None,
             )
 
-            best, best_val, ga_history = self.blf_ga_instance.run()
+            if self.blf_ga_instance.islands > 1:
+                # Modelo de ilhas: populações independentes em processos
+                self.island_model = IslandModel(
+                    self.strings,
+                    self.alphabet,
+                    self._implementation_params(),
+                    self.blf_ga_instance.islands,
+                    self.blf_ga_instance.island_topology,
+                    self.blf_ga_instance.migration_interval,
+                    self.blf_ga_instance.migration_size,
+                )
+                self.island_model.set_progress_callback(self._report_progress)
+                best, best_val, ga_history = self.island_model.run()
+                fitness_cache_stats = self.island_model.fitness_cache_stats()
+            else:
+                best, best_val, ga_history = self.blf_ga_instance.run()
+                fitness_cache_stats = self.blf_ga_instance.fitness_cache.stats()
             execution_time = time.time() - start_time
 
             # Processar histórico do GA para nosso formato padrão
@@ -166,12 +188,15 @@ class BLFGAAlgorithm(CSPAlgorithm):
                     "improvement": (ga_history[0] - best_val) if ga_history else 0,
                     "fitness_history_length": len(ga_history) if ga_history else 0,
                 },
+                "fitness_cache": fitness_cache_stats,
+                "islands": (self.island_model.summary() if self.island_model else None),
                 "algorithm_config": {
                     "population_size": self.blf_ga_instance.pop_size,
                     "max_generations": self.blf_ga_instance.max_gens,
                     "crossover_prob": self.blf_ga_instance.cross_prob,
                     "mutation_prob": self.blf_ga_instance.mut_prob,
                     "elite_rate": self.blf_ga_instance.elite_rate,
+                    "population_engine": self.blf_ga_instance.population_engine,
                 },
                 "adaptive_mechanisms_used": {
                     "immigrants": self.blf_ga_instance.immigrant_freq > 0,
@@ -245,6 +270,9 @@ class BLFGAAlgorithm(CSPAlgorithm):
             "crossover_type": self.blf_ga_instance.crossover_type,
             "mutation_type": self.blf_ga_instance.mutation_type,
             "refinement_type": self.blf_ga_instance.refinement_type,
+            "population_engine": self.blf_ga_instance.population_engine,
+            "fitness_cache_size": self.blf_ga_instance.fitness_cache_size,
+            "islands": self.blf_ga_instance.islands,
             "adaptive_features": {
                 "immigrant_injection": self.blf_ga_instance.immigrant_freq > 0,
                 "adaptive_mutation": True,
@@ -28,6 +28,9 @@ BLF_GA_DEFAULTS = {
     "min_pop_size": 20,  # Tamanho mínimo da população quando usar proporção de n
     # Evita populações muito pequenas em instâncias menores
     "seed": None,  # Semente para reprodutibilidade (None = aleatório)
+    "population_engine": "list",  # Representação: list (strings) ou array (matriz uint8)
+    # array aplica seleção, crossover e mutação em lote com NumPy (pop/L grandes)
+    "fitness_cache_size": 10000,  # Entradas do cache LRU de fitness por execução (0 = desligado)
     # --- PARÂMETROS DE BLOCOS (LEARNING) ---
     "initial_blocks": 0.2,  # Número de blocos iniciais (int fixo ou float 0-1 para proporção de L)
     # Exemplos: 5 (fixo), 0.2 (20% do comprimento)
@@ -70,4 +73,9 @@ BLF_GA_DEFAULTS = {
     "restart_ratio": 0.3,  # Proporção da população a reiniciar
     "disable_elitism_gens": 5,  # Desabilita elitismo a cada X gerações
     # Evita convergência prematura
+    # --- MODELO DE ILHAS ---
+    "islands": 1,  # Populações independentes em processos separados (1 = desligado)
+    "island_topology": "ring",  # Destino dos migrantes: ring, fully_connected, star
+    "migration_interval": 10,  # Migração a cada X gerações
+    "migration_size": 2,  # Elites enviados por ilha a cada migração
 }
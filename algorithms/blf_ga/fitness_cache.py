@@ -0,0 +1,125 @@
+"""
+Cache de fitness por execução do BLF-GA.
+
+Memoriza a distância máxima de cada indivíduo já avaliado em uma execução,
+com descarte LRU quando o limite de entradas é atingido. Populações
+convergidas repetem os mesmos indivíduos entre gerações (elites, cópias
+sem crossover, torneios), de modo que a maior parte das avaliações passa a
+ser uma consulta ao dicionário.
+
+Classes:
+    FitnessCache: Cache LRU limitado com contadores de acerto.
+"""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Optional
+
+
+class FitnessCache:
+    """
+    Cache LRU limitado de fitness, indexado pela própria string do indivíduo
+    (ou pelos bytes da linha codificada, no motor ``array``).
+
+    Attributes:
+        max_size: Número máximo de entradas (0 desabilita o cache)
+        hits: Consultas atendidas pelo cache (avaliações economizadas)
+        misses: Consultas que exigiram avaliação
+        evictions: Entradas descartadas pelo limite de tamanho
+    """
+
+    def __init__(self, evaluate: Callable[[str], int], max_size: int = 10000):
+        """
+        Inicializa o cache.
+
+        Args:
+            evaluate: Função de fitness (distância máxima) de um indivíduo
+            max_size: Número máximo de entradas; 0 desabilita o cache
+        """
+        self._evaluate = evaluate
+        self.max_size = max(0, int(max_size))
+        self._entries: OrderedDict[Hashable, int] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __call__(self, ind: str) -> int:
+        """Retorna o fitness do indivíduo, avaliando-o apenas se necessário."""
+        if not self.max_size:
+            return self._evaluate(ind)
+        value = self.lookup(ind)
+        if value is None:
+            value = self._evaluate(ind)
+            self.store(ind, value)
+        return value
+
+    def lookup(self, ind: Hashable) -> Optional[int]:
+        """
+        Consulta o cache sem avaliar.
+
+        Returns:
+            Optional[int]: Fitness memorizado, ou None (conta como falta)
+        """
+        with self._lock:
+            value = self._entries.get(ind)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(ind)
+            self.hits += 1
+            return value
+
+    def store(self, ind: Hashable, value: int) -> None:
+        """Memoriza o fitness de um indivíduo avaliado externamente."""
+        if not self.max_size:
+            return
+        with self._lock:
+            self._entries[ind] = int(value)
+            self._entries.move_to_end(ind)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Descarta as entradas e zera os contadores."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict:
+        """Contadores para os metadados da execução."""
+        lookups = self.hits + self.misses
+        return {
+            "max_size": self.max_size,
+            "entries": len(self._entries),
+            "lookups": lookups,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "saved_evaluations": self.hits,
+            "evictions": self.evictions,
+        }
+
+    @staticmethod
+    def combine_stats(stats: list[dict]) -> dict:
+        """Soma os contadores de vários caches (ex.: uma por ilha)."""
+        combined = {
+            key: sum(s[key] for s in stats)
+            for key in (
+                "max_size",
+                "entries",
+                "lookups",
+                "hits",
+                "misses",
+                "saved_evaluations",
+                "evictions",
+            )
+        }
+        lookups = combined["lookups"]
+        combined["hit_rate"] = combined["hits"] / lookups if lookups else 0.0
+        return combined
@@ -96,7 +96,9 @@ import numpy as np
 from src.domain.metrics import hamming_distance, max_distance
 
 from .config import BLF_GA_DEFAULTS
-from .ops import genetic_ops
+from .fitness_cache import FitnessCache
+from .ops import array_ops, genetic_ops
+from .ops.array_ops import EncodedPopulation, PopulationCodec
 
 logger = logging.getLogger(__name__)
 
@@ -217,6 +219,12 @@ class BLFGA:
         restart_ratio: float | None = None,  # pylint: disable=unused-argument
         disable_elitism_gens: int | None = None,  # pylint: disable=unused-argument
         no_improve_patience: int | None = None,  # pylint: disable=unused-argument
+        population_engine: str | None = None,
+        fitness_cache_size: int | None = None,
+        islands: int | None = None,
+        island_topology: str | None = None,
+        migration_interval: int | None = None,
+        migration_size: int | None = None,
     ):
         self.strings = strings
         self.n = len(strings)
@@ -248,6 +256,18 @@ class BLFGA:
             params["max_time"] = max_time
         if seed is not None:
             params["seed"] = seed
+        if population_engine is not None:
+            params["population_engine"] = population_engine
+        if fitness_cache_size is not None:
+            params["fitness_cache_size"] = fitness_cache_size
+        if islands is not None:
+            params["islands"] = islands
+        if island_topology is not None:
+            params["island_topology"] = island_topology
+        if migration_interval is not None:
+            params["migration_interval"] = migration_interval
+        if migration_size is not None:
+            params["migration_size"] = migration_size
 
         # Incluir parâmetro min_pop_size se fornecido
         if min_pop_size is not None:
@@ -292,6 +312,21 @@ class BLFGA:
         self.max_gens = params["max_gens"]
         self.max_time = params["max_time"]
         self.rng = random.Random(params["seed"])
+        # Representação da população: "list" (strings) ou "array" (matriz uint8)
+        self.population_engine = params["population_engine"]
+        self.np_rng = np.random.default_rng(params["seed"])
+        self._codec: PopulationCodec | None = None
+        # Cache LRU de fitness, recriado a cada execução
+        self.fitness_cache_size = params["fitness_cache_size"]
+        self.fitness_cache = self._new_fitness_cache()
+        # Modelo de ilhas (executado por IslandModel; cada ilha é um BLFGA)
+        self.islands = params["islands"]
+        self.island_topology = params["island_topology"]
+        self.migration_interval = params["migration_interval"]
+        self.migration_size = params["migration_size"]
+        self.migration_callback: (
+            Callable[[int, Population], Optional[list[String]]] | None
+        ) = None
         self.progress_callback: Callable[[str], None] | None = None
         self.history_callback: Callable[[int, dict], None] | None = (
             None  # Callback para eventos dinâmicos
@@ -439,6 +474,7 @@ class BLFGA:
         # Reinicializar gerador de números aleatórios se semente mudou
         if "seed" in params:
             self.rng = random.Random(params["seed"])
+            self.np_rng = np.random.default_rng(params["seed"])
 
     def set_history_callback(
         self, callback: Optional[Callable[[int, dict], None]]
@@ -460,6 +496,19 @@ class BLFGA:
         """
         self.history_callback = callback
 
+    def set_migration_callback(
+        self, callback: Optional[Callable[[int, Population], Optional[list[String]]]]
+    ) -> None:
+        """
+        Define o callback de migração usado pelo modelo de ilhas.
+
+        Chamado ao fim de cada geração com (geração, população ordenada). Deve
+        retornar a lista de imigrantes recebidos (possivelmente vazia), que
+        substituem os piores indivíduos, ou None para encerrar a execução
+        (outra ilha encontrou a solução ótima).
+        """
+        self.migration_callback = callback
+
     def run(self) -> tuple[String, int, list]:
         """
         Executa o algoritmo BLF-GA para encontrar a string mais próxima.
@@ -502,6 +551,9 @@ class BLFGA:
                 - histórico: Lista com fitness por geração
         """
         start = time.time()
+        self.fitness_cache = self._new_fitness_cache()
+        if self._codec is not None:
+            self._codec.fitness_cache = self.fitness_cache
 
         if self.progress_callback:
             self.progress_callback("Criando população inicial...")
@@ -512,8 +564,7 @@ class BLFGA:
         # - Variações do consenso com blocos das strings originais
         # - Strings completamente aleatórias
         pop = self._init_population()
-        best = min(pop, key=lambda s: max_distance(s, self.strings))
-        best_val = max_distance(best, self.strings)
+        best, best_val = self._best_individual(pop)
         self.history = [best_val]
         no_improve = 0  # Contador para early stopping
         mut_prob_backup = self.mut_prob  # Backup para mutação adaptativa
@@ -538,11 +589,7 @@ class BLFGA:
             # Previne convergência prematura e mantém exploração
             if self.immigrant_freq and gen % self.immigrant_freq == 0:
                 n_imm = int(self.immigrant_ratio * self.pop_size)
-                for _ in range(n_imm):
-                    rand_s = "".join(
-                        self.rng.choice(self.alphabet) for _ in range(self.L)
-                    )
-                    pop[-(_ + 1)] = rand_s
+                self._replace_tail_random(pop, n_imm)
 
                 # Log da operação dinâmica
                 if self.history_callback:
@@ -562,7 +609,7 @@ class BLFGA:
 
             # --- MECANISMO 2: MUTAÇÃO ADAPTATIVA ---
             # Ajusta taxa de mutação baseada na diversidade populacional e convergência
-            diversity = genetic_ops.mean_hamming_distance(pop)
+            diversity = self._population_diversity(pop)
 
             # Se diversidade baixa, aumenta mutação temporariamente
             if diversity < self.diversity_threshold * self.L:
@@ -668,11 +715,9 @@ class BLFGA:
             # --- MECANISMO 6: REFINAMENTO LOCAL ---
             # Aplica busca local intensiva nos melhores indivíduos
             if self.refine_elites == "all":
-                old_elites_fitness = [max_distance(e, self.strings) for e in elites]
+                old_elites_fitness = [self._fitness(e) for e in elites]
                 pop[:k] = self._refine_elites(elites)  # Refina todos os elites
-                new_elites_fitness = [
-                    max_distance(pop[i], self.strings) for i in range(k)
-                ]
+                new_elites_fitness = [self._fitness(pop[i]) for i in range(k)]
 
                 # Log da operação dinâmica
                 if self.history_callback:
@@ -695,11 +740,11 @@ class BLFGA:
                     )
             else:
                 if elites:
-                    old_best_fitness = max_distance(elites[0], self.strings)
+                    old_best_fitness = self._fitness(elites[0])
                     pop[0] = self._refine_elites([elites[0]])[
                         0
                     ]  # Refina apenas o melhor
-                    new_best_fitness = max_distance(pop[0], self.strings)
+                    new_best_fitness = self._fitness(pop[0])
 
                     # Log da operação dinâmica
                     if self.history_callback:
@@ -716,7 +761,7 @@ class BLFGA:
                         )
 
             cur_best = pop[0]
-            cur_val = max_distance(cur_best, self.strings)
+            cur_val = self._fitness(cur_best)
             self.history.append(cur_val)
 
             # Atualiza melhor solução global
@@ -730,13 +775,11 @@ class BLFGA:
             # Reinicia parte da população se estagnada por muito tempo
             if self.restart_patience and no_improve >= self.restart_patience:
                 n_restart = int(self.restart_ratio * self.pop_size)
-                restarted_positions = []
-                for i in range(n_restart):
-                    pos = -(i + 1)
-                    pop[pos] = "".join(
-                        self.rng.choice(self.alphabet) for _ in range(self.L)
-                    )
-                    restarted_positions.append(self.pop_size + pos)  # Posição absoluta
+                self._replace_tail_random(pop, n_restart)
+                # Posições absolutas dos indivíduos reiniciados
+                restarted_positions = [
+                    self.pop_size - (i + 1) for i in range(n_restart)
+                ]
 
                 # Log da operação dinâmica
                 if self.history_callback:
@@ -756,6 +799,31 @@ class BLFGA:
 
                 no_improve = 0
 
+            # --- MECANISMO 9: MIGRAÇÃO (MODELO DE ILHAS) ---
+            # Envia elites e recebe migrantes de outras ilhas
+            if self.migration_callback:
+                immigrants = self.migration_callback(gen, pop)
+                if immigrants is None:
+                    break
+                immigrants = immigrants[: self.pop_size]
+                for i, ind in enumerate(immigrants):
+                    pop[-(i + 1)] = ind
+                    ind_val = self._fitness(ind)
+                    if ind_val < best_val:
+                        best, best_val = ind, ind_val
+                        no_improve = 0
+
+                if immigrants and self.history_callback:
+                    self.history_callback(
+                        gen,
+                        {
+                            "event": "migration",
+                            "description": f"Recebidos {len(immigrants)} migrantes na geração {gen}",
+                            "immigrant_count": len(immigrants),
+                            "best_fitness": best_val,
+                        },
+                    )
+
             # --- CRITÉRIO DE PARADA 1: EARLY STOPPING ---
             # Encerra se não houver melhoria por X gerações
             if self.no_improve_patience and no_improve >= self.no_improve_patience:
@@ -865,6 +933,9 @@ class BLFGA:
             - Variação 2: "AGCT" (bloco 1 de "AGCT")
             - Aleatórias: "TTAA", "CGAT", etc.
         """
+        if self.population_engine == "array":
+            return self._init_population_array()
+
         # 1. CONSENSO GLOBAL: Criar string baseada na moda de cada posição
         # Counter conta frequência de cada símbolo, most_common(1) pega o mais frequente
         consensus = "".join(
@@ -975,6 +1046,12 @@ class BLFGA:
             O repositório pode ser usado posteriormente em operações como
             crossover_blend_blocks ou para guiar mutações inteligentes.
         """
+        if isinstance(pop, EncodedPopulation):
+            # Consenso por posição a partir das contagens por coluna
+            counts = array_ops.column_counts(pop.matrix, len(self.codec.symbols))
+            consensus = self.codec.decode(counts.argmax(axis=1).astype(np.uint8))
+            return [consensus[l:r] for l, r in self.blocks]
+
         repo = []
 
         # Processar cada bloco independentemente
@@ -1064,7 +1141,7 @@ class BLFGA:
         # 2. COMPETIÇÃO: Avaliar todos os competidores
         # min() com key= encontra o competidor com menor distância máxima
         # Menor distância = melhor solução para o CSP
-        winner = min(tournament_pool, key=lambda s: max_distance(s, self.strings))
+        winner = min(tournament_pool, key=lambda s: self._fitness(s))
 
         return winner
 
@@ -1341,6 +1418,9 @@ class BLFGA:
             não usa diretamente o conhecimento de blocos na geração. Versões
             futuras podem integrar repo nos operadores genéticos.
         """
+        if isinstance(pop, EncodedPopulation):
+            return self._next_generation_array(pop)
+
         # 1. AVALIAÇÃO E ORDENAÇÃO PARALELA
         # Calcula fitness de todos os indivíduos usando múltiplas threads
         # Ordena do melhor (menor distância) para o pior (maior distância)
@@ -1468,7 +1548,8 @@ class BLFGA:
         2. **SELEÇÃO COM RESTRIÇÃO DE DISTÂNCIA**:
            - Itera pelos indivíduos em ordem de qualidade
            - Aceita indivíduo apenas se estiver suficientemente distante
-           - Distância medida por hamming_dist entre strings
+           - Distância de Hamming verificada em lote contra os aceitos, com
+             índice por blocos para descartar pares obviamente distantes
            - Threshold controlado por niching_radius
 
         3. **PREENCHIMENTO ADAPTATIVO**:
@@ -1508,35 +1589,38 @@ class BLFGA:
             return pop
 
         # 1. ORDENAÇÃO POR FITNESS
-        # Cria lista de tuplas (indivíduo, fitness) para seleção eficiente
-        pop_with_fitness = [(ind, max_distance(ind, self.strings)) for ind in pop]
-        # Ordena do melhor (menor distância) para o pior (maior distância)
-        pop_with_fitness.sort(key=lambda x: x[1])
+        # Ordena do melhor (menor distância) para o pior (maior distância);
+        # a ordenação estável mantém a ordem original entre empates
+        if isinstance(pop, EncodedPopulation):
+            matrix = pop.matrix
+            fitness = pop.evaluate()
+        else:
+            matrix = self.codec.encode(pop)
+            fitness = np.array([self._fitness(ind) for ind in pop], dtype=np.int64)
+        order = np.argsort(fitness, kind="stable")
 
         # 2. SELEÇÃO COM RESTRIÇÃO DE DISTÂNCIA
-        niched_pop = []
-
-        for ind, fitness in pop_with_fitness:
-            # Verifica distância para todos os indivíduos já aceitos
-            too_close = False
-            for accepted_ind in niched_pop:
-                # Calcula distância de Hamming entre strings
-                if hamming_dist(ind, accepted_ind) < self.niching_radius:
-                    too_close = True
-                    break
-
-            # CRITÉRIO DE ACEITAÇÃO:
-            # - Aceita se distante o suficiente de todos os aceitos
-            # - OU se população ainda está pequena (relaxa restrições)
-            if not too_close or len(niched_pop) < self.pop_size // 2:
-                niched_pop.append(ind)
-
-            # CONTROLE DE TAMANHO: Para quando tiver indivíduos suficientes
-            if len(niched_pop) >= self.pop_size:
-                break
+        # Aceita se distante o suficiente de todos os aceitos, ou enquanto a
+        # população ainda está pequena (relaxa restrições); a busca dos
+        # vizinhos usa um índice por blocos sobre a matriz codificada
+        accepted = array_ops.niche_select(
+            matrix, order, self.niching_radius, self.pop_size // 2, self.pop_size
+        )
 
         # 3. PREENCHIMENTO COM DIVERSIDADE ALEATÓRIA
         # Se niching removeu muitos indivíduos, adiciona diversidade aleatória
+        missing = self.pop_size - len(accepted)
+        if isinstance(pop, EncodedPopulation):
+            rows = array_ops.random_rows(missing, self.L, self.codec.k, self.np_rng)
+            return EncodedPopulation(
+                np.vstack([matrix[accepted], rows]),
+                self.codec,
+                np.concatenate(
+                    [fitness[accepted], np.full(missing, -1, dtype=np.int64)]
+                ),
+            )
+
+        niched_pop = [pop[i] for i in accepted]
         while len(niched_pop) < self.pop_size:
             # Gera string completamente aleatória
             rand_s = "".join(self.rng.choice(self.alphabet) for _ in range(self.L))
@@ -1602,22 +1686,27 @@ class BLFGA:
             a estrutura de blocos sincronizada com o progresso evolutivo.
         """
         # 1. ANÁLISE DE ENTROPIA POSICIONAL
-        # Inicializa array para armazenar entropia de cada posição
-        ent = np.zeros(self.L)
-
-        for pos in range(self.L):
-            # Coleta símbolos válidos na posição atual
-            # Filtra strings que são longas suficientes para ter essa posição
-            valid_chars = [ind[pos] for ind in pop if pos < len(ind)]
-
-            if valid_chars:  # Se temos pelo menos um caractere válido
-                # Conta frequência de cada símbolo
-                cnt = Counter(valid_chars)
-                # Calcula probabilidades normalizadas
-                probs = np.array(list(cnt.values())) / len(valid_chars)
-                # Calcula entropia: H = -Σ p * log₂(p)
-                # Usa logaritmo base 2 para entropia em bits
-                ent[pos] = -np.sum(probs * np.log2(probs))
+        if isinstance(pop, EncodedPopulation):
+            # Entropia de todas as posições a partir das contagens por coluna
+            counts = array_ops.column_counts(pop.matrix, len(self.codec.symbols))
+            ent = array_ops.position_entropy(counts)
+        else:
+            # Inicializa array para armazenar entropia de cada posição
+            ent = np.zeros(self.L)
+
+            for pos in range(self.L):
+                # Coleta símbolos válidos na posição atual
+                # Filtra strings que são longas suficientes para ter essa posição
+                valid_chars = [ind[pos] for ind in pop if pos < len(ind)]
+
+                if valid_chars:  # Se temos pelo menos um caractere válido
+                    # Conta frequência de cada símbolo
+                    cnt = Counter(valid_chars)
+                    # Calcula probabilidades normalizadas
+                    probs = np.array(list(cnt.values())) / len(valid_chars)
+                    # Calcula entropia: H = -Σ p * log₂(p)
+                    # Usa logaritmo base 2 para entropia em bits
+                    ent[pos] = -np.sum(probs * np.log2(probs))
 
         # 2. THRESHOLD ADAPTATIVO
         # Define limiar como 70% da entropia máxima observada
@@ -1701,7 +1790,7 @@ class BLFGA:
             logger.debug(
                 f"[PARALLEL-LOG] BLF-GA usando avaliação SEQUENCIAL (internal_workers={self.internal_workers})"
             )
-            return [(s, max_distance(s, self.strings)) for s in pop]
+            return [(s, self._fitness(s)) for s in pop]
 
         # Log temporário: paralelismo interno
         import threading
@@ -1715,7 +1804,7 @@ class BLFGA:
         # Encapsula lógica para uso com ThreadPoolExecutor
         def evaluate_string(s: str) -> tuple[str, int]:
             """Avalia fitness de uma única string."""
-            return (s, max_distance(s, self.strings))
+            return (s, self._fitness(s))
 
         # PARALELIZAÇÃO COM THREADPOOLEXECUTOR
         # Usa context manager para limpeza automática de recursos
@@ -1763,6 +1852,9 @@ class BLFGA:
             Esta função é equivalente a sorted(pop, key=fitness) mas
             aproveitando paralelização e cache de avaliações.
         """
+        if isinstance(pop, EncodedPopulation):
+            return pop.sorted()
+
         # 1. AVALIAÇÃO PARALELA
         # Obtém lista de tuplas (string, fitness) ordenadas
         evaluated = self._evaluate_population_parallel(pop)
@@ -1771,3 +1863,155 @@ class BLFGA:
         # Extrai apenas as strings da lista ordenada
         # [s for s, _ in evaluated] usa list comprehension para eficiência
         return [s for s, _ in evaluated]
+
+    # =========================================================================
+    # MOTOR DE POPULAÇÃO EM MATRIZ (population_engine="array")
+    # =========================================================================
+
+    @property
+    def codec(self) -> PopulationCodec:
+        """Esquema de codificação da população em matriz (criado sob demanda)."""
+        if self._codec is None:
+            self._codec = PopulationCodec(self.alphabet, self.strings)
+            self._codec.fitness_cache = self.fitness_cache
+        return self._codec
+
+    def _init_population_array(self) -> EncodedPopulation:
+        """
+        Versão em matriz de ``_init_population``.
+
+        Mesma composição (consenso, ~1/3 de variações por blocos copiados de
+        strings de entrada e o restante aleatório), gerada em lote.
+        """
+        codec = self.codec
+        targets = codec.targets
+        counts = array_ops.column_counts(targets, len(codec.symbols))
+        consensus = counts.argmax(axis=1).astype(np.uint8)
+
+        n_var = self.pop_size // 3
+        variations = np.tile(consensus, (n_var, 1))
+        if n_var and self.blocks:
+            # Para cada (variação, bloco): 50% de chance de copiar de uma entrada
+            copy = self.np_rng.random((n_var, len(self.blocks))) < 0.5
+            sources = self.np_rng.integers(0, self.n, size=(n_var, len(self.blocks)))
+            for b, (l, r) in enumerate(self.blocks):
+                rows = np.flatnonzero(copy[:, b])
+                variations[rows, l:r] = targets[sources[rows, b], l:r]
+
+        n_random = max(0, self.pop_size - 1 - n_var)
+        matrix = np.vstack(
+            [
+                consensus[None, :],
+                variations,
+                array_ops.random_rows(n_random, self.L, codec.k, self.np_rng),
+            ]
+        )
+        return EncodedPopulation(matrix, codec)
+
+    def _next_generation_array(self, pop: EncodedPopulation) -> EncodedPopulation:
+        """
+        Versão em matriz de ``_next_generation``.
+
+        Seleção, crossover e mutação são aplicados a todos os pares da
+        geração de uma só vez; os filhos são intercalados (c1, c2, c1, ...)
+        como na versão em string.
+        """
+        pop_sorted = pop.sorted()
+        fitness = pop_sorted.fitness
+
+        elite_n = min(max(1, int(self.elite_rate * self.pop_size)), self.pop_size)
+        n_children = self.pop_size - elite_n
+        n_pairs = (n_children + 1) // 2
+
+        k = self.tournament_k if self.tournament_k is not None else 2
+        parents1 = pop_sorted.matrix[
+            array_ops.tournament_indices(fitness, k, n_pairs, self.np_rng)
+        ]
+        parents2 = pop_sorted.matrix[
+            array_ops.tournament_indices(fitness, k, n_pairs, self.np_rng)
+        ]
+
+        crossing = self.np_rng.random(n_pairs) < self.cross_prob
+        if self.crossover_type == "one_point":
+            c1, c2 = array_ops.crossover_one_point_batch(
+                parents1, parents2, crossing, self.np_rng
+            )
+        elif self.crossover_type == "uniform":
+            c1, c2 = array_ops.crossover_uniform_batch(
+                parents1, parents2, crossing, self.np_rng
+            )
+        elif self.crossover_type == "blend_blocks":
+            c1, c2 = array_ops.crossover_blend_blocks_batch(
+                parents1, parents2, self.blocks, crossing, self.np_rng
+            )
+        else:
+            c1, c2 = parents1, parents2
+
+        children = np.empty((2 * n_pairs, self.L), dtype=np.uint8)
+        children[0::2] = c1
+        children[1::2] = c2
+        children = self._apply_mutation_array(children[:n_children])
+
+        matrix = np.vstack([pop_sorted.matrix[:elite_n], children])
+        new_fitness = np.concatenate(
+            [fitness[:elite_n], np.full(n_children, -1, dtype=np.int64)]
+        )
+        new_pop = EncodedPopulation(matrix, self.codec, new_fitness)
+
+        if self.niching:
+            new_pop = self._apply_niching(new_pop)
+
+        return new_pop
+
+    def _apply_mutation_array(self, matrix: np.ndarray) -> np.ndarray:
+        """Versão em lote de ``_apply_mutation``."""
+        if self.mutation_type == "multi":
+            return array_ops.mutate_multi_batch(
+                matrix, self.codec.k, self.mutation_multi_n, self.np_rng
+            )
+        elif self.mutation_type == "inversion":
+            return array_ops.mutate_inversion_batch(matrix, self.np_rng)
+        elif self.mutation_type == "transposition":
+            return array_ops.mutate_transposition_batch(matrix, self.np_rng)
+        else:
+            return matrix
+
+    def _new_fitness_cache(self) -> FitnessCache:
+        """Cria o cache de fitness da execução."""
+        return FitnessCache(
+            lambda ind: max_distance(ind, self.strings), self.fitness_cache_size
+        )
+
+    def _fitness(self, ind: String) -> int:
+        """Distância máxima de um indivíduo, consultando o cache da execução."""
+        return self.fitness_cache(ind)
+
+    def _best_individual(self, pop) -> tuple[String, int]:
+        """Retorna o melhor indivíduo da população e sua distância máxima."""
+        if isinstance(pop, EncodedPopulation):
+            fitness = pop.evaluate()
+            index = int(np.argmin(fitness))
+            return pop[index], int(fitness[index])
+
+        best = min(pop, key=lambda s: self._fitness(s))
+        return best, self._fitness(best)
+
+    def _replace_tail_random(self, pop, count: int) -> None:
+        """Substitui os ``count`` últimos indivíduos por strings aleatórias."""
+        if isinstance(pop, EncodedPopulation):
+            pop.replace_tail(
+                array_ops.random_rows(count, self.L, self.codec.k, self.np_rng)
+            )
+            return
+
+        for i in range(count):
+            pop[-(i + 1)] = "".join(
+                self.rng.choice(self.alphabet) for _ in range(self.L)
+            )
+
+    def _population_diversity(self, pop) -> float:
+        """Distância de Hamming média entre pares de indivíduos."""
+        if isinstance(pop, EncodedPopulation):
+            counts = array_ops.column_counts(pop.matrix, len(self.codec.symbols))
+            return array_ops.mean_pairwise_hamming(counts, len(pop))
+        return genetic_ops.mean_hamming_distance(pop)
@@ -0,0 +1,290 @@
+"""
+Modelo de Ilhas para o BLF-GA
+
+Executa N populações BLF-GA independentes em processos separados, com
+migração periódica dos melhores indivíduos entre ilhas vizinhas. Cada ilha é
+um ``BLFGA`` completo (mecanismos adaptativos, refinamento, restart) com seed
+própria; a cada ``migration_interval`` gerações ela envia seus
+``migration_size`` melhores indivíduos às ilhas de destino da topologia e
+recebe os migrantes que já chegaram, que substituem seus piores indivíduos.
+
+A migração é assíncrona (uma fila de entrada por ilha): nenhuma ilha espera
+pelas outras, então ilhas mais rápidas não ficam bloqueadas. Quando uma ilha
+encontra a solução ótima (distância 0), as demais encerram na próxima
+geração.
+
+Classes:
+    IslandModel: Coordena os processos das ilhas e combina os resultados.
+"""
+
+import multiprocessing as mp
+import queue
+import time
+from collections.abc import Callable
+from typing import Any, Optional
+
+from .fitness_cache import FitnessCache
+from .implementation import BLFGA
+
+String = str
+
+TOPOLOGIES = ("ring", "fully_connected", "star")
+
+# Intervalo (s) entre verificações dos processos enquanto aguarda resultados
+_POLL_INTERVAL = 0.5
+
+
+def migration_targets(topology: str, n_islands: int) -> list[list[int]]:
+    """
+    Ilhas de destino dos migrantes de cada ilha.
+
+    Args:
+        topology: ring (i -> i+1), fully_connected (i -> todas) ou star
+            (ilha 0 <-> demais)
+        n_islands: Número de ilhas
+
+    Returns:
+        list[list[int]]: Destinos de cada ilha
+
+    Raises:
+        ValueError: Se a topologia for desconhecida
+    """
+    if topology not in TOPOLOGIES:
+        raise ValueError(
+            f"Topologia de ilhas inválida: {topology} (use {', '.join(TOPOLOGIES)})"
+        )
+    if n_islands < 2:
+        return [[] for _ in range(n_islands)]
+    if topology == "ring":
+        return [[(i + 1) % n_islands] for i in range(n_islands)]
+    if topology == "fully_connected":
+        return [[j for j in range(n_islands) if j != i] for i in range(n_islands)]
+    return [list(range(1, n_islands))] + [[0] for _ in range(1, n_islands)]
+
+
+def _island_worker(
+    index: int,
+    strings: list[String],
+    alphabet: str,
+    params: dict[str, Any],
+    inboxes: list,
+    targets: list[int],
+    migration_interval: int,
+    migration_size: int,
+    stop_event,
+    results,
+) -> None:
+    """Executa uma ilha e publica o resultado na fila ``results``."""
+    # Migrantes não entregues podem ser descartados ao encerrar
+    for inbox in inboxes:
+        inbox.cancel_join_thread()
+
+    sent = received = 0
+
+    def migrate(gen: int, pop) -> Optional[list[String]]:
+        nonlocal sent, received
+        if stop_event.is_set():
+            return None
+        if gen % migration_interval:
+            return []
+
+        migrants = [pop[i] for i in range(min(migration_size, len(pop)))]
+        for target in targets:
+            inboxes[target].put(migrants)
+            sent += len(migrants)
+
+        immigrants: list[String] = []
+        while True:
+            try:
+                immigrants.extend(inboxes[index].get_nowait())
+            except queue.Empty:
+                break
+        received += len(immigrants)
+        return immigrants
+
+    try:
+        ga = BLFGA(strings, alphabet, **params)
+        ga.set_migration_callback(migrate)
+        best, best_val, history = ga.run()
+        if best_val == 0:
+            stop_event.set()
+        results.put(
+            {
+                "island": index,
+                "best": best,
+                "best_val": best_val,
+                "history": history,
+                "fitness_cache": ga.fitness_cache.stats(),
+                "migrants_sent": sent,
+                "migrants_received": received,
+            }
+        )
+    except Exception as e:  # pylint: disable=broad-except
+        stop_event.set()
+        results.put({"island": index, "error": f"{type(e).__name__}: {e}"})
+
+
+class IslandModel:
+    """
+    BLF-GA com populações independentes em processos e migração de elites.
+
+    Attributes:
+        n_islands: Número de ilhas (processos)
+        topology: Topologia de migração
+        migration_interval: Gerações entre migrações
+        migration_size: Elites enviados por ilha a cada migração
+        island_results: Resultado de cada ilha após ``run``
+    """
+
+    def __init__(
+        self,
+        strings: list[String],
+        alphabet: str,
+        params: dict[str, Any],
+        n_islands: int,
+        topology: str = "ring",
+        migration_interval: int = 10,
+        migration_size: int = 2,
+    ):
+        """
+        Inicializa o modelo de ilhas.
+
+        Args:
+            strings: Strings de entrada
+            alphabet: Alfabeto
+            params: Parâmetros do BLF-GA usados em cada ilha
+            n_islands: Número de ilhas
+            topology: ring, fully_connected ou star
+            migration_interval: Gerações entre migrações
+            migration_size: Elites enviados por ilha a cada migração
+        """
+        self.strings = list(strings)
+        self.alphabet = alphabet
+        self.params = dict(params)
+        self.n_islands = max(1, int(n_islands))
+        self.topology = topology
+        self.targets = migration_targets(topology, self.n_islands)
+        self.migration_interval = max(1, int(migration_interval))
+        self.migration_size = max(0, int(migration_size))
+        self.island_results: list[dict[str, Any]] = []
+        self.progress_callback: Callable[[str], None] | None = None
+
+    def set_progress_callback(self, callback: Callable[[str], None]) -> None:
+        """Define o callback de progresso (chamado no processo principal)."""
+        self.progress_callback = callback
+
+    def _island_params(self, index: int) -> dict[str, Any]:
+        """Parâmetros de uma ilha: seed distinta por ilha quando há seed."""
+        params = dict(self.params)
+        if params.get("seed") is not None:
+            params["seed"] = params["seed"] + index
+        return params
+
+    def run(self) -> tuple[String, int, list]:
+        """
+        Executa todas as ilhas e combina os resultados.
+
+        Returns:
+            tuple[String, int, list]: (melhor_string, distância_máxima,
+                histórico), onde o histórico é o melhor fitness entre as ilhas
+                em cada geração
+
+        Raises:
+            RuntimeError: Se alguma ilha falhar
+        """
+        ctx = mp.get_context()
+        inboxes = [ctx.Queue() for _ in range(self.n_islands)]
+        results = ctx.Queue()
+        stop_event = ctx.Event()
+
+        processes = [
+            ctx.Process(
+                target=_island_worker,
+                args=(
+                    i,
+                    self.strings,
+                    self.alphabet,
+                    self._island_params(i),
+                    inboxes,
+                    self.targets[i],
+                    self.migration_interval,
+                    self.migration_size,
+                    stop_event,
+                    results,
+                ),
+                name=f"blfga-island-{i}",
+                daemon=True,
+            )
+            for i in range(self.n_islands)
+        ]
+
+        collected: dict[int, dict[str, Any]] = {}
+        try:
+            for process in processes:
+                process.start()
+
+            while len(collected) < self.n_islands:
+                try:
+                    result = results.get(timeout=_POLL_INTERVAL)
+                except queue.Empty:
+                    if not any(p.is_alive() for p in processes) and results.empty():
+                        raise RuntimeError(
+                            "Ilhas do BLF-GA encerraram sem publicar resultado"
+                        ) from None
+                    continue
+
+                if "error" in result:
+                    raise RuntimeError(
+                        f"Ilha {result['island']} falhou: {result['error']}"
+                    )
+                collected[result["island"]] = result
+                if self.progress_callback:
+                    self.progress_callback(
+                        f"Ilhas concluídas {len(collected)}/{self.n_islands}, "
+                        f"melhor={min(r['best_val'] for r in collected.values())}"
+                    )
+        finally:
+            stop_event.set()
+            deadline = time.time() + 5.0
+            for process in processes:
+                if process.pid is None:
+                    continue
+                process.join(max(0.0, deadline - time.time()))
+                if process.is_alive():
+                    process.terminate()
+                    process.join()
+            for q in [*inboxes, results]:
+                q.close()
+
+        self.island_results = [collected[i] for i in range(self.n_islands)]
+        best_result = min(self.island_results, key=lambda r: r["best_val"])
+        return best_result["best"], best_result["best_val"], self._merged_history()
+
+    def _merged_history(self) -> list[int]:
+        """Melhor fitness entre as ilhas em cada geração."""
+        histories = [r["history"] for r in self.island_results if r["history"]]
+        if not histories:
+            return []
+        length = max(len(h) for h in histories)
+        return [min(h[min(g, len(h) - 1)] for h in histories) for g in range(length)]
+
+    def fitness_cache_stats(self) -> dict:
+        """Contadores do cache de fitness somados entre as ilhas."""
+        return FitnessCache.combine_stats(
+            [r["fitness_cache"] for r in self.island_results]
+        )
+
+    def summary(self) -> dict[str, Any]:
+        """Resumo da execução para os metadados."""
+        return {
+            "count": self.n_islands,
+            "topology": self.topology,
+            "migration_interval": self.migration_interval,
+            "migration_size": self.migration_size,
+            "best_fitness_per_island": [r["best_val"] for r in self.island_results],
+            "generations_per_island": [len(r["history"]) for r in self.island_results],
+            "migrants_sent": sum(r["migrants_sent"] for r in self.island_results),
+            "migrants_received": sum(
+                r["migrants_received"] for r in self.island_results
+            ),
+        }
@@ -0,0 +1,446 @@
+"""
+Operações Genéticas Vetorizadas para BLF-GA
+
+Representação alternativa da população como matriz ``uint8`` (pop_size x L),
+usada quando ``population_engine="array"``. Cada operador processa todos os
+indivíduos de uma geração em lote com NumPy, evitando a conversão
+string -> lista -> string por indivíduo dos operadores de ``genetic_ops``.
+
+CODIFICAÇÃO:
+===========
+Os símbolos recebem códigos pela ordem do alfabeto do algoritmo; caracteres
+das strings de entrada fora do alfabeto recebem os códigos seguintes. Os
+operadores aleatórios (imigrantes, mutação) sorteiam apenas entre os códigos
+do alfabeto, como as versões em string.
+
+FITNESS:
+=======
+A distância máxima de cada indivíduo é calculada contra a matriz codificada
+das strings de entrada, uma string de referência por vez, com custo de
+memória O(pop_size·L).
+"""
+
+from typing import Optional, Sequence, Union
+
+import numpy as np
+
+String = str
+
+
+class PopulationCodec:
+    """
+    Esquema de codificação compartilhado entre população e strings de entrada.
+
+    Attributes:
+        symbols: Símbolos na ordem dos códigos
+        k: Número de símbolos do alfabeto (códigos sorteáveis)
+        L: Comprimento das strings
+        targets: Strings de entrada codificadas (n x L)
+        fitness_cache: Cache de fitness opcional consultado em ``evaluate``
+    """
+
+    def __init__(self, alphabet: str, strings: Sequence[String]):
+        """
+        Inicializa o esquema de codificação.
+
+        Args:
+            alphabet: Alfabeto do algoritmo
+            strings: Strings de entrada
+        """
+        symbols = list(dict.fromkeys(alphabet))
+        self.k = len(symbols)
+        extra = sorted(set("".join(strings)) - set(symbols))
+        symbols.extend(extra)
+        if len(symbols) > 256:
+            raise ValueError("population_engine='array' suporta até 256 símbolos")
+
+        self.symbols = "".join(symbols)
+        self.L = len(strings[0])
+        self._table = {ord(c): code for code, c in enumerate(self.symbols)}
+        self._latin1 = all(ord(c) < 256 for c in self.symbols)
+        if self._latin1:
+            self._lut = np.array([ord(c) for c in self.symbols], dtype=np.uint8)
+        else:
+            self._lut = np.array(list(self.symbols), dtype="<U1")
+        self.targets = self.encode(strings)
+        self.fitness_cache = None
+
+    def encode(self, strings: Sequence[String]) -> np.ndarray:
+        """Codifica strings de comprimento L em uma matriz (len x L)."""
+        strings = list(strings)
+        if not strings:
+            return np.empty((0, self.L), dtype=np.uint8)
+        raw = "".join(strings).translate(self._table)
+        codes = np.frombuffer(raw.encode("latin-1"), dtype=np.uint8)
+        return codes.reshape(len(strings), self.L).copy()
+
+    def decode(self, row: np.ndarray) -> String:
+        """Decodifica um vetor de códigos para string."""
+        if self._latin1:
+            return self._lut[row].tobytes().decode("latin-1")
+        return "".join(self._lut[row].tolist())
+
+    def decode_many(self, matrix: np.ndarray) -> list[String]:
+        """Decodifica todas as linhas de uma matriz."""
+        return [self.decode(row) for row in matrix]
+
+
+class EncodedPopulation:
+    """
+    População codificada com fitness em cache por linha.
+
+    Indexação por inteiro ou fatia devolve strings e aceita atribuição de
+    strings, de modo que o laço principal do BLF-GA opera sobre esta classe
+    da mesma forma que sobre a lista de strings.
+
+    Attributes:
+        matrix: Indivíduos codificados (pop_size x L, uint8)
+        codec: Esquema de codificação
+        fitness: Distância máxima por linha (-1 = não avaliado)
+    """
+
+    def __init__(
+        self,
+        matrix: np.ndarray,
+        codec: PopulationCodec,
+        fitness: Optional[np.ndarray] = None,
+    ):
+        self.matrix = matrix
+        self.codec = codec
+        if fitness is None:
+            fitness = np.full(len(matrix), -1, dtype=np.int64)
+        self.fitness = fitness
+
+    def __len__(self) -> int:
+        return len(self.matrix)
+
+    def __iter__(self):
+        return iter(self.codec.decode_many(self.matrix))
+
+    def __getitem__(self, index: Union[int, slice]):
+        if isinstance(index, slice):
+            return self.codec.decode_many(self.matrix[index])
+        return self.codec.decode(self.matrix[index])
+
+    def __setitem__(self, index: Union[int, slice], value) -> None:
+        if isinstance(index, slice):
+            self.matrix[index] = self.codec.encode(value)
+        else:
+            self.matrix[index] = self.codec.encode([value])[0]
+        self.fitness[index] = -1
+
+    def evaluate(self) -> np.ndarray:
+        """Avalia as linhas pendentes e retorna o vetor de fitness."""
+        pending = np.flatnonzero(self.fitness < 0)
+        if not len(pending):
+            return self.fitness
+
+        cache = self.codec.fitness_cache
+        if cache is None or not cache.max_size:
+            self.fitness[pending] = population_fitness(
+                self.matrix[pending], self.codec.targets
+            )
+            return self.fitness
+
+        # Consulta o cache (chave = bytes da linha, sem decodificar) e avalia
+        # em lote apenas os indivíduos inéditos
+        keys = [row.tobytes() for row in self.matrix[pending]]
+        missing = []
+        for pos, key in enumerate(keys):
+            value = cache.lookup(key)
+            if value is None:
+                missing.append(pos)
+            else:
+                self.fitness[pending[pos]] = value
+        if missing:
+            rows = pending[missing]
+            values = population_fitness(self.matrix[rows], self.codec.targets)
+            self.fitness[rows] = values
+            for pos, value in zip(missing, values):
+                cache.store(keys[pos], int(value))
+        return self.fitness
+
+    def sorted(self) -> "EncodedPopulation":
+        """Nova população ordenada por fitness (estável)."""
+        order = np.argsort(self.evaluate(), kind="stable")
+        return EncodedPopulation(self.matrix[order], self.codec, self.fitness[order])
+
+    def replace_tail(self, rows: np.ndarray) -> None:
+        """Substitui os últimos indivíduos (imigrantes, restart)."""
+        if len(rows):
+            self.matrix[-len(rows) :] = rows
+            self.fitness[-len(rows) :] = -1
+
+
+# =============================================================================
+# AVALIAÇÃO E ESTATÍSTICAS
+# =============================================================================
+
+
+def population_fitness(matrix: np.ndarray, targets: np.ndarray) -> np.ndarray:
+    """
+    Distância máxima de cada indivíduo para as strings de entrada.
+
+    Args:
+        matrix: Indivíduos codificados (m x L)
+        targets: Strings de entrada codificadas (n x L)
+
+    Returns:
+        np.ndarray: Vetor (m,) de distâncias máximas
+    """
+    result = np.zeros(len(matrix), dtype=np.int64)
+    for target in targets:
+        np.maximum(result, np.count_nonzero(matrix != target, axis=1), out=result)
+    return result
+
+
+def column_counts(matrix: np.ndarray, n_symbols: int) -> np.ndarray:
+    """Contagem de cada código por coluna (L x n_symbols)."""
+    counts = np.empty((matrix.shape[1], n_symbols), dtype=np.int64)
+    for code in range(n_symbols):
+        counts[:, code] = np.count_nonzero(matrix == code, axis=0)
+    return counts
+
+
+def mean_pairwise_hamming(counts: np.ndarray, pop_size: int) -> float:
+    """
+    Distância de Hamming média entre pares a partir das contagens por coluna.
+
+    Em cada coluna, os pares que concordam são Σ c·(c-1)/2; os demais
+    discordam. Equivale a ``genetic_ops.mean_hamming_distance`` em O(pop·L).
+    """
+    if pop_size < 2:
+        return 0.0
+    pairs = pop_size * (pop_size - 1) // 2
+    agreeing = (counts * (counts - 1) // 2).sum()
+    mismatches = pairs * counts.shape[0] - int(agreeing)
+    return mismatches / pairs
+
+
+def position_entropy(counts: np.ndarray) -> np.ndarray:
+    """Entropia (bits) de cada posição a partir das contagens por coluna."""
+    totals = counts.sum(axis=1, keepdims=True)
+    probs = counts / np.maximum(totals, 1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        terms = np.where(probs > 0, probs * np.log2(probs), 0.0)
+    return -terms.sum(axis=1)
+
+
+def random_rows(count: int, L: int, k: int, rng: np.random.Generator) -> np.ndarray:
+    """Gera ``count`` indivíduos aleatórios sobre os ``k`` primeiros códigos."""
+    return rng.integers(0, k, size=(count, L), dtype=np.uint8)
+
+
+# =============================================================================
+# SELEÇÃO
+# =============================================================================
+
+
+def tournament_indices(
+    fitness: np.ndarray, k: int, count: int, rng: np.random.Generator
+) -> np.ndarray:
+    """
+    Executa ``count`` torneios de tamanho ``k`` de uma vez.
+
+    Os competidores são sorteados com reposição; para os tamanhos de
+    população usuais a diferença para o torneio sem reposição de
+    ``genetic_ops`` é desprezível. Vence o de menor fitness (empate: o
+    primeiro sorteado).
+
+    Returns:
+        np.ndarray: Índices dos vencedores
+    """
+    k = max(1, k)
+    competitors = rng.integers(0, len(fitness), size=(count, k))
+    winners = np.argmin(fitness[competitors], axis=1)
+    return competitors[np.arange(count), winners]
+
+
+# =============================================================================
+# CROSSOVER
+# =============================================================================
+
+
+def _swap(a: np.ndarray, b: np.ndarray, mask: np.ndarray):
+    """Troca entre os pais as posições marcadas em ``mask``."""
+    return np.where(mask, b, a), np.where(mask, a, b)
+
+
+def crossover_one_point_batch(
+    a: np.ndarray, b: np.ndarray, active: np.ndarray, rng: np.random.Generator
+):
+    """Crossover de um ponto (corte em 1..L-1) para os pares ativos."""
+    m, L = a.shape
+    if L < 2:
+        return a.copy(), b.copy()
+    points = rng.integers(1, L, size=m)
+    mask = (np.arange(L)[None, :] >= points[:, None]) & active[:, None]
+    return _swap(a, b, mask)
+
+
+def crossover_uniform_batch(
+    a: np.ndarray, b: np.ndarray, active: np.ndarray, rng: np.random.Generator
+):
+    """Crossover uniforme (cada posição trocada com 50%) para os pares ativos."""
+    mask = (rng.random(a.shape) >= 0.5) & active[:, None]
+    return _swap(a, b, mask)
+
+
+def crossover_blend_blocks_batch(
+    a: np.ndarray,
+    b: np.ndarray,
+    blocks: list[tuple[int, int]],
+    active: np.ndarray,
+    rng: np.random.Generator,
+):
+    """Crossover por blocos (cada bloco trocado com 50%) para os pares ativos."""
+    m, L = a.shape
+    block_of = np.full(L, -1, dtype=np.int64)
+    for index, (start, end) in enumerate(blocks):
+        block_of[start:end] = index
+    swap_block = rng.random((m, len(blocks) + 1)) < 0.5
+    swap_block[:, -1] = False  # posições fora de qualquer bloco não trocam
+    mask = swap_block[:, block_of] & active[:, None]
+    return _swap(a, b, mask)
+
+
+# =============================================================================
+# MUTAÇÃO
+# =============================================================================
+
+
+def mutate_multi_batch(
+    matrix: np.ndarray, k: int, n: int, rng: np.random.Generator
+) -> np.ndarray:
+    """
+    Mutação multi-ponto em todas as linhas.
+
+    Aplica ``n`` mutações sucessivas por indivíduo; cada uma troca uma
+    posição aleatória por um símbolo diferente do atual.
+    """
+    result = matrix.copy()
+    m, L = result.shape
+    if k < 2 or m == 0:
+        return result
+    rows = np.arange(m)
+    for _ in range(n):
+        pos = rng.integers(0, L, size=m)
+        old = result[rows, pos].astype(np.int64)
+        shift = rng.integers(1, k, size=m)
+        # Códigos fora do alfabeto (só em strings de entrada) viram qualquer símbolo
+        new = np.where(old < k, (old + shift) % k, shift - 1)
+        result[rows, pos] = new
+    return result
+
+
+def _segments(m: int, L: int, rng: np.random.Generator):
+    """Sorteia pares de posições distintas a < b por linha."""
+    a = rng.integers(0, L, size=m)
+    b = rng.integers(0, L - 1, size=m)
+    b = np.where(b >= a, b + 1, b)
+    return np.minimum(a, b), np.maximum(a, b)
+
+
+def mutate_inversion_batch(matrix: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """Inverte um segmento aleatório [a, b] de cada linha."""
+    m, L = matrix.shape
+    if L < 2 or m == 0:
+        return matrix.copy()
+    a, b = _segments(m, L, rng)
+    cols = np.arange(L)[None, :]
+    inside = (cols >= a[:, None]) & (cols <= b[:, None])
+    index = np.where(inside, a[:, None] + b[:, None] - cols, cols)
+    return np.take_along_axis(matrix, index, axis=1)
+
+
+def mutate_transposition_batch(
+    matrix: np.ndarray, rng: np.random.Generator
+) -> np.ndarray:
+    """Move um segmento aleatório [a, b] de cada linha para nova posição."""
+    m, L = matrix.shape
+    if L < 2 or m == 0:
+        return matrix.copy()
+    a, b = _segments(m, L, rng)
+    seg = b - a + 1
+    # Posição de inserção no restante (comprimento L - seg), inclusive o fim
+    pos = np.floor(rng.random(m) * (L - seg + 1)).astype(np.int64)
+
+    cols = np.arange(L)[None, :]
+    a, seg, pos = a[:, None], seg[:, None], pos[:, None]
+    # Índice no restante -> índice original (pula o segmento removido)
+    before = cols
+    after = cols - seg
+    rest_index = np.where(cols < pos, before, after)
+    rest_index = np.where(rest_index < a, rest_index, rest_index + seg)
+    index = np.where((cols >= pos) & (cols < pos + seg), a + (cols - pos), rest_index)
+    return np.take_along_axis(matrix, index, axis=1)
+
+
+# =============================================================================
+# NICHING
+# =============================================================================
+
+# Comprimento mínimo de bloco para o índice por assinaturas compensar
+_NICHE_MIN_BLOCK_LEN = 4
+
+
+def niche_select(
+    matrix: np.ndarray,
+    order: Sequence[int],
+    radius: int,
+    min_accept: int,
+    max_accept: int,
+) -> list[int]:
+    """
+    Seleção gulosa por nichos sobre a matriz codificada.
+
+    Percorre as linhas na ordem dada e aceita cada uma se estiver a distância
+    >= ``radius`` de todas as já aceitas, ou se ainda houver menos de
+    ``min_accept`` aceitas; para ao atingir ``max_accept``. Mesma semântica
+    da versão em strings de ``BLFGA._apply_niching``.
+
+    As linhas aceitas são indexadas por assinatura de ``radius`` blocos: duas
+    strings a distância < radius coincidem em pelo menos um bloco
+    (pigeonhole), então só as aceitas que compartilham algum bloco com o
+    candidato precisam ter a distância calculada. Com blocos curtos demais
+    (raio grande em relação a L) quase todos os pares colidem, e o candidato
+    é comparado em lote com todas as aceitas.
+
+    Returns:
+        list[int]: Índices das linhas aceitas, na ordem de aceitação
+    """
+    L = matrix.shape[1]
+    accepted: list[int] = []
+    n_blocks = min(max(int(radius), 1), max(L, 1))
+    use_index = L // n_blocks >= _NICHE_MIN_BLOCK_LEN
+    bounds = np.linspace(0, L, n_blocks + 1).astype(np.int64)
+    blocks = list(zip(bounds[:-1], bounds[1:])) if use_index else []
+    index: list[dict[bytes, list[int]]] = [{} for _ in blocks]
+
+    for i in order:
+        row = matrix[i]
+        keys = [row[start:end].tobytes() for start, end in blocks]
+        if accepted and len(accepted) >= min_accept and radius > 0:
+            if radius > L:
+                # Toda distância é <= L < radius
+                continue
+            if use_index:
+                near = set()
+                for bucket, key in zip(index, keys):
+                    near.update(bucket.get(key, ()))
+                rows = np.fromiter(near, dtype=np.int64, count=len(near))
+            else:
+                rows = np.asarray(accepted, dtype=np.int64)
+            if (
+                len(rows)
+                and (np.count_nonzero(matrix[rows] != row, axis=1) < radius).any()
+            ):
+                continue
+
+        accepted.append(int(i))
+        for bucket, key in zip(index, keys):
+            bucket.setdefault(key, []).append(int(i))
+        if len(accepted) >= max_accept:
+            break
+
+    return accepted
@@ -75,7 +75,7 @@ LIMITAÇÕES:
 
 DEPENDÊNCIAS:
 ============
-- numpy: Para cálculos matriciais eficientes
+- src.domain.metrics: Distância de Hamming média por contagem de colunas
 - random: Para operações estocásticas
 - src.utils.distance: Para cálculo de distâncias entre strings
 
@@ -87,7 +87,7 @@ TIPOS UTILIZADOS:
 
 import random
 
-import numpy as np
+from src.domain.metrics import mean_pairwise_hamming
 
 String = str
 Population = list[String]
@@ -98,7 +98,9 @@ Population = list[String]
 # =============================================================================
 
 
-def mean_hamming_distance(pop: Population) -> float:
+def mean_hamming_distance(
+    pop: Population, sample_size: int | None = None, seed: int | None = None
+) -> float:
     """
     Calcula a distância de Hamming média entre todos os pares de indivíduos na população.
 
@@ -108,12 +110,18 @@ def mean_hamming_distance(pop: Population) -> float:
     do espaço de busca, enquanto baixa diversidade pode indicar convergência prematura.
 
     ESTRATÉGIA ALGORÍTMICA:
-    - Usa broadcasting NumPy para calcular eficientemente todas as distâncias par a par
-    - Considera apenas o triângulo superior da matriz de distâncias (evita duplicação)
-    - Complexidade: O(n²·m) onde n é o tamanho da população e m o comprimento das strings
+    - Conta os símbolos de cada coluna: os pares que concordam em uma posição são
+      Σ c·(c-1)/2, e os demais pares discordam nela
+    - Soma as discordâncias de todas as colunas e divide pelo número de pares
+    - Complexidade: O(n·m) onde n é o tamanho da população e m o comprimento das
+      strings, sem a matriz temporária n x n x m da comparação par a par
+    - Com ``sample_size``, estima a média a partir de uma amostra aleatória
 
     Args:
         pop (Population): Lista de indivíduos (strings) da população
+        sample_size (int | None): Tamanho da amostra para populações muito grandes
+            (None = cálculo exato)
+        seed (int | None): Semente da amostragem
 
     Returns:
         float: Distância de Hamming média entre todos os pares.
@@ -133,20 +141,7 @@ def mean_hamming_distance(pop: Population) -> float:
         - Útil para monitorar a convergência do algoritmo genético
         - Valores próximos de 0 indicam população convergida
     """
-    if len(pop) < 2:
-        return 0.0
-
-    # Converte strings para matriz NumPy para processamento eficiente
-    arr = np.array([list(ind) for ind in pop])
-
-    # Calcula distâncias par a par usando broadcasting
-    # arr[:, None, :] cria uma dimensão extra para comparação elemento a elemento
-    dists = np.sum(arr[:, None, :] != arr[None, :, :], axis=2)
-
-    # Pega apenas o triângulo superior (evita contar cada par duas vezes)
-    iu = np.triu_indices(len(pop), 1)
-
-    return np.mean(dists[iu])
+    return mean_pairwise_hamming(pop, sample_size, seed)
 
 
 # =============================================================================
@@ -514,7 +509,7 @@ def refine_greedy(ind: String, strings: list[String]) -> String:
         - Complexidade O(k * n * |Σ|) onde k é número de iterações, n é comprimento, |Σ| é tamanho do alfabeto
         - Muito eficaz para refinamento final de soluções
     """
-    from src.domain.metrics import max_distance
+    from src.domain.metrics import IncrementalEvaluator
 
     # Extrai alfabeto das strings de referência
     alphabet = set()
@@ -522,26 +517,26 @@ def refine_greedy(ind: String, strings: list[String]) -> String:
         alphabet.update(s)
     alphabet = sorted(alphabet)
 
-    best_ind = ind
-    best_fitness = max_distance(best_ind, strings)
+    # Avaliador incremental: cada teste custa O(n) em vez de O(n * L)
+    evaluator = IncrementalEvaluator(ind, strings)
+    # Cópia local do centro: evaluator.center reconstrói a string inteira
+    center = list(ind)
+    best_fitness = evaluator.fitness
     improved = True
 
     # Continua até não haver melhoria
     while improved:
         improved = False
-        current = list(best_ind)
 
         # Tenta melhorar cada posição
-        for pos in range(len(current)):
-            original_char = current[pos]
+        for pos in range(len(ind)):
+            original_char = center[pos]
             best_char = original_char
 
             # Testa cada símbolo do alfabeto
             for char in alphabet:
                 if char != original_char:
-                    current[pos] = char
-                    test_ind = "".join(current)
-                    test_fitness = max_distance(test_ind, strings)
+                    test_fitness = evaluator.score(pos, char)
 
                     # Se encontrou melhoria, atualiza
                     if test_fitness < best_fitness:
@@ -550,11 +545,12 @@ def refine_greedy(ind: String, strings: list[String]) -> String:
                         improved = True
 
             # Aplica a melhor mudança encontrada
-            current[pos] = best_char
+            if best_char != original_char:
+                evaluator.apply(pos, best_char)
+                evaluator.commit()
+                center[pos] = best_char
 
-        best_ind = "".join(current)
-
-    return best_ind
+    return "".join(center)
 
 
 def refine_swap(ind: String, strings: list[String]) -> String:
@@ -593,30 +589,28 @@ def refine_swap(ind: String, strings: list[String]) -> String:
         - Útil quando a ordem dos símbolos importa mais que sua identidade
         - Pode ser combinado com outros operadores de refinamento
     """
-    from src.domain.metrics import max_distance
+    from src.domain.metrics import IncrementalEvaluator
 
-    best_ind = ind
-    best_fitness = max_distance(best_ind, strings)
-    current = list(best_ind)
+    evaluator = IncrementalEvaluator(ind, strings)
+    best_fitness = evaluator.fitness
+    current = list(ind)
     L = len(current)
 
     # Tenta todas as trocas de pares
     for i in range(L):
         for j in range(i + 1, L):
-            # Troca posições i e j
-            current[i], current[j] = current[j], current[i]
-            test_ind = "".join(current)
-            test_fitness = max_distance(test_ind, strings)
+            # Avalia a troca das posições i e j sem reconstruir a string
+            swap = [(i, current[j]), (j, current[i])]
+            test_fitness = evaluator.score_changes(swap)
 
             # Se melhorou, mantém a troca
             if test_fitness < best_fitness:
                 best_fitness = test_fitness
-                best_ind = test_ind
-            else:
-                # Desfaz a troca se não melhorou
+                evaluator.apply_changes(swap)
+                evaluator.commit()
                 current[i], current[j] = current[j], current[i]
 
-    return best_ind
+    return evaluator.center
 
 
 def refine_insertion(ind: String, strings: list[String]) -> String:
@@ -725,11 +719,11 @@ def refine_2opt(ind: String, strings: list[String]) -> String:
         - Útil para reorganizar estruturas invertidas
         - Pode encontrar soluções que outras buscas locais não conseguem
     """
-    from src.domain.metrics import max_distance
+    from src.domain.metrics import IncrementalEvaluator
 
-    best_ind = ind
-    best_fitness = max_distance(best_ind, strings)
-    current = list(best_ind)
+    evaluator = IncrementalEvaluator(ind, strings)
+    best_fitness = evaluator.fitness
+    current = list(ind)
     L = len(current)
     improved = True
 
@@ -740,16 +734,20 @@ def refine_2opt(ind: String, strings: list[String]) -> String:
         # Tenta inversões de segmentos
         for i in range(L):
             for j in range(i + 2, L + 1):  # Segmento de pelo menos 2 caracteres
-                # Inverte segmento de i a j-1
-                new_current = current[:i] + current[i:j][::-1] + current[j:]
-                test_ind = "".join(new_current)
-                test_fitness = max_distance(test_ind, strings)
+                # Inverte segmento de i a j-1 (apenas as posições alteradas)
+                reversal = [
+                    (k, current[i + j - 1 - k])
+                    for k in range(i, j)
+                    if current[k] != current[i + j - 1 - k]
+                ]
+                test_fitness = evaluator.score_changes(reversal)
 
                 # Se melhorou, atualiza e marca melhoria
                 if test_fitness < best_fitness:
                     best_fitness = test_fitness
-                    best_ind = test_ind
-                    current = new_current
+                    evaluator.apply_changes(reversal)
+                    evaluator.commit()
+                    current[i:j] = current[i:j][::-1]
                     improved = True
                     break
 
@@ -757,4 +755,4 @@ def refine_2opt(ind: String, strings: list[String]) -> String:
             if improved:
                 break
 
-    return best_ind
+    return evaluator.center
@@ -30,6 +30,7 @@ class CSCAlgorithm(CSPAlgorithm):
     default_params = CSC_DEFAULTS
     supports_internal_parallel = False  # CSC não suporta paralelismo interno
     is_deterministic = True  # CSC é determinístico
+    relative_cost = 5.0  # Clustering + recombinação + busca local
 
     def __init__(self, strings: list[str], alphabet: str, **params):
         """
@@ -62,8 +63,15 @@ class CSCAlgorithm(CSPAlgorithm):
             f"Iniciando CSC (d={self.params.get('d')}, n_blocks={self.params.get('n_blocks')})"
         )
 
+        stats: dict = {}
         center = heuristic_closest_string(
-            self.strings, d=self.params.get("d"), n_blocks=self.params.get("n_blocks")
+            self.strings,
+            d=self.params.get("d"),
+            n_blocks=self.params.get("n_blocks"),
+            stats=stats,
+            local_search_mode=self.params["local_search_mode"],
+            local_search_iters=self.params["local_search_iters"],
+            seed=self.params.get("seed"),
         )
 
         if center:
@@ -77,6 +85,9 @@ class CSCAlgorithm(CSPAlgorithm):
                 "centro_encontrado": center,
                 "sucesso": True,
             }
+            for key in ("recombination", "local_search"):
+                if key in stats:
+                    metadata[key] = stats[key]
 
             # Salvar estado final no histórico se habilitado
             if self.save_history:
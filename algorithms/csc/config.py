@@ -13,4 +13,6 @@ CSC_DEFAULTS = {
     "max_blocks": 4,
     "n_div": 6,
     "l_div": 25,
+    "local_search_mode": "best",  # best | first (primeira melhora, aleatória)
+    "local_search_iters": 50,  # Máximo de varreduras completas das posições
 }
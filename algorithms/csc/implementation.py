@@ -19,7 +19,7 @@ ARQUITETURA ALGORÍTMICA:
 ├─────────────────────────────────────────────────────────────────────────────────┤
 │ 2. CLUSTERIZAÇÃO BASEADA EM DISTÂNCIA                                         │
 │   ├── Converte strings para representação numérica                             │
-│   ├── Aplica DBSCAN com métrica de Hamming customizada                         │
+│   ├── Aplica DBSCAN sobre a matriz de distâncias de Hamming pré-calculada      │
 │   ├── Identifica grupos de strings similares                                   │
 │   └── Remove outliers (strings que não pertencem a clusters)                   │
 ├─────────────────────────────────────────────────────────────────────────────────┤
@@ -31,13 +31,13 @@ ARQUITETURA ALGORÍTMICA:
 │   └── Cria repositório de soluções locais de alta qualidade                    │
 ├─────────────────────────────────────────────────────────────────────────────────┤
 │ 4. RECOMBINAÇÃO DE BLOCOS                                                     │
-│   ├── Gera produto cartesiano de todos os blocos de todos os consensos         │
-│   ├── Cria candidatos combinando blocos de diferentes consensos                │
-│   ├── Explora hibridização entre soluções locais                               │
-│   └── Normaliza tamanho dos candidatos para match com strings originais        │
+│   ├── Percorre o produto cartesiano dos blocos de todos os consensos           │
+│   ├── Branch-and-bound com vetores de distâncias parciais por string           │
+│   ├── Poda prefixos que não podem superar o melhor candidato completo          │
+│   └── Normaliza o tamanho sem materializar os candidatos como strings          │
 ├─────────────────────────────────────────────────────────────────────────────────┤
 │ 5. SELEÇÃO E REFINAMENTO                                                      │
-│   ├── Avalia todos os candidatos usando função max_distance                    │
+│   ├── Mantém apenas o melhor candidato completo encontrado                     │
 │   ├── Seleciona candidato com menor distância máxima                           │
 │   ├── Aplica busca local intensiva posição-a-posição                           │
 │   └── Retorna solução refinada localmente ótima                                │
@@ -62,7 +62,7 @@ COMPLEXIDADE ALGORÍTMICA:
 
 • **Clusterização**: O(n² × L) para DBSCAN com métrica de Hamming
 • **Consenso**: O(c × |cluster| × L) onde c é número de clusters
-• **Recombinação**: O(|consensos|^n_blocks) candidatos gerados
+• **Recombinação**: até O(|consensos|^n_blocks) candidatos, com poda
 • **Busca Local**: O(L × |Σ| × iterações) onde |Σ| é tamanho do alfabeto
 
 PARÂMETROS CRÍTICOS:
@@ -110,12 +110,11 @@ Version: Otimizada para instâncias com estrutura local bem definida
 import logging
 from collections import Counter
 from collections.abc import Callable
-from itertools import combinations, product
 
 import numpy as np
 from sklearn.cluster import DBSCAN
 
-from src.domain.metrics import hamming_distance, max_distance
+from src.domain.metrics import HammingEngine
 
 from .config import CSC_DEFAULTS
 
@@ -293,12 +292,13 @@ def strings_to_array(strings):
                 f"Encontrada string de tamanho {len(s)} na posição {idx}, esperado {L}."
             )
 
-    # Criação do mapeamento char → int
-    unique_chars = sorted(set("".join(strings)))
-    char_map = {c: i for i, c in enumerate(unique_chars)}
-
-    # Conversão para array numpy
-    arr = np.array([[char_map[c] for c in s] for s in strings])
+    # Mesma codificação do motor de distâncias do domínio (alfabeto ordenado)
+    engine = HammingEngine(strings)
+    char_map = {c: i for i, c in enumerate(engine.alphabet)}
+    if engine.vectorized:
+        arr = engine.matrix.astype(np.intp)
+    else:
+        arr = np.array([[char_map[c] for c in s] for s in strings])
 
     return arr, char_map
 
@@ -306,7 +306,7 @@ def strings_to_array(strings):
 # ---------- Parâmetros automáticos ----------
 
 
-def auto_parameters(strings):
+def auto_parameters(strings, distances=None):
     """
     Define automaticamente parâmetros críticos do CSC baseado nas características dos dados.
 
@@ -348,6 +348,8 @@ def auto_parameters(strings):
 
     Args:
         strings: Lista de strings de entrada para análise
+        distances: Matriz de distâncias já calculada por
+            ``HammingEngine.distance_matrix`` (calculada aqui se omitida)
 
     Returns:
         tuple: (d, n_blocks)
@@ -361,7 +363,9 @@ def auto_parameters(strings):
     """
     # ANÁLISE ESTATÍSTICA DAS DISTÂNCIAS
     # Calcula todas as distâncias de Hamming entre pares
-    distancias = [hamming_distance(s1, s2) for s1, s2 in combinations(strings, 2)]
+    if distances is None:
+        distances = HammingEngine(strings).distance_matrix(np.float32)
+    distancias = distances[np.triu_indices(len(strings), k=1)].astype(np.int64)
 
     # Estatísticas descritivas
     media = np.mean(distancias)
@@ -402,15 +406,13 @@ def auto_parameters(strings):
 # ---------- Etapa 2: Clusterização ----------
 
 
-def cluster_strings(strings, d, min_samples=2):
+def cluster_strings(strings, d, min_samples=2, distances=None):
     logger.debug("Clusterizando strings com d=%d, min_samples=%d", d, min_samples)
-    arr, char_map = strings_to_array(strings)
+    if distances is None:
+        distances = HammingEngine(strings).distance_matrix(np.float32)
 
-    def hamming_metric(x, y):
-        return np.sum(x != y)
-
-    clustering = DBSCAN(eps=d, min_samples=min_samples, metric=hamming_metric)
-    labels = clustering.fit_predict(arr)
+    clustering = DBSCAN(eps=d, min_samples=min_samples, metric="precomputed")
+    labels = clustering.fit_predict(distances)
     clusters = {}
     for idx, label in enumerate(labels):
         if label not in clusters:
@@ -425,11 +427,114 @@ def cluster_strings(strings, d, min_samples=2):
 # ---------- Etapa 3: Consenso local e recombinação ----------
 
 
+def recombine_branch_and_bound(consensos, strings, n_blocks):
+    """
+    Seleciona a melhor recombinação de blocos dos consensos sem materializá-las.
+
+    Os candidatos são os mesmos da enumeração ``product(*blocos_por_consenso)``:
+    um bloco de cada consenso, concatenados na ordem dos consensos, truncados
+    em L ou completados com o sufixo do primeiro consenso. A busca percorre
+    esse produto em profundidade, na mesma ordem, mantendo o vetor de
+    distâncias parciais do prefixo para cada string; como as distâncias só
+    crescem, um prefixo cuja distância máxima parcial já não é menor que a do
+    melhor candidato completo é podado. Blocos repetidos de um mesmo
+    consenso geram candidatos idênticos e são considerados uma única vez.
+
+    O resultado é o mesmo de ``min(candidatos, key=max_distance)``, com
+    memória O(|consensos|·n_blocks·n) em vez de um candidato por combinação.
+
+    Args:
+        consensos: Consensos locais (mesmo comprimento das strings)
+        strings: Strings de entrada
+        n_blocks: Número de blocos de cada consenso
+
+    Returns:
+        tuple: (melhor_candidato, estatísticas)
+            - melhor_candidato: String recombinada de menor distância máxima
+            - estatísticas: candidatos do produto, candidatos distintos,
+              avaliados, podados e prefixos podados
+    """
+    arr, char_map = strings_to_array(strings)
+    n, L = arr.shape
+
+    # Blocos distintos de cada consenso, em ordem de primeira ocorrência
+    options = [list(dict.fromkeys(split_blocks(c, n_blocks))) for c in consensos]
+    depth = len(options)
+
+    def segment_cost(text, offset):
+        """Distância (por string) do trecho ``text`` colocado em ``offset``."""
+        codes = np.fromiter((char_map[c] for c in text), dtype=arr.dtype)
+        segment = arr[:, offset : offset + len(text)]
+        return (segment != codes).sum(axis=1, dtype=np.int32)
+
+    # Custos memorizados por (consenso, bloco, posição) e do preenchimento
+    # com o sufixo do primeiro consenso por posição final
+    placement_costs = {}
+    padding_costs = {}
+
+    def placement_cost(level, j, offset):
+        key = (level, j, offset)
+        if key not in placement_costs:
+            block = options[level][j][: max(0, L - offset)]
+            placement_costs[key] = segment_cost(block, offset)
+        return placement_costs[key]
+
+    def padding_cost(offset):
+        if offset not in padding_costs:
+            padding_costs[offset] = segment_cost(consensos[0][offset:L], offset)
+        return padding_costs[offset]
+
+    # Candidatos completos sob cada prefixo podado
+    remaining = [1] * (depth + 1)
+    for level in range(depth - 1, -1, -1):
+        remaining[level] = remaining[level + 1] * len(options[level])
+
+    best_val = None
+    best_choice = None
+    stats = {
+        "candidates": n_blocks**depth,
+        "unique_candidates": remaining[0],
+        "scored": 0,
+        "pruned": 0,
+        "pruned_prefixes": 0,
+    }
+
+    def visit(level, offset, partial, choice):
+        nonlocal best_val, best_choice
+        for j, block in enumerate(options[level]):
+            dist = partial + placement_cost(level, j, offset)
+            end = offset + len(block)
+            if level == depth - 1:
+                value = int((dist + padding_cost(end)).max())
+                stats["scored"] += 1
+                if best_val is None or value < best_val:
+                    best_val, best_choice = value, choice + [j]
+            elif best_val is not None and int(dist.max()) >= best_val:
+                stats["pruned_prefixes"] += 1
+                stats["pruned"] += remaining[level + 1]
+            else:
+                visit(level + 1, end, dist, choice + [j])
+
+    visit(0, 0, np.zeros(n, dtype=np.int32), [])
+    stats["best_distance"] = best_val
+
+    candidate = recombine_blocks([options[i][j] for i, j in enumerate(best_choice)])
+    if len(candidate) > L:
+        candidate = candidate[:L]
+    elif len(candidate) < L:
+        candidate += consensos[0][len(candidate) : L]
+    return candidate, stats
+
+
 def heuristic_closest_string(
     strings,
     d=None,
     n_blocks=None,
     progress_callback: Callable[[str], None] | None = None,
+    stats: dict | None = None,
+    local_search_mode=CSC_DEFAULTS["local_search_mode"],
+    local_search_iters=CSC_DEFAULTS["local_search_iters"],
+    seed=None,
 ):
     """
     Algoritmo principal do CSC para resolver o Closest String Problem.
@@ -457,13 +562,12 @@ def heuristic_closest_string(
        - Divide cada consenso em blocos uniformes
 
     4. **RECOMBINAÇÃO CRIATIVA**:
-       - Gera produto cartesiano de blocos de todos consensos
-       - Cria candidatos hibridizando soluções locais
-       - Normaliza tamanho para manter consistência
+       - Percorre o produto cartesiano de blocos de todos consensos
+       - Branch-and-bound sobre vetores de distâncias parciais
+       - Candidatos nunca são materializados como strings
 
     5. **SELEÇÃO E REFINAMENTO**:
-       - Avalia todos candidatos com função max_distance
-       - Seleciona melhor candidato inicial
+       - Melhor candidato da recombinação (menor max_distance)
        - Aplica busca local intensiva para refinamento
 
     VANTAGENS ESTRATÉGICAS:
@@ -481,8 +585,8 @@ def heuristic_closest_string(
     O algoritmo reporta progresso através de callback opcional:
     - "Clusterizando strings..."
     - "Encontrados X clusters"
-    - "Gerando candidatos por recombinação..."
-    - "Avaliando Y candidatos..."
+    - "Recombinando blocos..."
+    - "Recombinação: X avaliados, Y podados"
     - "Executando busca local..."
 
     Args:
@@ -490,6 +594,12 @@ def heuristic_closest_string(
         d: Raio para DBSCAN (None = automático)
         n_blocks: Número de blocos para recombinação (None = automático)
         progress_callback: Função para reportar progresso (opcional)
+        stats: Dicionário preenchido com as estatísticas da recombinação e
+            da busca local (chaves ``"recombination"`` e ``"local_search"``),
+            opcional
+        local_search_mode: Modo da busca local (``"best"`` ou ``"first"``)
+        local_search_iters: Máximo de varreduras da busca local
+        seed: Semente da busca local no modo ``"first"``
 
     Returns:
         str: String center otimizada para o conjunto de entrada
@@ -503,9 +613,12 @@ def heuristic_closest_string(
         A função é thread-safe e pode ser interrompida via progress_callback.
         Parâmetros automáticos são logados para auditoria e debug.
     """
+    # Matriz de distâncias única, compartilhada pela análise e pelo DBSCAN
+    distances = HammingEngine(strings).distance_matrix(np.float32)
+
     # CONFIGURAÇÃO AUTOMÁTICA DE PARÂMETROS
     if d is None or n_blocks is None:
-        d_auto, n_blocks_auto = auto_parameters(strings)
+        d_auto, n_blocks_auto = auto_parameters(strings, distances)
         if d is None:
             d = d_auto
         if n_blocks is None:
@@ -517,7 +630,7 @@ def heuristic_closest_string(
     if progress_callback:
         progress_callback("Clusterizando strings...")
 
-    clusters = cluster_strings(strings, d)
+    clusters = cluster_strings(strings, d, distances=distances)
 
     # FALLBACK: Se nenhum cluster encontrado
     if not clusters:
@@ -525,8 +638,15 @@ def heuristic_closest_string(
             progress_callback("⚠️ Nenhum cluster encontrado, usando consenso global")
         # Estratégia de recuperação: consenso global + busca local
         best_candidate = consensus_string(strings)
-        best_candidate = local_search(best_candidate, strings, progress_callback)
-        return best_candidate
+        return _refine(
+            best_candidate,
+            strings,
+            progress_callback,
+            stats,
+            local_search_mode,
+            local_search_iters,
+            seed,
+        )
 
     if progress_callback:
         progress_callback(f"Encontrados {len(clusters)} clusters")
@@ -536,98 +656,196 @@ def heuristic_closest_string(
     logger.debug("Consensos locais calculados: %d", len(consensos))
 
     if progress_callback:
-        progress_callback("Gerando candidatos por recombinação...")
-
-    # ETAPA 3: RECOMBINAÇÃO DE BLOCOS
-    L = len(strings[0])
-    # Divide cada consenso em blocos
-    blocks_per_consenso = [split_blocks(cons, n_blocks) for cons in consensos]
-
-    # Gera todas as combinações possíveis de blocos
-    candidates = []
-    for block_tuple in product(*blocks_per_consenso):
-        candidate = recombine_blocks(block_tuple)
+        progress_callback("Recombinando blocos...")
 
-        # NORMALIZAÇÃO DE TAMANHO
-        # Garante que candidato tenha exatamente o tamanho correto
-        if len(candidate) > L:
-            candidate = candidate[:L]  # Trunca se muito longo
-        elif len(candidate) < L:
-            # Completa com sufixo do primeiro consenso se muito curto
-            candidate += consensos[0][len(candidate) : L]
-
-        candidates.append(candidate)
-
-    logger.info("Gerados %d candidatos por recombinação", len(candidates))
+    # ETAPAS 3 e 4: RECOMBINAÇÃO DE BLOCOS E SELEÇÃO DO MELHOR CANDIDATO
+    best_candidate, recombination = recombine_branch_and_bound(
+        consensos, strings, n_blocks
+    )
+    if stats is not None:
+        stats["recombination"] = recombination
 
-    # ETAPA 4: SELEÇÃO DO MELHOR CANDIDATO
+    logger.info(
+        "Recombinação: %d candidatos, %d avaliados, %d podados",
+        recombination["candidates"],
+        recombination["scored"],
+        recombination["pruned"],
+    )
     if progress_callback:
-        progress_callback(f"Avaliando {len(candidates)} candidatos...")
-
-    # Encontra candidato com menor distância máxima
-    best_candidate = min(candidates, key=lambda cand: max_distance(cand, strings))
-    logger.info("Melhor candidato pré-refinamento selecionado")
+        progress_callback(
+            f"Recombinação: {recombination['scored']} avaliados, "
+            f"{recombination['pruned']} podados"
+        )
 
     # ETAPA 5: REFINAMENTO LOCAL INTENSIVO
     if progress_callback:
         progress_callback("Executando busca local...")
 
-    best_candidate = local_search(best_candidate, strings, progress_callback)
+    best_candidate = _refine(
+        best_candidate,
+        strings,
+        progress_callback,
+        stats,
+        local_search_mode,
+        local_search_iters,
+        seed,
+    )
     logger.info("Refinamento local concluído")
 
     return best_candidate
 
 
+def _refine(candidate, strings, progress_callback, stats, mode, max_iterations, seed):
+    """Executa a busca local registrando suas estatísticas em ``stats``."""
+    search_stats = {}
+    refined = local_search(
+        candidate,
+        strings,
+        progress_callback,
+        mode=mode,
+        max_iterations=max_iterations,
+        seed=seed,
+        stats=search_stats,
+    )
+    if stats is not None:
+        stats["local_search"] = search_stats
+    return refined
+
+
+def _install_sigterm_handler():
+    """Converte SIGTERM em KeyboardInterrupt para interromper a busca local."""
+    try:
+        import signal
+
+        signal.signal(signal.SIGTERM, signal.default_int_handler)
+    except (ImportError, AttributeError, ValueError):
+        pass  # Fora da thread principal ou sem suporte a sinais
+
+
 def local_search(
-    candidate, strings, progress_callback: Callable[[str], None] | None = None
+    candidate,
+    strings,
+    progress_callback: Callable[[str], None] | None = None,
+    mode=CSC_DEFAULTS["local_search_mode"],
+    max_iterations=CSC_DEFAULTS["local_search_iters"],
+    seed=None,
+    stats: dict | None = None,
 ):
-    candidate = list(candidate)
-    improved = True
+    """
+    Refina o candidato trocando símbolos posição a posição.
+
+    Mantém o vetor de distâncias do candidato para cada string, de modo que
+    avaliar todas as trocas de uma posição custa O(|Σ_i|·n), onde Σ_i são os
+    símbolos que aparecem na coluna i (pré-calculados). Uma troca é aceita
+    quando reduz a distância máxima ou, mantendo-a (movimento de platô),
+    reduz o número de strings que estão na distância máxima; como o par
+    (máximo, empates no máximo) sempre diminui, a busca termina.
+
+    Cada iteração é uma varredura completa das posições:
+
+    - ``"best"``: posições em ordem, aplicando a melhor troca de cada uma
+      (determinístico)
+    - ``"first"``: posições e símbolos em ordem aleatória (``seed``),
+      aplicando a primeira troca que melhora
+
+    Args:
+        candidate: String inicial
+        strings: Strings de entrada
+        progress_callback: Função para reportar progresso (opcional)
+        mode: ``"best"`` ou ``"first"``
+        max_iterations: Número máximo de varreduras
+        seed: Semente do modo ``"first"``
+        stats: Dicionário preenchido com iterações e movimentos (opcional)
+
+    Returns:
+        str: Candidato refinado
+
+    Raises:
+        ValueError: Se o modo for desconhecido
+    """
+    if mode not in ("best", "first"):
+        raise ValueError(f"Modo de busca local inválido: {mode} (use best ou first)")
+
+    if progress_callback:
+        # Permite interromper o processo com SIGTERM durante a busca
+        _install_sigterm_handler()
+
+    arr, char_map = strings_to_array(strings)
+    n, L = arr.shape
+    current = np.array([char_map.get(c, -1) for c in candidate], dtype=arr.dtype)
+    dist = (arr != current).sum(axis=1)
+    best_max = int(dist.max())
+    at_max = int((dist == best_max).sum())
+
+    # Símbolos candidatos de cada posição: os que aparecem na coluna
+    present = np.zeros((len(char_map), L), dtype=bool)
+    for code in range(len(char_map)):
+        present[code] = (arr == code).any(axis=0)
+    symbols = [np.flatnonzero(present[:, pos]) for pos in range(L)]
+
+    rng = np.random.default_rng(seed)
+    moves = plateau_moves = 0
     iterations = 0
-    max_iterations = 50  # Limite para evitar loops longos
 
-    while improved and iterations < max_iterations:
-        improved = False
+    while iterations < max_iterations and best_max > 0:
         iterations += 1
+        if progress_callback and iterations % 10 == 0:
+            progress_callback(f"Busca local: iteração {iterations}/{max_iterations}")
 
-        # Verificar cancelamento periodicamente
-        if progress_callback:
-            if iterations % 10 == 0:
-                progress_callback(
-                    f"Busca local: iteração {iterations}/{max_iterations}"
-                )
-
-            # Verificação adicional para cancelamento - checar se o processo ainda deve rodar
-            try:
-                import signal
-
-                # Isso permitirá que o processo seja interrompido mais facilmente
-                signal.signal(signal.SIGTERM, signal.default_int_handler)
-            except (ImportError, AttributeError):
-                pass  # Em caso de erro, continuar normalmente
-
-        for i in range(len(candidate)):
-            current_char = candidate[i]
-            chars = {s[i] for s in strings}
-            for alt in chars:
-                if alt == current_char:
-                    continue
-                new_candidate = candidate.copy()
-                new_candidate[i] = alt
-                new_candidate_str = "".join(new_candidate)
-                if max_distance(new_candidate_str, strings) < max_distance(
-                    "".join(candidate), strings
-                ):
-                    candidate[i] = alt
-                    improved = True
-                    # Parar no primeiro melhoramento para evitar travamento
-                    break
-
-            # Se melhorou, parar de testar outras posições nesta iteração
-            if improved:
-                break
-
+        improved = False
+        positions = range(L) if mode == "best" else rng.permutation(L)
+        for pos in positions:
+            options = symbols[pos][symbols[pos] != current[pos]]
+            if not options.size:
+                continue
+
+            column = arr[:, pos]
+            base = dist + (column == current[pos])
+            if mode == "first":
+                options = rng.permutation(options)
+            new_dist = base[None, :] - (column[None, :] == options[:, None])
+            new_max = new_dist.max(axis=1)
+            new_at_max = (new_dist == new_max[:, None]).sum(axis=1)
+
+            better = (new_max < best_max) | (
+                (new_max == best_max) & (new_at_max < at_max)
+            )
+            if not better.any():
+                continue
+            if mode == "best":
+                choice = int(np.lexsort((new_at_max, new_max))[0])
+            else:
+                choice = int(np.argmax(better))
+
+            plateau_moves += int(new_max[choice] == best_max)
+            moves += 1
+            current[pos] = options[choice]
+            dist = new_dist[choice]
+            best_max = int(new_max[choice])
+            at_max = int(new_at_max[choice])
+            improved = True
+
+        if not improved:
+            break
+
+    symbol_of = {code: c for c, code in char_map.items()}
+    result = "".join(
+        symbol_of[code] if code >= 0 else c for code, c in zip(current, candidate)
+    )
+    if stats is not None:
+        stats.update(
+            {
+                "mode": mode,
+                "iterations": iterations,
+                "moves": moves,
+                "plateau_moves": plateau_moves,
+                "best_distance": best_max,
+            }
+        )
     logger.debug(
-        "Resultado da busca local após %d iterações: %s", iterations, "".join(candidate)
+        "Resultado da busca local após %d iterações (%d trocas): %s",
+        iterations,
+        moves,
+        result,
     )
-    return "".join(candidate)
+    return result
@@ -6,7 +6,6 @@ Classes:
 """
 
 from src.domain.algorithms import CSPAlgorithm, register_algorithm
-from src.domain.metrics import max_distance
 
 from .config import DP_CSP_DEFAULTS
 from .implementation import exact_dp_closest_string
@@ -30,6 +29,7 @@ class DPCSPAlgorithm(CSPAlgorithm):
     default_params = DP_CSP_DEFAULTS
     supports_internal_parallel = False  # DP-CSP não suporta paralelismo interno
     is_deterministic = True
+    relative_cost = 50.0  # Exponencial em n; o mais caro do benchmark
 
     def __init__(self, strings: list[str], alphabet: str, **params):
         """
@@ -58,10 +58,9 @@ class DPCSPAlgorithm(CSPAlgorithm):
                 message="Iniciando algoritmo DP-CSP",
             )
 
+        # None = cota superior obtida pela heurística configurada
         max_d = self.params.get("max_d")
-        if max_d is None:
-            # Usa baseline como upper bound
-            max_d = max_distance(self.strings[0], self.strings)
+        search_stats: dict = {}
 
         self._report_progress(f"Iniciando DP-CSP com max_d={max_d}")
 
@@ -71,11 +70,26 @@ class DPCSPAlgorithm(CSPAlgorithm):
                 self.alphabet,
                 max_d,
                 progress_callback=self._report_progress,
+                upper_bound_algorithm=self.params.get("upper_bound_algorithm"),
+                stats=search_stats,
+                dominance_pruning=self.params.get("dominance_pruning", False),
+                symmetry_reduction=self.params.get("symmetry_reduction", True),
             )
 
             metadata = {
-                "iteracoes": 1,
-                "max_d_usado": max_d,
+                "iteracoes": len(search_stats["radii_tested"]),
+                "max_d_usado": search_stats["upper_bound"],
+                "limite_inferior": search_stats["lower_bound"],
+                "limite_superior": search_stats["upper_bound"],
+                "fonte_limite_superior": search_stats["upper_bound_source"],
+                "raios_testados": search_stats["radii_tested"],
+                "estados_gerados": search_stats.get("states_generated", 0),
+                "estados_duplicados": search_stats.get("states_deduplicated", 0),
+                "estados_dominados": search_stats.get("states_dominated", 0),
+                "maior_fronteira": search_stats.get("max_frontier", 0),
+                "strings_identicas_agrupadas": search_stats.get(
+                    "identical_strings_merged", 0
+                ),
                 "solucao_exata": True,
                 "centro_encontrado": center,
             }
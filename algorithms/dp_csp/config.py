@@ -10,4 +10,7 @@ DP_CSP_DEFAULTS = {
     "max_d": None,  # padrão: distância baseline
     "warn_threshold": 9,  # alerta se (d+1)^n > 10^9
     "max_time": 300,  # timeout em segundos
+    "upper_bound_algorithm": "Baseline",  # heurística do registry para cota superior
+    "dominance_pruning": False,  # poda por dominância (frente de Pareto) por camada
+    "symmetry_reduction": True,  # agrupa strings de entrada idênticas
 }
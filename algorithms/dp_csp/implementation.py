@@ -24,8 +24,8 @@ ALGORITMO DP-CSP DETALHADO:
 
 3. OTIMIZAÇÕES DE EFICIÊNCIA
    - Poda por limite de memória (max_states)
-   - Encoding eficiente de estados como tuplas
-   - Memoização para evitar recálculos
+   - Encoding compacto de estados (base mista em int64 / linhas NumPy)
+   - Deduplicação vetorizada e ponteiros de reconstrução por camada
    - Reconstrução lazy da solução ótima
 
 4. CONTROLES DE RECURSO
@@ -77,7 +77,6 @@ Funções auxiliares:
 
 Types:
     String: Alias para str (representação de strings).
-    State: Tupla representando estado de distâncias.
 
 Author: Implementação baseada em programação dinâmica clássica para CSP
 Version: Otimizada com controles de recurso e fallbacks robustos
@@ -86,23 +85,93 @@ Version: Otimizada com controles de recurso e fallbacks robustos
 from __future__ import annotations
 
 import logging
+import math
 import time
 from collections.abc import Callable, Sequence
-from typing import Any, TypeAlias, cast
+from typing import Any, TypeAlias
 
-from src.domain.metrics import max_distance
+import numpy as np
+
+from src.domain.metrics import HammingEngine, max_distance
 
 from .config import DP_CSP_DEFAULTS
 
 logger = logging.getLogger(__name__)
 
 # Type aliases for clarity
-RemVec: TypeAlias = tuple[int, ...]  # (Remaining errors vector)
-State: TypeAlias = tuple[int, RemVec]  # (position, rem_errors)
 String: TypeAlias = str
 
 
-def _dp_decision(strings: Sequence[String], alphabet: str, d: int) -> String | None:
+# Limite de comparações (elementos) por camada na poda por dominância
+_DOMINANCE_WORK_LIMIT = 200_000_000
+_DOMINANCE_BLOCK = 256
+
+# Elementos por bloco temporário na comparação de dominância (~16MB)
+_CHUNK_ELEMENTS = 16 * 1024 * 1024
+
+
+def _pareto_filter(rows: np.ndarray) -> np.ndarray:
+    """
+    Seleciona os estados não dominados de uma camada (frente de Pareto).
+
+    Um estado A domina B se A[i] ≥ B[i] para todo i: qualquer completação
+    viável a partir de B também é viável a partir de A. Os estados são
+    processados em ordem decrescente de soma (só uma soma maior pode
+    dominar), em blocos que filtram o restante da camada. Ao atingir
+    _DOMINANCE_WORK_LIMIT comparações a poda é interrompida; como só
+    estados realmente dominados são removidos, o resultado continua exato.
+
+    Args:
+        rows: Matriz (F × n) de vetores de erros restantes, sem duplicatas
+
+    Returns:
+        np.ndarray: Índices (ordenados) dos estados mantidos
+    """
+    F, n = rows.shape
+    if F <= 1:
+        return np.arange(F)
+
+    order = np.argsort(-rows.sum(axis=1, dtype=np.int64), kind="stable")
+    ordered = rows[order]
+    alive = np.ones(F, dtype=bool)
+    work = 0
+    start = 0
+
+    while start < F and work < _DOMINANCE_WORK_LIMIT:
+        block = np.flatnonzero(alive[start:])[:_DOMINANCE_BLOCK] + start
+        if block.size == 0:
+            break
+
+        # Dominância dentro do bloco: apenas j anterior (soma ≥) domina i
+        block_rows = ordered[block]
+        dominates = (block_rows[:, None, :] >= block_rows[None, :, :]).all(axis=2)
+        dominated = np.triu(dominates, k=1).any(axis=0)
+        alive[block[dominated]] = False
+        dominators = block_rows[~dominated]
+
+        # Filtra o restante da camada contra os dominadores do bloco
+        start = int(block[-1]) + 1
+        rest = np.flatnonzero(alive[start:]) + start
+        chunk = max(1, _CHUNK_ELEMENTS // max(1, dominators.shape[0] * n))
+        for i in range(0, rest.size, chunk):
+            idx = rest[i : i + chunk]
+            hit = (dominators[None, :, :] >= ordered[idx][:, None, :]).all(axis=2)
+            alive[idx[hit.any(axis=1)]] = False
+        work += rest.size * dominators.shape[0] * n
+
+    return np.sort(order[alive])
+
+
+def _dp_decision(
+    strings: Sequence[String],
+    alphabet: str,
+    d: int,
+    max_states: int | None = None,
+    deadline: float | None = None,
+    dominance_pruning: bool = False,
+    symmetry_reduction: bool = True,
+    counters: dict[str, int] | None = None,
+) -> String | None:
     """
     Algoritmo de decisão DP: verifica se existe string center com raio ≤ d.
 
@@ -123,43 +192,57 @@ def _dp_decision(strings: Sequence[String], alphabet: str, d: int) -> String | N
        - δσ[pos] = vetor indicando se σ difere de cada string em pos
        - δσ[pos][i] = 1 se σ ≠ strings[i][pos], 0 caso contrário
 
-    3. TRANSIÇÕES DE ESTADO:
-       - Para cada posição pos = 0, 1, ..., L-1:
-       - Para cada estado rem na fronteira atual:
-       - Para cada símbolo σ do alfabeto:
-         a) Calcula novo_rem[i] = rem[i] - δσ[pos][i]
-         b) Se min(novo_rem) ≥ 0: estado viável, adiciona à próxima fronteira
-         c) Armazena ponteiro parent para reconstrução
-
-    4. PODA DE ESTADOS:
-       - Remove estados onde algum rem[i] < 0 (inviáveis)
-       - Evita duplicatas: um estado por configuração de rem
-       - Para se fronteira vazia (nenhuma solução possível)
+    3. FRONTEIRA COMPACTA:
+       - Estados da fronteira são linhas de uma matriz NumPy (F × n)
+       - Cada estado é empacotado em um inteiro por codificação de base
+         mista: chave = Σ rem[i] × (d+1)^i
+       - A transição por σ vira uma subtração escalar na chave
+         (chave - Σ δσ[pos][i] × (d+1)^i), pois nunca há "empréstimo"
+         entre componentes de estados viáveis
+       - Duplicatas são removidas com np.unique sobre as chaves (ou sobre
+         as linhas, se (d+1)^n não couber em int64)
+       - Opcional: poda por dominância mantém apenas a frente de Pareto
+         dos vetores rem (estado com mais erros restantes em todas as
+         strings torna o outro redundante)
+       - Simetria: strings de entrada idênticas têm sempre o mesmo rem[i],
+         então são representadas por um único componente
+
+    4. TRANSIÇÕES DE ESTADO (vetorizadas por símbolo):
+       - Viáveis: estados com rem[i] ≥ 1 onde δσ[pos][i] = 1
+       - novo_rem = rem - δσ[pos]
+       - Ponteiros de reconstrução ficam em arrays por camada
+         (índice do estado pai e índice do símbolo), sem dicionário global
 
     5. RECONSTRUÇÃO DE SOLUÇÃO:
        - Se chegou ao final com estados viáveis: solução existe
-       - Usa ponteiros parent para backtrack do final ao início
+       - Percorre os arrays de pais da última camada até a primeira
        - Reconstrói string center símbolo por símbolo
 
     COMPLEXIDADE:
-    - Estados: O((d+1)^n) - cada rem[i] pode ser 0, 1, ..., d
+    - Estados: O((d+1)^n) no pior caso - cada rem[i] pode ser 0, 1, ..., d
     - Transições: O(L × |Σ|) - para cada pos, testa cada símbolo
     - Total: O((d+1)^n × L × |Σ|)
-
-    OTIMIZAÇÕES IMPLEMENTADAS:
-    - Pré-computação de δσ evita recálculos
-    - Fronteira compacta reduz uso de memória
-    - Poda precoce elimina estados inviáveis rapidamente
-    - Parent pointers permitem reconstrução eficiente
+    - Memória: n + 8 bytes por estado da fronteira e 5 bytes por estado
+      armazenado nos arrays de pais de cada camada
 
     Args:
         strings: Sequência de strings de entrada (mesmo comprimento)
         alphabet: String com todos os símbolos válidos
         d: Raio máximo permitido (threshold de decisão)
+        max_states: Limite de estados por camada (None = sem limite)
+        deadline: Instante (time.time()) após o qual a busca é abortada
+        dominance_pruning: Ativa a poda por dominância (frente de Pareto)
+        symmetry_reduction: Agrupa strings de entrada idênticas
+        counters: Dicionário acumulador de "states_generated",
+                  "states_deduplicated", "states_dominated",
+                  "identical_strings_merged" e "max_frontier"
 
     Returns:
         String center com raio ≤ d se existir, None caso contrário
 
+    Raises:
+        RuntimeError: Se a fronteira exceder max_states ou o prazo expirar
+
     Example:
         >>> strings = ["AC", "AT", "GC"]
         >>> _dp_decision(strings, "ACGT", 1)
@@ -173,74 +256,134 @@ def _dp_decision(strings: Sequence[String], alphabet: str, d: int) -> String | N
         válida (não necessariamente única). Validação final verifica
         se solução retornada satisfaz realmente raio ≤ d.
     """
-    n, L = len(strings), len(strings[0])
+    all_strings = strings
+    if symmetry_reduction:
+        # SIMETRIA: strings idênticas compartilham o mesmo componente rem
+        strings = list(dict.fromkeys(strings))
 
-    # PRÉ-COMPUTAÇÃO: Matriz de diferenças δσ[pos][string]
-    # Para cada posição e símbolo, calcula vetor de discrepâncias
-    delta: list[dict[String, RemVec]] = []
-    for pos in range(L):
-        # Símbolos na posição pos de todas as strings
-        col = [s[pos] for s in strings]
-        # Para cada símbolo σ, calcula diferenças
-        delta.append({σ: tuple(int(σ != c) for c in col) for σ in alphabet})
+    n, L = len(strings), len(strings[0])
+    symbols = list(alphabet)
+
+    # INSTRUMENTAÇÃO: contadores acumulados entre chamadas
+    if counters is not None:
+        for key in (
+            "states_generated",
+            "states_deduplicated",
+            "states_dominated",
+            "max_frontier",
+        ):
+            counters.setdefault(key, 0)
+        counters["identical_strings_merged"] = len(all_strings) - n
+
+    def count(key: str, value: int) -> None:
+        """Acumula um contador de instrumentação."""
+        if counters is None:
+            return
+        if key == "max_frontier":
+            counters[key] = max(counters[key], value)
+        else:
+            counters[key] += value
+
+    # PRÉ-COMPUTAÇÃO: Tensor de diferenças δ[σ, pos, string]
+    columns = np.array([list(s) for s in strings], dtype="<U1").T  # (L, n)
+    delta = np.array(symbols, dtype="<U1")[:, None, None] != columns[None, :, :]
+
+    # Codificação de base mista (radix d+1) quando cabe em int64
+    radix = d + 1
+    packable = radix**n < 2**63
+    if packable:
+        weights = np.array([radix**i for i in range(n)], dtype=np.int64)
+        shifts = delta.astype(np.int64) @ weights  # (|Σ|, L)
+
+    rem_dtype = np.uint8 if d < 2**8 else np.int32
 
     # INICIALIZAÇÃO DA PROGRAMAÇÃO DINÂMICA
-    start: RemVec = (d,) * n  # Estado inicial: d erros para cada string
-    frontier: set[RemVec] = {start}  # Fronteira atual de estados viáveis
+    rows = np.full((1, n), d, dtype=rem_dtype)  # Estado inicial
+    keys = np.array([int(weights.sum()) * d], dtype=np.int64) if packable else None
 
-    # Ponteiros para reconstrução: (pos, estado) → (estado_anterior, símbolo)
-    parent: dict[tuple[int, RemVec], tuple[RemVec | None, String]] = {
-        (0, start): (None, "")  # Estado inicial não tem predecessor
-    }
+    # Ponteiros para reconstrução, uma entrada por camada
+    parents: list[np.ndarray] = []
+    chosen: list[np.ndarray] = []
 
     # PROGRAMAÇÃO DINÂMICA POSIÇÃO-A-POSIÇÃO
     for pos in range(L):
-        nxt: set[RemVec] = set()  # Próxima fronteira
-
-        # Processa todos os estados da fronteira atual
-        for rem in frontier:
-            # Testa cada símbolo do alfabeto na posição atual
-            for σ, dv in delta[pos].items():
-                # TRANSIÇÃO DE ESTADO: consome erros baseado em diferenças
-                new_rem = tuple(r - v for r, v in zip(rem, dv))
-
-                # PODA: Remove estados inviáveis (algum rem[i] negativo)
-                if min(new_rem) < 0:
-                    continue  # Estado inviável, poda
-
-                # Evita estados duplicados
-                key = (pos + 1, new_rem)
-                if key in parent:
-                    continue  # Estado já visitado
-
-                # ARMAZENAMENTO: Registra transição e adiciona à próxima fronteira
-                parent[key] = (rem, σ)
-                nxt.add(new_rem)
-
-        # Atualiza fronteira para próxima posição
-        frontier = nxt
+        next_rows: list[np.ndarray] = []
+        next_keys: list[np.ndarray] = []
+        next_parent: list[np.ndarray] = []
+        next_symbol: list[np.ndarray] = []
+
+        for k in range(len(symbols)):
+            dv = delta[k, pos]
+            mismatched = np.flatnonzero(dv)
+
+            # PODA: só estados com erros restantes nas strings que diferem
+            if mismatched.size:
+                sel = np.flatnonzero((rows[:, mismatched] > 0).all(axis=1))
+            else:
+                sel = np.arange(rows.shape[0])
+            if sel.size == 0:
+                continue
+
+            # TRANSIÇÃO DE ESTADO: consome erros baseado em diferenças
+            next_rows.append(rows[sel] - dv.astype(rem_dtype))
+            if packable:
+                next_keys.append(keys[sel] - shifts[k, pos])
+            next_parent.append(sel)
+            next_symbol.append(np.full(sel.size, k, dtype=np.uint8))
 
         # PODA GLOBAL: Se nenhum estado viável, impossível continuar
-        if not frontier:
+        if not next_rows:
             return None  # Nenhuma solução existe para este d
 
-    # RECONSTRUÇÃO DA SOLUÇÃO
-    # Se chegamos aqui, existe pelo menos um estado final viável
-    final_rem = next(iter(frontier))  # Qualquer estado final serve
+        all_rows = np.concatenate(next_rows)
+        all_parent = np.concatenate(next_parent)
+        all_symbol = np.concatenate(next_symbol)
+
+        # Evita estados duplicados (mantém a primeira ocorrência)
+        if packable:
+            all_keys = np.concatenate(next_keys)
+            _, first = np.unique(all_keys, return_index=True)
+            keys = all_keys[first]
+        else:
+            _, first = np.unique(all_rows, axis=0, return_index=True)
+
+        count("states_generated", all_rows.shape[0])
+        count("states_deduplicated", all_rows.shape[0] - first.size)
+
+        # PODA POR DOMINÂNCIA: mantém a frente de Pareto dos vetores rem
+        if dominance_pruning:
+            keep = _pareto_filter(all_rows[first])
+            count("states_dominated", first.size - keep.size)
+            first = first[keep]
+            if packable:
+                keys = keys[keep]
+
+        rows = all_rows[first]
+        parent_dtype = np.int32 if all_parent.size < 2**31 else np.int64
+        parents.append(all_parent[first].astype(parent_dtype))
+        chosen.append(all_symbol[first])
+        count("max_frontier", rows.shape[0])
+
+        # CONTROLES DE RECURSO POR CAMADA
+        if max_states is not None and rows.shape[0] > max_states:
+            raise RuntimeError(
+                f"DP-CSP interrompido: fronteira com {rows.shape[0]:,} estados na "
+                f"posição {pos + 1}/{L} excede o limite de {max_states:,} estados "
+                f"para d={d}"
+            )
+        if deadline is not None and time.time() > deadline:
+            raise RuntimeError(
+                f"DP-CSP interrompido: tempo esgotado na posição {pos + 1}/{L} "
+                f"para d={d}"
+            )
 
+    # RECONSTRUÇÃO DA SOLUÇÃO
+    # Qualquer estado final serve; percorre os pais de trás para frente
     center_chars: list[String] = []
-    pos: int = L
-    rem: RemVec = final_rem
-
-    # Backtrack usando ponteiros parent
-    while pos > 0:
-        prev_rem, σ = parent[(pos, rem)]
-        center_chars.append(σ)  # Símbolo escolhido nesta posição
-        pos -= 1
-
-        if prev_rem is None:  # Chegamos ao estado inicial
-            break
-        rem = cast(RemVec, prev_rem)
+    idx = 0
+    for pos in range(L - 1, -1, -1):
+        center_chars.append(symbols[int(chosen[pos][idx])])
+        idx = int(parents[pos][idx])
 
     # Reconstrói string na ordem correta
     center_chars.reverse()
@@ -249,7 +392,7 @@ def _dp_decision(strings: Sequence[String], alphabet: str, d: int) -> String | N
     # VALIDAÇÃO FINAL: Verifica se solução é realmente válida
     from src.domain.metrics import hamming_distance
 
-    max_dist = max(hamming_distance(result, s) for s in strings)
+    max_dist = max(hamming_distance(result, s) for s in all_strings)
     if max_dist > d:
         logger.error(
             "[DP_DECISION] ERRO: Solução inválida! dist=%d > d=%d", max_dist, d
@@ -258,12 +401,69 @@ def _dp_decision(strings: Sequence[String], alphabet: str, d: int) -> String | N
     return result
 
 
+def _radius_lower_bound(strings: Sequence[String]) -> int:
+    """
+    Cota inferior do raio ótimo: ⌈max_{i,j} H(s_i, s_j) / 2⌉.
+
+    Pela desigualdade triangular, H(s_i, s_j) ≤ H(s_i, c) + H(c, s_j) ≤ 2d
+    para qualquer centro c de raio d.
+    """
+    matrix = HammingEngine(strings).distance_matrix()
+    return math.ceil(int(np.max(matrix)) / 2)
+
+
+def _heuristic_upper_bound(
+    strings: list[String], alphabet: str, algorithm_name: str | None
+) -> tuple[String, int, str]:
+    """
+    Cota superior do raio ótimo via heurística registrada.
+
+    Executa o algoritmo indicado (ex.: "Baseline", "H³-CSP") a partir do
+    registry global e compara com a cota trivial da primeira string,
+    retornando a melhor das duas.
+
+    Returns:
+        tuple: (centro, raio, origem_da_cota)
+    """
+    best_center = strings[0]
+    best_dist = max_distance(strings[0], strings)
+    source = "primeira_string"
+
+    if not algorithm_name:
+        return best_center, best_dist, source
+
+    from src.domain.algorithms import global_registry
+
+    algorithm_cls = global_registry.get(algorithm_name)
+    if algorithm_cls is None:
+        logger.warning(
+            "[DP_CSP] Algoritmo de cota superior '%s' não registrado", algorithm_name
+        )
+        return best_center, best_dist, source
+
+    try:
+        center, _, _ = algorithm_cls(strings, alphabet).run()
+    except Exception as e:  # heurística é opcional: mantém a cota trivial
+        logger.warning("[DP_CSP] Falha na cota superior '%s': %s", algorithm_name, e)
+        return best_center, best_dist, source
+
+    dist = max_distance(center, strings)
+    if dist < best_dist:
+        best_center, best_dist, source = center, dist, algorithm_name
+
+    return best_center, best_dist, source
+
+
 def exact_dp_closest_string(
     strings: list[String],
     alphabet: str,
     max_d: int | None = None,
     progress_callback: Callable[[str], None] | None = None,
     warning_callback: Callable[[str], None] | None = None,
+    upper_bound_algorithm: str | None = "Baseline",
+    stats: dict[str, Any] | None = None,
+    dominance_pruning: bool = False,
+    symmetry_reduction: bool = True,
 ) -> tuple[String, int]:
     """
     Encontra a solução EXATA do Closest String Problem usando programação dinâmica.
@@ -274,15 +474,18 @@ def exact_dp_closest_string(
 
     ESTRATÉGIA DE BUSCA DO RAIO ÓTIMO:
 
-    1. BUSCA INCREMENTAL:
-       - Testa valores d = 0, 1, 2, ..., max_d sequencialmente
-       - Para cada d, usa algoritmo de decisão DP
-       - Para no primeiro d onde encontra solução (garantidamente ótimo)
+    1. COTAS INICIAIS:
+       - Inferior: ⌈max_{i,j} H(s_i, s_j) / 2⌉ (desigualdade triangular)
+       - Superior: melhor entre a primeira string e a heurística registrada
+         em upper_bound_algorithm (padrão "Baseline"), limitada por max_d
 
-    2. OTIMALIDADE GARANTIDA:
-       - Como testa em ordem crescente, primeira solução é ótima
-       - d* = min{d : existe center com raio ≤ d}
-       - Evita busca binária desnecessária para problema small
+    2. BUSCA EXPONENCIAL + BINÁRIA:
+       - Como o custo do DP cresce com d, testa primeiro raios próximos à
+         cota inferior com passos exponenciais (inf, inf+1, inf+3, ...)
+       - Ao achar um raio viável, faz bisseção no intervalo restante
+       - Viável em d → superior = d; inviável → inferior = d + 1
+       - d* = min{d : existe center com raio ≤ d}, com O(log(d* - inf))
+         passagens exponenciais em vez de d* + 1
 
     3. MONITORAMENTO DE RECURSOS:
        - Estima complexidade (d+1)^n antes de executar
@@ -293,7 +496,9 @@ def exact_dp_closest_string(
     LIMITAÇÕES E SALVAGUARDAS:
 
     - Complexidade Exponencial: O((d+1)^n × L × |Σ|) cresce rapidamente
-    - Limite de Estados: Aborta se (d+1)^n > 2e9 (evita crash por memória)
+    - Limite de Estados: Aborta se a fronteira real de uma camada exceder o
+      número de estados que cabe no limite seguro de memória
+    - Alerta de Complexidade: Avisa se (d+1)^n > 10^warn_threshold
     - Limite de Memória: Monitora RSS, aborta se > 95% do limite seguro
     - Limite de Tempo: Timeout configurável (padrão 300s)
 
@@ -306,9 +511,12 @@ def exact_dp_closest_string(
 
     CONFIGURAÇÃO DE PARÂMETROS:
 
-    - max_d=None: Usa baseline (distância da primeira string) como limite
+    - max_d=None: Usa a cota superior heurística como limite
     - progress_callback: Reporta progresso "Testando d=X"
     - warning_callback: Reporta alertas de recursos antes de abortar
+    - upper_bound_algorithm: Heurística do registry para a cota superior
+      (None = apenas a primeira string)
+    - stats: Dicionário preenchido com cotas e raios testados
 
     MÉTRICAS E LOGS DETALHADOS:
 
@@ -325,6 +533,12 @@ def exact_dp_closest_string(
         max_d: Raio máximo a testar (None = baseline automático)
         progress_callback: Função para reportar progresso (opcional)
         warning_callback: Função para reportar alertas de recursos (opcional)
+        upper_bound_algorithm: Nome da heurística registrada para a cota superior
+        stats: Dicionário opcional preenchido com "lower_bound", "upper_bound",
+               "upper_bound_source", "radii_tested" e os contadores de estados
+               de _dp_decision (gerados, duplicados, dominados)
+        dominance_pruning: Ativa a poda por dominância em cada camada do DP
+        symmetry_reduction: Agrupa strings de entrada idênticas no DP
 
     Returns:
         tuple: (center_ótimo, d*_ótimo)
@@ -347,17 +561,35 @@ def exact_dp_closest_string(
         O DP-CSP deve ser usado quando exatidão é crítica e recursos
         computacionais são adequados.
     """
-    # CONFIGURAÇÃO INICIAL E VALIDAÇÃO
-    baseline_val = max_distance(strings[0], strings)  # Cota superior simples
-    if max_d is None:
-        max_d = baseline_val
+    # CONFIGURAÇÃO INICIAL E VALIDAÇÃO: cotas do raio ótimo
+    lower = _radius_lower_bound(strings)
+    upper_center, upper, upper_source = _heuristic_upper_bound(
+        strings, alphabet, upper_bound_algorithm
+    )
+    if max_d is not None and max_d < upper:
+        # Limite explícito abaixo da heurística: viabilidade ainda não provada
+        upper_center, upper = None, max_d
+    max_d = upper
+
+    if stats is not None:
+        stats.update(
+            {
+                "lower_bound": lower,
+                "upper_bound": upper,
+                "upper_bound_source": upper_source,
+                "radii_tested": [],
+            }
+        )
 
     n = len(strings)
     L = len(strings[0])
 
     # LOGS DETALHADOS DE ENTRADA
     logger.info(
-        "[DP_CSP] Iniciando busca exata com max_d=%d, baseline=%d", max_d, baseline_val
+        "[DP_CSP] Iniciando busca exata com cotas [%d, %d] (superior via %s)",
+        lower,
+        upper,
+        upper_source,
     )
     logger.info("[DP_CSP] Dataset: n=%d, L=%d, alfabeto=%s", n, L, alphabet)
     for i, s in enumerate(strings):
@@ -368,7 +600,21 @@ def exact_dp_closest_string(
     max_time = DP_CSP_DEFAULTS.get("max_time", 300)
     t0 = time.time()
 
-    logger.info("[DP_CSP] Limites: mem=%.1fMB, tempo=%ds", safe_mem_mb, max_time)
+    warn_threshold = DP_CSP_DEFAULTS.get("warn_threshold", 9)
+
+    # Estados por camada que cabem no limite de memória: linha (n bytes) +
+    # chave (8) + pai/símbolo temporários (9) + ordenação do np.unique (24)
+    # para cada símbolo expandido, mais 5 bytes por camada nos arrays de
+    # reconstrução
+    bytes_per_state = (n + 41) * len(alphabet) + 5 * L
+    max_states = max(1, int(safe_mem_mb * 1024 * 1024 / bytes_per_state))
+
+    logger.info(
+        "[DP_CSP] Limites: mem=%.1fMB, tempo=%ds, estados/camada=%d",
+        safe_mem_mb,
+        max_time,
+        max_states,
+    )
 
     def check_limits(d):
         """Verifica limites de recursos antes de processar raio d."""
@@ -391,21 +637,15 @@ def exact_dp_closest_string(
 
         elapsed = time.time() - t0
 
-        # ESTIMATIVA DE COMPLEXIDADE
-        # Limite prático: ~2e9 estados (≈16GB RAM, 8 bytes/estado)
+        # ESTIMATIVA DE COMPLEXIDADE (pior caso; a fronteira real costuma
+        # ser ordens de grandeza menor e é limitada por max_states)
         state_count_est = (d + 1) ** n
-
-        # VERIFICAÇÕES DE RECURSOS
-        if state_count_est > 2_000_000_000:
-            msg = (
-                f"DP-CSP interrompido: (d+1)^n = {state_count_est:,} excede limite prático "
-                "(~2e9 estados, ~16GB RAM). Tente reduzir n ou d."
+        if state_count_est > 10**warn_threshold and warning_callback:
+            warning_callback(
+                f"DP-CSP: (d+1)^n = {state_count_est:,} estados no pior caso para d={d}"
             )
-            logger.error("[DP_CSP] %s", msg)
-            if warning_callback:
-                warning_callback(msg)
-            raise RuntimeError(msg)
 
+        # VERIFICAÇÕES DE RECURSOS
         if mem_mb > safe_mem_mb * 0.95:
             msg = f"DP-CSP interrompido: uso de memória {mem_mb:.1f}MB excedeu limite seguro ({safe_mem_mb:.1f}MB)"
             logger.error("[DP_CSP] %s", msg)
@@ -420,45 +660,87 @@ def exact_dp_closest_string(
                 warning_callback(msg)
             raise RuntimeError(msg)
 
-    # BUSCA INCREMENTAL DO RAIO ÓTIMO
-    for d in range(max_d + 1):
-        # Verificar recursos antes de cada iteração principal
+    def decide(d: int) -> String | None:
+        """Executa o algoritmo de decisão para o raio d com controles."""
         check_limits(d)
 
         if progress_callback:
             progress_callback(f"Testando d={d}")
 
-        logger.info("[DP_CSP] Testando d=%d (tentativa %d/%d)", d, d + 1, max_d + 1)
+        logger.info("[DP_CSP] Testando d=%d (cotas [%d, %d])", d, lower, upper)
+        if stats is not None:
+            stats["radii_tested"].append(d)
+
+        try:
+            return _dp_decision(
+                strings,
+                alphabet,
+                d,
+                max_states=max_states,
+                deadline=t0 + max_time,
+                dominance_pruning=dominance_pruning,
+                symmetry_reduction=symmetry_reduction,
+                counters=stats,
+            )
+        except RuntimeError as e:
+            logger.error("[DP_CSP] %s", e)
+            if warning_callback:
+                warning_callback(str(e))
+            raise
+
+    # Limite explícito (max_d) abaixo da heurística precisa ser verificado
+    if upper_center is None and lower <= upper:
+        upper_center = decide(upper)
 
-        # ALGORITMO DE DECISÃO PARA RAIO d
-        center = _dp_decision(strings, alphabet, d)
+    if upper_center is None or lower > upper:
+        # FALHA: Nenhuma solução encontrada dentro dos limites
+        logger.error(
+            "[DP_CSP] FALHA: Não foi possível encontrar centro com d ≤ %d", max_d
+        )
+        raise RuntimeError(
+            f"Não foi possível encontrar centro com d ≤ {max_d}. "
+            "Tente aumentar o limite."
+        )
 
+    # BUSCA DO RAIO ÓTIMO ENTRE AS COTAS
+    # O custo de cada passagem cresce com d, então a busca avança a partir
+    # da cota inferior com passos exponenciais, sondando lo, lo+2, lo+6,
+    # lo+14, ... (cada sonda pula o dobro de raios da anterior), até
+    # encontrar um raio viável e depois faz bisseção no intervalo.
+    best_center, best_d = upper_center, upper
+    lo, hi = lower, upper
+    step = 1
+    while lo < hi:
+        probe = min(lo + step - 1, hi - 1)
+        center = decide(probe)
         if center is not None:
-            # SUCESSO: Encontrou solução com raio d
-
-            # VALIDAÇÃO FINAL RIGOROSA
-            from src.domain.metrics import hamming_distance
+            best_center, best_d, hi = center, probe, probe
+            break
+        lo = probe + 1
+        step *= 2
 
-            max_dist = max(hamming_distance(center, s) for s in strings)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        center = decide(mid)
+        if center is not None:
+            best_center, best_d, hi = center, mid, mid
+        else:
+            lo = mid + 1
 
-            logger.info("[DP_CSP] SUCESSO! Encontrou solução com d=%d", d)
-            logger.info("[DP_CSP] Centro encontrado: %s", center)
-            logger.info("[DP_CSP] Validação final: distância máxima = %d", max_dist)
+    # VALIDAÇÃO FINAL RIGOROSA
+    max_dist = max_distance(best_center, strings)
 
-            # Verificação de consistência
-            if max_dist != d:
-                logger.warning(
-                    "[DP_CSP] INCONSISTÊNCIA: d=%d mas distância real=%d", d, max_dist
-                )
+    logger.info("[DP_CSP] SUCESSO! Encontrou solução com d=%d", best_d)
+    logger.info("[DP_CSP] Centro encontrado: %s", best_center)
+    logger.info("[DP_CSP] Validação final: distância máxima = %d", max_dist)
 
-            return center, d
+    # Verificação de consistência
+    if max_dist != best_d:
+        logger.warning(
+            "[DP_CSP] INCONSISTÊNCIA: d=%d mas distância real=%d", best_d, max_dist
+        )
 
-    # FALHA: Nenhuma solução encontrada dentro dos limites
-    logger.error("[DP_CSP] FALHA: Não foi possível encontrar centro com d ≤ %d", max_d)
-    raise RuntimeError(
-        f"Não foi possível encontrar centro com d ≤ {max_d}. "
-        "Tente aumentar o limite."
-    )
+    return best_center, best_d
 
 
 class DPCSP:
@@ -37,7 +37,7 @@ class H3CSPAlgorithm(CSPAlgorithm):
     - Decomposição hierárquica baseada na regra √L
     - Seleção adaptativa de técnicas por bloco
     - Refinamento global por busca local (hill-climbing)
-    - Determinístico e sem suporte a paralelismo interno
+    - Determinístico, com resolução de blocos opcionalmente em paralelo
 
     Parâmetros principais:
     - beam_width: Largura do beam search (padrão: 32)
@@ -54,7 +54,7 @@ class H3CSPAlgorithm(CSPAlgorithm):
     Attributes:
         name (str): Nome do algoritmo ("H³-CSP").
         default_params (dict): Parâmetros padrão do algoritmo.
-        supports_internal_parallel (bool): False - não suporta paralelismo interno.
+        supports_internal_parallel (bool): True - blocos em processos (block_workers).
         is_deterministic (bool): True - algoritmo determinístico.
         h3_csp_instance (H3CSP): Instância da implementação do algoritmo.
 
@@ -67,8 +67,9 @@ class H3CSPAlgorithm(CSPAlgorithm):
 
     name = "H³-CSP"
     default_params = H3_CSP_DEFAULTS
-    supports_internal_parallel = False  # H³-CSP não suporta paralelismo interno
+    supports_internal_parallel = True  # Blocos resolvidos em processos (block_workers)
     is_deterministic = True  # H³-CSP é determinístico
+    relative_cost = 5.0  # Busca por blocos + refinamento
 
     def __init__(self, strings: list[str], alphabet: str, **params):
         """
@@ -133,6 +134,8 @@ class H3CSPAlgorithm(CSPAlgorithm):
                     - algoritmo: Nome do algoritmo ("H³-CSP")
                     - parametros_usados: Parâmetros utilizados na execução
                     - centro_encontrado: String central encontrada
+                    - block_stats: Técnica e tempo por bloco do Smart-Core
+                    - fusion: Raio da escolha gulosa e após a busca de fusão
 
         Raises:
             TimeoutError: Se o tempo máximo de execução for excedido.
@@ -159,6 +162,8 @@ class H3CSPAlgorithm(CSPAlgorithm):
             "algoritmo": "H³-CSP",
             "parametros_usados": self.params,
             "centro_encontrado": center,
+            "block_stats": self.h3_csp_instance.block_stats,
+            "fusion": self.h3_csp_instance.fusion_stats,
         }
 
         # Salvar estado final no histórico se habilitado
@@ -23,9 +23,12 @@ H3_CSP_DEFAULTS = {
     "block_medium": 4,  # Limite para blocos "médios" (beam search reduzido)
     "block_large": 8,  # Limite para blocos "grandes" (beam search completo)
     # === Parâmetros de Busca ===
-    "exhaustive_limit": 10000,  # Limite para busca exaustiva (|Σ|^m)
+    "exhaustive_limit": 1_000_000,  # Limite para busca exaustiva (|Σ|^m), enumerada em lotes
+    "exhaustive_work_limit": 20_000_000,  # Limite de |Σ|^m × n (tempo, ~0,1 s por bloco)
     "beam_width": 32,  # Largura do beam search
     "k_candidates": 5,  # Número de candidatos por bloco
+    "fusion_beam_width": 64,  # Beam da fusão entre blocos (0 = concatena os melhores)
+    "block_workers": 1,  # Processos para resolver blocos (1 = sequencial, 0 = todos os núcleos)
     # === Refinamento Global ===
     "local_search_iters": 3,  # Iterações de busca local (deprecated)
     "local_iters": 3,  # Iterações de busca local (atual)
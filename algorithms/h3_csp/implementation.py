@@ -21,7 +21,7 @@ ARQUITETURA ALGORÍTMICA:
 │   ├── BLOCO FÁCIL (d_b ≤ block_small):                                        │
 │   │   ├── Busca exaustiva: explora todo o espaço |Σ|^(r-l)                   │
 │   │   ├── Garantia de otimalidade local                                        │
-│   │   └── Usado quando |Σ|^(r-l) ≤ 10.000                                    │
+│   │   └── Usado quando |Σ|^(r-l) ≤ exhaustive_limit (e × n ≤ work_limit) │
 │   ├── BLOCO MÉDIO (block_small < d_b ≤ block_medium):                         │
 │   │   ├── Beam search reduzido (beam_width/2)                                 │
 │   │   ├── Balanço qualidade vs. eficiência                                    │
@@ -109,20 +109,26 @@ Version: Otimizada para instâncias de tamanho médio com estrutura local
 
 from __future__ import annotations
 
-import itertools
 import logging
 import math
+import os
 import random
 import time
 from collections import Counter
 from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor
 
-from src.domain.metrics import max_distance
+import numpy as np
+
+from src.domain.metrics import HammingEngine, IncrementalEvaluator, max_distance
 
 from .config import H3_CSP_DEFAULTS
 
 logger = logging.getLogger(__name__)
 
+# Limite de bytes das distâncias de um lote na enumeração exaustiva
+_ENUM_CHUNK_BYTES = 16 * 1024 * 1024
+
 String = str
 Block = tuple[int, int]  # (início, fim) 0-based, exclusivo
 
@@ -277,7 +283,13 @@ def consensus_block(strings: Sequence[String], l: int, r: int) -> String:
 
 
 def _exhaustive_block(
-    strings: Sequence[String], alphabet: str, l: int, r: int, k: int
+    strings: Sequence[String],
+    alphabet: str,
+    l: int,
+    r: int,
+    k: int,
+    limit: int = H3_CSP_DEFAULTS["exhaustive_limit"],
+    work_limit: int = H3_CSP_DEFAULTS["exhaustive_work_limit"],
 ) -> list[String]:
     """
     Realiza busca exaustiva em um bloco pequeno para encontrar os k melhores candidatos.
@@ -288,15 +300,18 @@ def _exhaustive_block(
     complexidade exponencial.
 
     ALGORITMO DE BUSCA EXAUSTIVA:
-    1. **VERIFICAÇÃO DE VIABILIDADE**: Se |Σ|^(r-l) ≤ 10.000, usa busca completa
-    2. **GERAÇÃO DE CANDIDATOS**: Usa itertools.product para gerar todas as
-       combinações possíveis de caracteres
-    3. **AVALIAÇÃO**: Calcula distância máxima de cada candidato para o bloco
-    4. **SELEÇÃO**: Mantém os k melhores candidatos em uma lista ordenada
+    1. **VERIFICAÇÃO DE VIABILIDADE**: Se |Σ|^(r-l) ≤ limit e
+       |Σ|^(r-l) × n ≤ work_limit, usa busca completa
+    2. **GERAÇÃO DE CANDIDATOS**: Enumera os candidatos em lotes como matriz
+       de índices do alfabeto (mesma ordem de itertools.product); o tamanho
+       do lote é limitado pela memória, não pelo espaço de busca
+    3. **AVALIAÇÃO**: Distâncias de cada lote para todas as strings via tabela
+       de mismatches por posição (NumPy)
+    4. **SELEÇÃO**: Mantém os k melhores com seleção parcial (np.partition)
     5. **FALLBACK**: Se espaço muito grande, usa apenas candidatos do dataset
 
     ESTRATÉGIA DE FALLBACK:
-    Para blocos onde |Σ|^(r-l) > 10.000:
+    Para blocos que excedem limit ou work_limit:
     - Usa apenas os segmentos originais das strings como candidatos
     - Adiciona o consenso como candidato adicional
     - Reduz drasticamente o espaço de busca mantendo qualidade razoável
@@ -316,6 +331,9 @@ def _exhaustive_block(
         l (int): Posição inicial do bloco (inclusiva).
         r (int): Posição final do bloco (exclusiva).
         k (int): Número máximo de candidatos a retornar.
+        limit (int): Maior espaço de busca |Σ|^(r-l) enumerado por completo.
+        work_limit (int): Maior custo |Σ|^(r-l) × n enumerado por completo;
+            o tempo da enumeração cresce com ele, não com ``limit`` sozinho.
 
     Returns:
         list[String]: Lista dos k melhores candidatos para o bloco,
@@ -331,8 +349,9 @@ def _exhaustive_block(
         ["ACG...", "ATG...", "AAG..."]  # Usa segmentos originais
 
     Note:
-        O limite de 10.000 é heurístico, balanceando qualidade vs. eficiência.
-        Para alfabetos maiores, pode ser necessário ajustar este limite.
+        A memória usada independe dos limites; o tempo é proporcional a
+        |Σ|^(r-l) × n (4^9 candidatos com n=1000 levam ~1,4 s), por isso
+        exhaustive_work_limit reduz o espaço enumerado quando n é grande.
     """
     m = r - l  # Tamanho do bloco
     search_space_size = len(alphabet) ** m  # |Σ|^m
@@ -341,28 +360,36 @@ def _exhaustive_block(
     best_candidates = []
 
     # ESTRATÉGIA 1: BUSCA EXAUSTIVA (para blocos pequenos)
-    if search_space_size <= 10_000:
-        # Gera todas as combinações possíveis de caracteres
-        for candidate_tuple in itertools.product(alphabet, repeat=m):
-            # Converte tupla para string
-            candidate = "".join(candidate_tuple)
-
-            # Calcula distância máxima do candidato para os segmentos do bloco
-            block_segments = [s[l:r] for s in strings]
-            distance = max_distance(candidate, block_segments)
-
-            # Mantém apenas os k melhores candidatos
-            if len(best_candidates) < k:
-                # Ainda há espaço, adiciona diretamente
-                best_candidates.append((distance, candidate))
-                # Mantém lista ordenada por distância
-                best_candidates.sort(key=lambda x: x[0])
-            elif distance < best_candidates[-1][0]:
-                # Candidato melhor que o pior da lista
-                best_candidates.append((distance, candidate))
-                best_candidates.sort(key=lambda x: x[0])
-                # Remove o pior candidato (último da lista ordenada)
-                best_candidates = best_candidates[:k]
+    if search_space_size <= limit and search_space_size * len(strings) <= work_limit:
+        n_symbols = len(alphabet)
+        mismatch = _block_mismatch(strings, alphabet, l, r)
+        chunk = max(1, _ENUM_CHUNK_BYTES // (8 * max(1, len(strings))))
+
+        best_scores = np.empty(0, dtype=np.int64)
+        best_index = np.empty(0, dtype=np.int64)
+        for start in range(0, search_space_size, chunk):
+            index = np.arange(start, min(start + chunk, search_space_size))
+
+            # Dígitos na base |Σ| (posição 0 mais significativa, como product)
+            distances = np.zeros((len(index), len(strings)), dtype=np.int64)
+            rest = index.copy()
+            for position in range(m - 1, -1, -1):
+                distances += mismatch[position][rest % n_symbols]
+                rest //= n_symbols
+            scores = distances.max(axis=1)
+
+            # Os melhores até aqui vêm antes: empates ficam com o mais antigo
+            scores = np.concatenate([best_scores, scores])
+            index = np.concatenate([best_index, index])
+            keep = _stable_top_k(scores, k)
+            best_scores, best_index = scores[keep], index[keep]
+
+        for distance, code in zip(best_scores.tolist(), best_index.tolist()):
+            chars = []
+            for _ in range(m):
+                code, digit = divmod(code, n_symbols)
+                chars.append(alphabet[digit])
+            best_candidates.append((distance, "".join(reversed(chars))))
 
     # ESTRATÉGIA 2: FALLBACK (para blocos grandes)
     else:
@@ -421,8 +448,10 @@ def _beam_search_block(
     1. **INICIALIZAÇÃO**: Começa com prefixo vazio
     2. **CONSTRUÇÃO INCREMENTAL**: Para cada posição do bloco:
        - Estende cada prefixo atual com todos os caracteres do alfabeto
-       - Avalia cada extensão baseada na distância parcial
-       - Mantém apenas os beam_width melhores prefixos
+       - Avalia cada extensão baseada na distância parcial, atualizando o
+         vetor de distâncias por string do prefixo (todas as extensões do
+         beam em uma única operação NumPy)
+       - Mantém apenas os beam_width melhores prefixos (seleção parcial)
     3. **PODA**: Remove prefixos piores, mantendo apenas os promissores
     4. **AVALIAÇÃO FINAL**: Calcula distância completa dos candidatos finais
 
@@ -473,53 +502,154 @@ def _beam_search_block(
     """
     m = r - l  # Tamanho do bloco
     beam = [""]  # Lista de prefixos atuais, inicializada com string vazia
+    n_symbols = len(alphabet)
+    mismatch = _block_mismatch(strings, alphabet, l, r)
+
+    # Cada prefixo do beam carrega seu vetor de distâncias parciais para as
+    # strings, então estender por um símbolo custa O(n)
+    distances = np.zeros((1, len(strings)), dtype=np.int64)
+    scores = distances.max(axis=1)
 
     # CONSTRUÇÃO INCREMENTAL: Posição por posição
     for position in range(m):
-        # Lista para armazenar todos os prefixos estendidos com sua avaliação
-        extended_prefixes = []
-
-        # Para cada prefixo atual no beam
-        for current_prefix in beam:
-            # Tenta estender com cada caractere do alfabeto
-            for char in alphabet:
-                # Cria novo prefixo estendido
-                extended_prefix = current_prefix + char
-
-                # AVALIAÇÃO PARCIAL: Calcula distância do prefixo para os segmentos
-                partial_distances = []
-                for s in strings:
-                    # Conta mismatches apenas nas posições já construídas
-                    mismatch_count = 0
-                    for i, prefix_char in enumerate(extended_prefix):
-                        if i < len(extended_prefix) and prefix_char != s[l + i]:
-                            mismatch_count += 1
-                    partial_distances.append(mismatch_count)
-
-                # Usa distância máxima como critério de avaliação
-                partial_score = max(partial_distances)
-                extended_prefixes.append((partial_score, extended_prefix))
+        # Todas as extensões (prefixo x símbolo) de uma vez: (beam, |Σ|, n),
+        # na ordem prefixo-major / símbolo-minor
+        extended = (distances[:, None, :] + mismatch[position][None, :, :]).reshape(
+            -1, len(strings)
+        )
+        # AVALIAÇÃO PARCIAL: distância máxima do prefixo estendido
+        extended_scores = extended.max(axis=1)
 
         # PODA: Mantém apenas os beam_width melhores prefixos
-        # Ordena por score crescente (menor distância = melhor)
-        extended_prefixes.sort(key=lambda x: x[0])
-
-        # Extrai apenas os prefixos dos beam_width melhores
-        beam = [prefix for _, prefix in extended_prefixes[:beam_width]]
-
-    # AVALIAÇÃO FINAL: Calcula distância completa para candidatos finais
-    # Necessário porque avaliação parcial pode não refletir qualidade final
-    final_candidates = []
-    for candidate in beam:
-        # Extrai segmentos correspondentes de todas as strings
-        block_segments = [s[l:r] for s in strings]
-        # Calcula distância máxima real
-        final_distance = max_distance(candidate, block_segments)
-        final_candidates.append((final_distance, candidate))
+        keep = _stable_top_k(extended_scores, beam_width)
+        beam = [beam[i // n_symbols] + alphabet[i % n_symbols] for i in keep]
+        distances = extended[keep]
+        scores = extended_scores[keep]
 
+    # AVALIAÇÃO FINAL: ao fim do bloco a distância parcial é a distância real
     # SELEÇÃO DOS K MELHORES
-    final_candidates.sort(key=lambda x: x[0])
-    return [candidate for _, candidate in final_candidates[:k]]
+    return [beam[i] for i in _stable_top_k(scores, k)]
+
+
+def _block_mismatch(
+    strings: Sequence[String], alphabet: str, l: int, r: int
+) -> np.ndarray:
+    """
+    Tabela de mismatches do bloco: ``[p, a, j] = alphabet[a] != strings[j][l+p]``.
+
+    Returns:
+        np.ndarray: Matriz booleana (r-l, |Σ|, n)
+    """
+    codes = np.array([ord(c) for c in alphabet], dtype=np.int64)
+    columns = np.array([[ord(c) for c in s[l:r]] for s in strings], dtype=np.int64)
+    return codes[None, :, None] != columns.T.reshape(r - l, 1, len(strings))
+
+
+def _stable_top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    Índices dos k menores scores, com empates na ordem original.
+
+    Equivale a ordenar de forma estável e truncar, mas usa ``np.partition``
+    para não ordenar todos os candidatos.
+    """
+    if k <= 0:
+        return np.empty(0, dtype=np.int64)
+    if k < len(scores):
+        threshold = np.partition(scores, k - 1)[k - 1]
+        below = np.flatnonzero(scores < threshold)
+        ties = np.flatnonzero(scores == threshold)[: k - len(below)]
+        selected = np.concatenate([below, ties])
+        selected.sort()
+    else:
+        selected = np.arange(len(scores))
+    return selected[np.argsort(scores[selected], kind="stable")]
+
+
+# ---------------------------------------------------------------------------
+# Resolução de um bloco (sequencial ou em processos)
+# ---------------------------------------------------------------------------
+
+# Estado somente leitura dos processos worker do Smart-Core
+_WORKER_STATE: dict = {}
+
+
+def _solve_block(
+    strings: Sequence[String], alphabet: str, l: int, r: int, params: dict
+) -> tuple[list[String], dict]:
+    """
+    Mede a dificuldade de um bloco e gera seus candidatos.
+
+    Args:
+        strings (Sequence[String]): Strings de entrada.
+        alphabet (str): Alfabeto.
+        l (int): Posição inicial do bloco (inclusiva).
+        r (int): Posição final do bloco (exclusiva).
+        params (dict): Parâmetros do H³-CSP.
+
+    Returns:
+        tuple[list[String], dict]: Candidatos do bloco e informações
+            (dificuldade, técnica usada, tempo em segundos).
+    """
+    start_time = time.time()
+    k = params["k_candidates"]  # Número de candidatos por bloco
+    beam_width = params["beam_width"]  # Largura do beam search
+
+    # FASE 1: MEDIÇÃO DE DIFICULDADE
+    # Calcula d_b: distância máxima do consenso para os segmentos
+    block_consensus = consensus_block(strings, l, r)
+    block_segments = [s[l:r] for s in strings]
+    block_difficulty = max_distance(block_consensus, block_segments)
+
+    # FASE 2: SELEÇÃO ADAPTATIVA DE TÉCNICA
+    if block_difficulty <= params["block_small"]:
+        # BLOCO FÁCIL: Busca exaustiva
+        technique = "exhaustive"
+        candidates = _exhaustive_block(
+            strings,
+            alphabet,
+            l,
+            r,
+            k,
+            params["exhaustive_limit"],
+            params["exhaustive_work_limit"],
+        )
+    elif block_difficulty <= params["block_medium"]:
+        # BLOCO MÉDIO: Beam search reduzido
+        technique = "beam_reduced"
+        candidates = _beam_search_block(strings, alphabet, l, r, beam_width // 2, k)
+    else:
+        # BLOCO DIFÍCIL: Beam search completo
+        technique = "beam_full"
+        candidates = _beam_search_block(strings, alphabet, l, r, beam_width, k)
+
+    # FASE 3: VALIDAÇÃO
+    # Garante que temos pelo menos um candidato (fallback)
+    if not candidates:
+        logger.warning("Bloco [%d:%d]: sem candidatos, usando consenso", l, r)
+        candidates = [block_consensus]
+
+    return candidates, {
+        "difficulty": block_difficulty,
+        "technique": technique,
+        "seconds": time.time() - start_time,
+    }
+
+
+def _init_block_worker(strings: list[String], alphabet: str, params: dict) -> None:
+    """Inicializa um processo worker com as strings de entrada."""
+    _WORKER_STATE.update(strings=strings, alphabet=alphabet, params=params)
+
+
+def _solve_block_task(block: Block) -> tuple[list[String], dict]:
+    """Resolve um bloco no processo worker."""
+    l, r = block
+    return _solve_block(
+        _WORKER_STATE["strings"],
+        _WORKER_STATE["alphabet"],
+        l,
+        r,
+        _WORKER_STATE["params"],
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -540,10 +670,8 @@ def _local_search(candidate: String, strings: Sequence[String]) -> String:
     1. **PREPARAÇÃO**: Converte string para lista mutável
     2. **ITERAÇÃO**: Enquanto houver melhorias:
        - Para cada posição i:
-         - Salva caractere atual
-         - Testa todas as substituições possíveis
-         - Se melhoria encontrada, mantém mudança
-         - Caso contrário, restaura caractere original
+         - Avalia cada substituição incrementalmente (O(n) por teste)
+         - Se melhoria encontrada, aplica e confirma a mudança
     3. **CONVERGÊNCIA**: Para quando nenhuma melhoria é encontrada
 
     ESTRATÉGIA DE BUSCA:
@@ -612,13 +740,16 @@ def _local_search(candidate: String, strings: Sequence[String]) -> String:
         position_chars = {s[i] for s in strings}  # Caracteres únicos na posição i
         alphabets_by_position.append(position_chars)
 
+    # Avaliador incremental: cada substituição é avaliada em O(n)
+    evaluator = IncrementalEvaluator(candidate, list(strings))
+
     # LOOP PRINCIPAL: Itera até convergir para ótimo local
     improvement_found = True
     while improvement_found:
         improvement_found = False
 
-        # Calcula fitness atual (baseline para comparação)
-        current_fitness = max_distance("".join(candidate_list), list(strings))
+        # Fitness atual (baseline para comparação)
+        current_fitness = evaluator.fitness
 
         # BUSCA SISTEMÁTICA: Testa cada posição sequencialmente
         for position in range(L):
@@ -630,22 +761,18 @@ def _local_search(candidate: String, strings: Sequence[String]) -> String:
                 if alternative_char == original_char:
                     continue
 
-                # MOVIMENTO LOCAL: Aplica mudança temporária
-                candidate_list[position] = alternative_char
-
-                # Avalia novo fitness
-                new_fitness = max_distance("".join(candidate_list), list(strings))
+                # Avalia novo fitness sem aplicar a mudança
+                new_fitness = evaluator.score(position, alternative_char)
 
                 # CRITÉRIO DE ACEITAÇÃO: Aceita se houver melhoria
                 if new_fitness < current_fitness:
                     # Melhoria encontrada: mantém mudança e atualiza baseline
+                    evaluator.apply(position, alternative_char)
+                    evaluator.commit()
+                    candidate_list[position] = alternative_char
                     current_fitness = new_fitness
                     improvement_found = True
-                    original_char = alternative_char
                     break  # Aceita primeira melhoria (estratégia gulosa)
-                else:
-                    # Sem melhoria: restaura caractere original
-                    candidate_list[position] = original_char
 
     # Converte lista de volta para string
     return "".join(candidate_list)
@@ -722,6 +849,10 @@ class H3CSP:
 
         # Divisão inicial em blocos usando a regra √L
         self.blocks = split_in_blocks(self.L)
+        # Tempos e técnicas por bloco da última execução do Smart-Core
+        self.block_stats: dict = {}
+        # Raio antes/depois da busca de fusão da última execução
+        self.fusion_stats: dict = {}
 
     def set_progress_callback(self, callback: Callable[[str], None]) -> None:
         """
@@ -796,75 +927,65 @@ class H3CSP:
         Note:
             A qualidade dos candidatos depende dos parâmetros block_small,
             block_medium e beam_width. Valores maiores produzem melhores
-            resultados mas aumentam o custo computacional.
+            resultados mas aumentam o custo computacional. Os blocos são
+            independentes: com block_workers > 1 são resolvidos em um pool de
+            processos, com o mesmo resultado da execução sequencial.
         """
-        # Extrai parâmetros de configuração
-        k = self.params["k_candidates"]  # Número de candidatos por bloco
-        small_threshold = self.params["block_small"]  # Limite para blocos fáceis
-        medium_threshold = self.params["block_medium"]  # Limite para blocos médios
-        beam_width = self.params["beam_width"]  # Largura do beam search
+        workers = self.params.get("block_workers", 1)
+        if not workers or workers < 0:
+            workers = os.cpu_count() or 1
+        workers = min(int(workers), len(self.blocks))
+
+        start_time = time.time()
+        if workers > 1:
+            # Cada processo recebe as strings uma única vez (initializer) e
+            # resolve blocos (l, r) independentes
+            chunksize = max(1, len(self.blocks) // (workers * 4))
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_block_worker,
+                initargs=(self.strings, self.alphabet, self.params),
+            ) as executor:
+                results = list(
+                    executor.map(_solve_block_task, self.blocks, chunksize=chunksize)
+                )
+        else:
+            results = [
+                _solve_block(self.strings, self.alphabet, l, r, self.params)
+                for l, r in self.blocks
+            ]
 
         # Lista para armazenar candidatos de todos os blocos
         all_block_candidates = []
+        techniques: Counter = Counter()
+        block_seconds = []
 
-        # Processa cada bloco independentemente
-        for block_index, (l, r) in enumerate(self.blocks):
-            # FASE 1: MEDIÇÃO DE DIFICULDADE
-            # Calcula consenso do bloco como baseline
-            block_consensus = consensus_block(self.strings, l, r)
-
-            # Calcula d_b: distância máxima do consenso para os segmentos
-            block_segments = [s[l:r] for s in self.strings]
-            block_difficulty = max_distance(block_consensus, block_segments)
-
-            # Log para debug/análise
+        for block_index, ((l, r), (candidates, info)) in enumerate(
+            zip(self.blocks, results)
+        ):
             logger.debug(
-                "Bloco %d [%d:%d]: d_b=%d, tamanho=%d",
+                "Bloco %d [%d:%d]: d_b=%d, tamanho=%d, técnica=%s",
                 block_index,
                 l,
                 r,
-                block_difficulty,
+                info["difficulty"],
                 r - l,
+                info["technique"],
             )
 
-            # FASE 2: SELEÇÃO ADAPTATIVA DE TÉCNICA
-            if block_difficulty <= small_threshold:
-                # BLOCO FÁCIL: Busca exaustiva
-                logger.debug("Bloco %d: usando busca exaustiva", block_index)
-                candidates = _exhaustive_block(self.strings, self.alphabet, l, r, k)
-            elif block_difficulty <= medium_threshold:
-                # BLOCO MÉDIO: Beam search reduzido
-                logger.debug("Bloco %d: usando beam search reduzido", block_index)
-                candidates = _beam_search_block(
-                    self.strings, self.alphabet, l, r, beam_width // 2, k
-                )
-            else:
-                # BLOCO DIFÍCIL: Beam search completo
-                logger.debug("Bloco %d: usando beam search completo", block_index)
-                candidates = _beam_search_block(
-                    self.strings, self.alphabet, l, r, beam_width, k
-                )
-
-            # FASE 3: VALIDAÇÃO E ARMAZENAMENTO
-            # Garante que temos pelo menos um candidato (fallback)
-            if not candidates:
-                logger.warning("Bloco %d: sem candidatos, usando consenso", block_index)
-                candidates = [block_consensus]
-
             # Armazena candidatos do bloco
             all_block_candidates.append(candidates)
-
-            # Log de progresso
-            logger.debug(
-                "Bloco %d: %d candidatos gerados, melhor distância=%d",
-                block_index,
-                len(candidates),
-                (
-                    max_distance(candidates[0], block_segments)
-                    if candidates
-                    else float("inf")
-                ),
-            )
+            techniques[info["technique"]] += 1
+            block_seconds.append(info["seconds"])
+
+        self.block_stats = {
+            "workers": workers,
+            "blocks": len(self.blocks),
+            "techniques": dict(techniques),
+            "block_seconds": block_seconds,
+            "total_block_seconds": sum(block_seconds),
+            "smart_core_seconds": time.time() - start_time,
+        }
 
         return all_block_candidates
 
@@ -960,6 +1081,104 @@ class H3CSP:
 
         return fused_result
 
+    def _fusion_search(self, block_candidates: list[list[String]]) -> list[String]:
+        """
+        Escolhe um candidato por bloco minimizando o raio global.
+
+        Beam search sobre os blocos: cada estado carrega o vetor de distâncias
+        acumuladas para cada string, e estender um estado com um candidato do
+        bloco seguinte soma o vetor de distâncias daquele candidato. Estados
+        são ordenados pelo raio parcial (máximo do vetor), com a soma como
+        desempate, e estados cujo raio parcial já excede o raio da escolha
+        gulosa (primeiro candidato de cada bloco) são podados, pois o raio só
+        cresce.
+
+        Args:
+            block_candidates (list[list[String]]): Candidatos de cada bloco,
+                na ordem de self.blocks (saída do Smart-Core).
+
+        Returns:
+            list[String]: Candidato escolhido para cada bloco. Nunca pior que
+                a escolha gulosa; com fusion_beam_width=0 é a própria escolha
+                gulosa.
+        """
+        greedy = [candidates[0] for candidates in block_candidates]
+        beam_width = self.params.get("fusion_beam_width", 0)
+        if not block_candidates:
+            self.fusion_stats = {
+                "greedy_distance": 0,
+                "fused_distance": 0,
+                "beam_width": beam_width,
+            }
+            return greedy
+
+        # Matriz codificada (uint8) do domínio; fatias por bloco são views
+        engine = HammingEngine(self.strings)
+        n = len(self.strings)
+        tie_scale = n * self.L + 1  # soma das distâncias < tie_scale
+
+        # Vetor de distâncias (k x n) de cada candidato para o seu bloco
+        block_distances = []
+        for (l, r), candidates in zip(self.blocks, block_candidates):
+            if engine.vectorized:
+                codes = np.array(
+                    [engine.code_of(c) for cand in candidates for c in cand],
+                    dtype=np.uint8,
+                ).reshape(len(candidates), r - l)
+                block_distances.append(
+                    (codes[:, None, :] != engine.matrix[None, :, l:r]).sum(axis=2)
+                )
+            else:
+                block_distances.append(
+                    np.array(
+                        [
+                            [
+                                sum(a != b for a, b in zip(cand, s[l:r]))
+                                for s in self.strings
+                            ]
+                            for cand in candidates
+                        ]
+                    )
+                )
+
+        greedy_vector = sum(d[0] for d in block_distances)
+        upper_bound = int(greedy_vector.max())
+        # Estatísticas da escolha gulosa; atualizadas se a fusão a superar
+        self.fusion_stats = {
+            "greedy_distance": upper_bound,
+            "fused_distance": upper_bound,
+            "beam_width": beam_width,
+        }
+        if not beam_width:
+            return greedy
+
+        distances = np.zeros((1, n), dtype=np.int64)
+        choices = np.zeros((1, 0), dtype=np.int64)
+        for cand_distances in block_distances:
+            k = len(cand_distances)
+            extended = (distances[:, None, :] + cand_distances[None, :, :]).reshape(
+                -1, n
+            )
+            radius = extended.max(axis=1)
+            alive = np.flatnonzero(radius <= upper_bound)
+            if not len(alive):
+                return greedy
+
+            scores = radius[alive] * tie_scale + extended[alive].sum(axis=1)
+            keep = alive[_stable_top_k(scores, beam_width)]
+            distances = extended[keep]
+            choices = np.hstack([choices[keep // k], (keep % k).reshape(-1, 1)])
+
+        best = int(np.argmin(distances.max(axis=1)))
+        fused_radius = int(distances[best].max())
+        if fused_radius >= upper_bound:
+            return greedy
+
+        self.fusion_stats["fused_distance"] = fused_radius
+        return [
+            candidates[int(c)] for candidates, c in zip(block_candidates, choices[best])
+        ]
+
     # ---------------------------------------------------------------------
 
     def run(self) -> tuple[String, int]:
@@ -1068,10 +1287,9 @@ class H3CSP:
             if self.progress_callback:
                 self.progress_callback("Fusão de blocos...")
 
-            # Seleciona melhor candidato de cada bloco (primeiro da lista ordenada)
-            best_candidates_per_block = [
-                candidates[0] for candidates in block_candidates
-            ]
+            # Busca a combinação dos k candidatos por bloco com menor raio
+            # global (beam sobre os blocos com vetores de distância)
+            best_candidates_per_block = self._fusion_search(block_candidates)
 
             # Fusiona candidatos para formar solução inicial
             center = self._fuse_blocks(best_candidates_per_block)
@@ -28,6 +28,9 @@ Uso Principal (conforme diretrizes):
     # Executa batch diretamente (arquivo .yaml/.yml)
     python main.py batches/exemplo.yaml
     python main.py configuracao.yml
+
+    # Retoma batch interrompido, pulando repetições já concluídas
+    python main.py batches/exemplo.yaml --resume 20250101_120000
     ```
 
 Comandos Específicos:
@@ -453,8 +456,8 @@ def show_datasetsave_and_exit():
     sys.exit(0)
 
 
-def execute_batch_file(batch_file: str):
-    """Executa arquivo de batch diretamente."""
+def execute_batch_file(batch_file: str, resume_session: Optional[str] = None):
+    """Executa arquivo de batch diretamente (opcionalmente retomando uma sessão)."""
     try:
         batch_path = Path(batch_file)
 
@@ -469,8 +472,10 @@ def execute_batch_file(batch_file: str):
         # Executar batch
         service = initialize_service()
         print(f"📋 Executando batch: {batch_file}...")
+        if resume_session:
+            print(f"♻️  Retomando sessão: {resume_session}")
 
-        result = service.run_batch(str(batch_path))
+        result = service.run_batch(str(batch_path), resume_session=resume_session)
         print(f"✅ Batch concluído: {result.get('summary', 'Concluído')}")
 
     except KeyboardInterrupt:
@@ -482,6 +487,13 @@ def execute_batch_file(batch_file: str):
         sys.exit(1)
 
 
+def _parse_resume_args(args: list) -> Optional[str]:
+    """Reconhece `<arquivo.yaml> --resume <sessão>` e retorna a sessão."""
+    if len(args) == 3 and args[0].endswith((".yaml", ".yml")) and args[1] == "--resume":
+        return args[2]
+    return None
+
+
 # Registrar todos os comandos da CLI
 register_commands(app, initialize_service)
 
@@ -499,6 +511,12 @@ def main(args: Optional[list] = None):
             execute_batch_file(args[0])
             return
 
+        # Arquivo de batch com retomada de sessão
+        resume_session = _parse_resume_args(args)
+        if resume_session:
+            execute_batch_file(args[0], resume_session)
+            return
+
         # Caso contrário, usar o sistema de comandos do Typer
         original_argv = sys.argv[:]
         try:
@@ -544,12 +562,14 @@ Uso:
     python main.py --algorithms      Lista algoritmos disponíveis
     python main.py --datasetsave     Gera/salva datasets
     python main.py <arquivo.yaml>    Executa batch
+    python main.py <arquivo.yaml> --resume <sessão>
+                                     Retoma batch interrompido
     python main.py <comando>         Executa comando específico
 
 Comandos disponíveis:
     test                             Teste básico do sistema
     run <algoritmo> <dataset>        Executa algoritmo em dataset
-    batch <arquivo.yaml>             Executa batch
+    batch <arquivo.yaml>             Executa batch (--resume <sessão>)
     algorithms                       Lista algoritmos
     config-info                      Mostra configuração
     sessions                         Lista sessões
@@ -574,6 +594,10 @@ Exemplos:
             else:
                 # Usar CLI normal do Typer
                 app()
+        elif _parse_resume_args(sys.argv[1:]):
+            # Arquivo de batch com retomada de sessão
+            execute_batch_file(sys.argv[1], _parse_resume_args(sys.argv[1:]))
+            sys.exit(0)
         else:
             # Usar CLI normal do Typer
             app()
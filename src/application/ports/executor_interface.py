@@ -6,7 +6,7 @@ garantindo consistência na execução de diferentes tipos de tarefas.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 from src.domain import Dataset
 
@@ -32,6 +32,16 @@ class ExecutorInterface(ABC):
         """
         pass
 
+    def get_partial_results_stream(self) -> Optional[Iterable[Dict[str, Any]]]:
+        """
+        Retorna os resultados parciais do último batch lidos do disco.
+
+        Returns:
+            Optional[Iterable[Dict[str, Any]]]: Resultados reiteráveis, ou None
+            se o salvamento parcial não estava habilitado
+        """
+        return None
+
     @abstractmethod
     def execute_optimization(
         self,
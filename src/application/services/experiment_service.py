@@ -98,12 +98,16 @@ class ExperimentService:
                 f"Erro ao atualizar configuração de logging do batch: {e}"
             )
 
-    def run_batch(self, batch_cfg: str) -> Dict[str, Any]:
+    def run_batch(
+        self, batch_cfg: str, resume_session: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         Executa experimentos em lote a partir de configuração.
 
         Args:
             batch_cfg: Caminho ou conteúdo da configuração de batch
+            resume_session: Sessão (nome ou diretório de resultados) a retomar;
+                repetições já concluídas nela não são executadas novamente
 
         Returns:
             Dict[str, Any]: Resultados consolidados do batch
@@ -127,6 +131,15 @@ class ExperimentService:
             # Atualizar configuração de logging se especificada no batch
             self._update_batch_logging(batch_config)
 
+            # Retomada exige o registro de resultados parciais da sessão
+            if resume_session:
+                result_config = batch_config.setdefault(
+                    "infrastructure", {}
+                ).setdefault("result", {})
+                result_config["save_partial_results"] = True
+                result_config["resume_session"] = resume_session
+                self._logger.info(f"Retomando sessão: {resume_session}")
+
             # Validar estrutura e determinar tipo
             task_type = ConfigurationValidator.validate_batch_structure(batch_config)
             self._logger.info(f"Tipo de task detectado: {task_type}")
@@ -174,10 +187,16 @@ class ExperimentService:
                 )
                 destination = export_config.get("destination", default_filename)
 
+                # Resultados detalhados: exportadores leem do stream em disco
+                # quando o salvamento parcial está habilitado
+                detailed_results = results.get("results_stream")
+                if detailed_results is None:
+                    detailed_results = results.get("results", [])
+
                 # Estruturar dados de export baseado no tipo de task
                 export_data = {
                     "batch_summary": consolidated_results,
-                    "detailed_results": results.get("results", []),
+                    "detailed_results": detailed_results,
                 }
 
                 # Adicionar campos específicos por tipo
@@ -431,7 +450,11 @@ class ExperimentService:
             if self._monitoring_service:
                 self._monitoring_service.finish_monitoring({"results": results})
 
-            return {"results": results}
+            # Resultados gravados em disco (salvamento parcial), se disponíveis
+            get_stream = getattr(self._executor, "get_partial_results_stream", None)
+            results_stream = get_stream() if get_stream else None
+
+            return {"results": results, "results_stream": results_stream}
         except Exception as e:
             # Mostrar erro no monitoramento
             if self._monitoring_service:
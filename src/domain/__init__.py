@@ -32,6 +32,8 @@ from .errors import (
 )
 from .metrics import (
     DistanceCalculator,
+    HammingEngine,
+    IncrementalEvaluator,
     QualityEvaluator,
     average_distance,
     consensus_strength,
@@ -39,6 +41,7 @@ from .metrics import (
     hamming_distance,
     max_distance,
     max_hamming,
+    mean_pairwise_hamming,
     median_distance,
     solution_quality,
 )
@@ -55,10 +58,13 @@ __all__ = [
     "max_hamming",
     "average_distance",
     "median_distance",
+    "mean_pairwise_hamming",
     "diversity_metric",
     "consensus_strength",
     "solution_quality",
     "DistanceCalculator",
+    "HammingEngine",
+    "IncrementalEvaluator",
     "QualityEvaluator",
     # Dataset
     "Dataset",
@@ -10,6 +10,8 @@ import random
 from abc import ABC, abstractmethod
 from typing import Any, Callable, Optional
 
+from .metrics import mean_pairwise_hamming
+
 # =============================================================================
 # REGISTRY DE ALGORITMOS
 # =============================================================================
@@ -45,6 +47,8 @@ class CSPAlgorithm(ABC):
     default_params: dict
     is_deterministic: bool = False
     supports_internal_parallel: bool = False
+    # Custo relativo esperado por célula (n*L), usado para ordenar tarefas
+    relative_cost: float = 1.0
 
     @abstractmethod
     def __init__(self, strings: list[str], alphabet: str, **params):
@@ -176,19 +180,7 @@ def mean_hamming_distance(pop: Population) -> float:
     Returns:
         float: Distância média entre pares
     """
-    if len(pop) < 2:
-        return 0.0
-
-    total_distance = 0
-    total_pairs = 0
-
-    for i in range(len(pop)):
-        for j in range(i + 1, len(pop)):
-            distance = sum(c1 != c2 for c1, c2 in zip(pop[i], pop[j]))
-            total_distance += distance
-            total_pairs += 1
-
-    return total_distance / total_pairs if total_pairs > 0 else 0.0
+    return mean_pairwise_hamming(pop)
 
 
 def mutate_multi(ind: str, alphabet: str, rng: random.Random, n: int = 2) -> str:
@@ -6,9 +6,15 @@ representando sequências de strings e metadados associados.
 Implementação pura sem dependências externas.
 """
 
+import hashlib
 import random
 from typing import Any, Dict, List, Optional
 
+from .metrics import HammingEngine, diversity_metric
+
+# Metadados derivados das sequências, calculados sob demanda e memorizados
+_DERIVED_METADATA = ("alphabet", "diversity")
+
 
 class Dataset:
     """
@@ -16,7 +22,9 @@ class Dataset:
 
     Attributes:
         sequences: Lista de strings do dataset
-        metadata: Metadados do dataset (tamanho, origem, etc.)
+        metadata: Metadados do dataset (tamanho, origem, etc.). ``alphabet`` e
+            ``diversity`` só aparecem após o primeiro acesso às propriedades
+            correspondentes, que os calculam e memorizam aqui.
     """
 
     def __init__(self, sequences: List[str], metadata: Optional[Dict[str, Any]] = None):
@@ -37,16 +45,20 @@ class Dataset:
 
         self.sequences = sequences
         self.metadata = metadata or {}
+        self._distance_engine: Optional[HammingEngine] = None
+        self._content_key: Optional[str] = None
 
-        # Inferir metadados básicos
-        self.metadata.update(
-            {
-                "n": len(sequences),
-                "L": length,
-                "alphabet": self._infer_alphabet(),
-                "diversity": self._calculate_diversity(),
-            }
-        )
+        # Metadados básicos; os derivados (herdados de outro dataset em
+        # sample/filter/from_dict) são recalculados sob demanda
+        self.metadata.update({"n": len(sequences), "L": length})
+        self._invalidate_statistics()
+
+    def _invalidate_statistics(self) -> None:
+        """Descarta metadados derivados, o motor de distâncias e a chave."""
+        for key in _DERIVED_METADATA:
+            self.metadata.pop(key, None)
+        self._distance_engine = None
+        self._content_key = None
 
     def _infer_alphabet(self) -> str:
         """Infere alfabeto a partir das sequências."""
@@ -57,23 +69,7 @@ class Dataset:
 
     def _calculate_diversity(self) -> float:
         """Calcula diversidade média do dataset."""
-        if len(self.sequences) < 2:
-            return 0.0
-
-        total_distance = 0
-        total_pairs = 0
-
-        for i in range(len(self.sequences)):
-            for j in range(i + 1, len(self.sequences)):
-                distance = sum(
-                    c1 != c2 for c1, c2 in zip(self.sequences[i], self.sequences[j])
-                )
-                total_distance += distance
-                total_pairs += 1
-
-        avg_distance = total_distance / total_pairs if total_pairs > 0 else 0
-        max_possible = len(self.sequences[0])
-        return avg_distance / max_possible if max_possible > 0 else 0
+        return diversity_metric(self.sequences)
 
     @property
     def size(self) -> int:
@@ -87,8 +83,55 @@ class Dataset:
 
     @property
     def alphabet(self) -> str:
-        """Retorna alfabeto do dataset."""
-        return self.metadata.get("alphabet", "")
+        """Retorna alfabeto do dataset (calculado no primeiro acesso)."""
+        if "alphabet" not in self.metadata:
+            self.metadata["alphabet"] = self._infer_alphabet()
+        return self.metadata["alphabet"]
+
+    @property
+    def diversity(self) -> float:
+        """Retorna diversidade média do dataset (calculada no primeiro acesso)."""
+        if "diversity" not in self.metadata:
+            self.metadata["diversity"] = self._calculate_diversity()
+        return self.metadata["diversity"]
+
+    @property
+    def column_profile(self) -> Any:
+        """
+        Retorna as contagens de cada símbolo por coluna.
+
+        Delegado ao motor de distâncias, que as calcula uma única vez;
+        a coluna ``k`` corresponde a ``distance_engine.alphabet[k]``.
+        """
+        return self.distance_engine.column_counts()
+
+    @property
+    def content_key(self) -> str:
+        """
+        Retorna chave estável (SHA-1) do conteúdo das sequências.
+
+        Calculada no primeiro acesso e reutilizada até que as sequências
+        sejam alteradas por ``add_sequence``/``remove_sequence``.
+        """
+        if self._content_key is None:
+            digest = hashlib.sha1()
+            for seq in self.sequences:
+                digest.update(seq.encode("utf-8"))
+                digest.update(b"\n")
+            self._content_key = digest.hexdigest()
+        return self._content_key
+
+    @property
+    def distance_engine(self) -> HammingEngine:
+        """
+        Retorna o motor de distâncias do dataset.
+
+        A matriz codificada é construída na primeira chamada e reutilizada
+        até que as sequências sejam alteradas.
+        """
+        if self._distance_engine is None:
+            self._distance_engine = HammingEngine(self.sequences)
+        return self._distance_engine
 
     def validate(self) -> bool:
         """
@@ -125,7 +168,7 @@ class Dataset:
             "length": self.length,
             "alphabet": self.alphabet,
             "alphabet_size": len(self.alphabet),
-            "diversity": self.metadata.get("diversity", 0),
+            "diversity": self.diversity,
             "total_characters": self.size * self.length,
             "metadata": self.metadata.copy(),
         }
@@ -167,10 +210,9 @@ class Dataset:
 
         self.sequences.append(sequence)
 
-        # Atualizar metadados
+        # Atualizar metadados (derivados são recalculados sob demanda)
         self.metadata["n"] = len(self.sequences)
-        self.metadata["alphabet"] = self._infer_alphabet()
-        self.metadata["diversity"] = self._calculate_diversity()
+        self._invalidate_statistics()
 
     def remove_sequence(self, index: int) -> str:
         """
@@ -190,10 +232,9 @@ class Dataset:
 
         removed = self.sequences.pop(index)
 
-        # Atualizar metadados
+        # Atualizar metadados (derivados são recalculados sob demanda)
         self.metadata["n"] = len(self.sequences)
-        if self.sequences:
-            self.metadata["diversity"] = self._calculate_diversity()
+        self._invalidate_statistics()
 
         return removed
 
@@ -3,10 +3,28 @@ Domínio: Métricas para Avaliação de Algoritmos CSP
 
 Este módulo contém funções e classes para cálculo de métricas de distância
 e avaliação de soluções no contexto do Closest String Problem.
-Implementação pura sem dependências externas.
+Implementação pura sem dependências externas; quando NumPy está disponível,
+o HammingEngine usa uma matriz codificada (uint8) para cálculos vetorizados.
 """
 
-from typing import List
+import random
+import threading
+from collections import Counter, OrderedDict
+from typing import Any, List, Optional, Sequence
+
+try:  # NumPy é opcional no domínio: sem ele, usa-se o caminho puro
+    import numpy as np
+except ImportError:  # pragma: no cover - depende do ambiente
+    np = None
+
+# Código reservado para caracteres fora do alfabeto do dataset (nunca coincide)
+_UNKNOWN_CODE = 255
+
+# Abaixo deste número de células (n * L) o caminho puro é mais rápido
+_VECTORIZE_MIN_CELLS = 1024
+
+# Limite de bytes da matriz booleana temporária em operações em lote
+_CHUNK_BYTES = 16 * 1024 * 1024
 
 
 def hamming_distance(str1: str, str2: str) -> int:
@@ -43,6 +61,10 @@ def max_distance(center: str, strings: List[str]) -> int:
     if not strings:
         return 0
 
+    engine = _engine_for(strings) if isinstance(center, str) else None
+    if engine is not None:
+        return engine.max_distance(center)
+
     return max(hamming_distance(center, s) for s in strings)
 
 
@@ -74,6 +96,10 @@ def average_distance(center: str, strings: List[str]) -> float:
     if not strings:
         return 0.0
 
+    engine = _engine_for(strings) if isinstance(center, str) else None
+    if engine is not None:
+        return sum(engine.distances(center)) / len(strings)
+
     total_distance = sum(hamming_distance(center, s) for s in strings)
     return total_distance / len(strings)
 
@@ -92,7 +118,11 @@ def median_distance(center: str, strings: List[str]) -> float:
     if not strings:
         return 0.0
 
-    distances = [hamming_distance(center, s) for s in strings]
+    engine = _engine_for(strings) if isinstance(center, str) else None
+    if engine is not None:
+        distances = engine.distances(center)
+    else:
+        distances = [hamming_distance(center, s) for s in strings]
     distances.sort()
 
     n = len(distances)
@@ -102,12 +132,72 @@ def median_distance(center: str, strings: List[str]) -> float:
         return float(distances[n // 2])
 
 
-def diversity_metric(strings: List[str]) -> float:
+def mean_pairwise_hamming(
+    strings: Sequence[str],
+    sample_size: Optional[int] = None,
+    seed: Optional[int] = None,
+) -> float:
+    """
+    Calcula a distância de Hamming média entre todos os pares de strings.
+
+    Usa as contagens de símbolos por coluna: em cada posição, os pares que
+    concordam são Σ c·(c-1)/2 e os demais discordam. O custo é O(n·L), sem
+    a matriz n x n x L da comparação par a par.
+
+    Args:
+        strings: Strings de mesmo comprimento
+        sample_size: Se definido e menor que o número de strings, estima a
+            média a partir de uma amostra aleatória desse tamanho
+        seed: Semente da amostragem
+
+    Returns:
+        float: Distância média entre pares (0.0 com menos de 2 strings)
+
+    Raises:
+        ValueError: Se strings têm comprimentos diferentes
+    """
+    strings = list(strings)
+    if sample_size is not None and 2 <= sample_size < len(strings):
+        strings = random.Random(seed).sample(strings, sample_size)
+
+    n = len(strings)
+    if n < 2:
+        return 0.0
+
+    L = len(strings[0])
+    if any(len(s) != L for s in strings):
+        raise ValueError("Strings devem ter mesmo comprimento")
+
+    agreeing = 0
+    alphabet = sorted(set("".join(strings)))
+    if np is not None and n * L >= _VECTORIZE_MIN_CELLS and len(alphabet) < 256:
+        table = {ord(c): chr(code) for code, c in enumerate(alphabet)}
+        matrix = np.frombuffer(
+            "".join(strings).translate(table).encode("latin-1"), dtype=np.uint8
+        ).reshape(n, L)
+        for code in range(len(alphabet)):
+            counts = np.count_nonzero(matrix == code, axis=0)
+            agreeing += int((counts * (counts - 1) // 2).sum())
+    else:
+        for column in zip(*strings):
+            agreeing += sum(c * (c - 1) // 2 for c in Counter(column).values())
+
+    pairs = n * (n - 1) // 2
+    return (pairs * L - agreeing) / pairs
+
+
+def diversity_metric(
+    strings: List[str],
+    sample_size: Optional[int] = None,
+    seed: Optional[int] = None,
+) -> float:
     """
     Calcula métrica de diversidade de um conjunto de strings.
 
     Args:
         strings: Lista de strings
+        sample_size: Tamanho da amostra para estimar a média (None = exata)
+        seed: Semente da amostragem
 
     Returns:
         float: Valor de diversidade (0-1, onde 1 é máxima diversidade)
@@ -115,21 +205,12 @@ def diversity_metric(strings: List[str]) -> float:
     if len(strings) < 2:
         return 0.0
 
-    total_distance = 0
-    total_pairs = 0
-
-    for i in range(len(strings)):
-        for j in range(i + 1, len(strings)):
-            total_distance += hamming_distance(strings[i], strings[j])
-            total_pairs += 1
-
-    if total_pairs == 0:
+    max_possible_distance = len(strings[0])
+    if max_possible_distance == 0:
         return 0.0
 
-    avg_distance = total_distance / total_pairs
-    max_possible_distance = len(strings[0]) if strings else 0
-
-    return avg_distance / max_possible_distance if max_possible_distance > 0 else 0.0
+    avg_distance = mean_pairwise_hamming(strings, sample_size, seed)
+    return avg_distance / max_possible_distance
 
 
 def consensus_strength(center: str, strings: List[str]) -> float:
@@ -175,6 +256,499 @@ def solution_quality(center: str, strings: List[str]) -> dict:
     }
 
 
+class _CodeTable(dict):
+    """Tabela de tradução char -> código; caracteres desconhecidos viram sentinela."""
+
+    def __missing__(self, key: int) -> str:
+        return chr(_UNKNOWN_CODE)
+
+
+class HammingEngine:
+    """
+    Motor de distâncias de Hamming sobre um conjunto fixo de strings.
+
+    Codifica as strings uma única vez em uma matriz ``uint8`` (n x L), com
+    códigos atribuídos pela ordem do alfabeto, e responde consultas em lote
+    com operações vetorizadas do NumPy. Sem NumPy (ou com alfabetos de 255
+    símbolos ou mais) recai no caminho puro em Python, com o mesmo contrato.
+
+    Attributes:
+        strings: Strings de referência (na ordem original)
+        n: Número de strings
+        L: Comprimento das strings
+        alphabet: Alfabeto ordenado das strings de referência
+        vectorized: True se o caminho NumPy está ativo
+    """
+
+    def __init__(self, strings: Sequence[str]):
+        """
+        Inicializa o motor codificando as strings de referência.
+
+        Args:
+            strings: Strings de referência (todas com o mesmo comprimento)
+
+        Raises:
+            ValueError: Se não houver strings ou os comprimentos diferirem
+        """
+        self.strings = list(strings)
+        if not self.strings:
+            raise ValueError("HammingEngine requer ao menos uma string")
+
+        self.L = len(self.strings[0])
+        if any(len(s) != self.L for s in self.strings):
+            raise ValueError("Todas as strings devem ter mesmo comprimento")
+
+        self.n = len(self.strings)
+        self.alphabet = "".join(sorted(set("".join(self.strings))))
+        self.vectorized = np is not None and len(self.alphabet) < _UNKNOWN_CODE
+
+        self._table = _CodeTable(
+            {ord(c): chr(code) for code, c in enumerate(self.alphabet)}
+        )
+        self._matrix = self._encode_many(self.strings) if self.vectorized else None
+        self._columns: Any = None
+        self._column_counts: Any = None
+
+    @property
+    def matrix(self) -> Any:
+        """Matriz codificada (n x L, uint8) ou None no caminho puro."""
+        return self._matrix
+
+    @property
+    def columns(self) -> Any:
+        """
+        Colunas das strings de referência (uma por posição).
+
+        Returns:
+            numpy.ndarray (L x n, uint8, contígua) no caminho vetorizado;
+            lista de L strings de comprimento n no caminho puro
+        """
+        if self._columns is None:
+            if self.vectorized:
+                self._columns = np.ascontiguousarray(self._matrix.T)
+            else:
+                self._columns = [
+                    "".join(s[pos] for s in self.strings) for pos in range(self.L)
+                ]
+        return self._columns
+
+    def code_of(self, char: str) -> int:
+        """Retorna o código de um caractere (sentinela se fora do alfabeto)."""
+        return ord(self._table[ord(char)])
+
+    def encode(self, candidate: str) -> Any:
+        """
+        Codifica uma string no mesmo esquema da matriz de referência.
+
+        Args:
+            candidate: String a codificar
+
+        Returns:
+            numpy.ndarray: Vetor uint8 de comprimento L
+        """
+        self._check_length(candidate)
+        return np.frombuffer(
+            candidate.translate(self._table).encode("latin-1"), dtype=np.uint8
+        )
+
+    def decode(self, codes: Sequence[int]) -> str:
+        """
+        Converte um vetor de códigos de volta para string.
+
+        Args:
+            codes: Códigos no esquema do motor
+
+        Returns:
+            str: String decodificada
+        """
+        return "".join(self.alphabet[int(code)] for code in codes)
+
+    def distances(self, center: str) -> List[int]:
+        """
+        Calcula a distância de um centro para cada string de referência.
+
+        Args:
+            center: String central
+
+        Returns:
+            List[int]: Distâncias na ordem das strings de referência
+        """
+        if not self.vectorized:
+            return [hamming_distance(center, s) for s in self.strings]
+
+        encoded = self.encode(center)
+        return (self._matrix != encoded).sum(axis=1).tolist()
+
+    def max_distance(self, center: str) -> int:
+        """
+        Calcula a distância máxima de um centro para as strings de referência.
+
+        Args:
+            center: String central
+
+        Returns:
+            int: Distância máxima
+        """
+        if not self.vectorized:
+            return max(hamming_distance(center, s) for s in self.strings)
+
+        encoded = self.encode(center)
+        return int((self._matrix != encoded).sum(axis=1).max())
+
+    def max_distance_many(self, candidates: Sequence[str]) -> List[int]:
+        """
+        Calcula a distância máxima de vários candidatos em lote.
+
+        Args:
+            candidates: Strings candidatas (comprimento L)
+
+        Returns:
+            List[int]: Distância máxima de cada candidato, na ordem recebida
+        """
+        candidates = list(candidates)
+        if not candidates:
+            return []
+
+        if not self.vectorized:
+            return [self.max_distance(c) for c in candidates]
+
+        for candidate in candidates:
+            self._check_length(candidate)
+        encoded = self._encode_many(candidates)
+
+        result = np.empty(len(candidates), dtype=np.int64)
+        step = self._rows_per_chunk()
+        for start in range(0, len(candidates), step):
+            block = encoded[start : start + step]
+            mismatches = block[:, None, :] != self._matrix[None, :, :]
+            result[start : start + step] = mismatches.sum(axis=2).max(axis=1)
+
+        return result.tolist()
+
+    def distance_matrix(self, dtype: Any = None) -> Any:
+        """
+        Calcula a matriz de distâncias par a par entre as strings de referência.
+
+        No caminho vetorizado as concordâncias são contadas por produto de
+        matrizes one-hot em float32 (uma por símbolo, exatas até 2^24),
+        processando as colunas em lotes de memória limitada; a distância é
+        L menos as concordâncias.
+
+        Args:
+            dtype: Tipo da matriz retornada (padrão int32). float32 é aceito
+                diretamente pelo DBSCAN com ``metric="precomputed"``; uint16
+                economiza memória.
+
+        Returns:
+            numpy.ndarray (n x n) no caminho vetorizado; lista de listas
+            no caminho puro
+
+        Raises:
+            ValueError: Se o tipo inteiro não comporta o comprimento das strings
+        """
+        if not self.vectorized:
+            return [
+                [hamming_distance(s1, s2) for s2 in self.strings] for s1 in self.strings
+            ]
+
+        dtype = np.dtype(np.int32 if dtype is None else dtype)
+        if dtype.kind in "iu" and self.L > np.iinfo(dtype).max:
+            raise ValueError(f"dtype {dtype} não comporta distâncias até {self.L}")
+
+        matches = np.zeros((self.n, self.n), dtype=np.float32)
+        step = max(1, _CHUNK_BYTES // (4 * self.n))
+        for start in range(0, self.L, step):
+            block = self._matrix[:, start : start + step]
+            for code in range(len(self.alphabet)):
+                onehot = (block == code).astype(np.float32)
+                matches += onehot @ onehot.T
+
+        return (self.L - matches).astype(dtype, copy=False)
+
+    def column_counts(self) -> Any:
+        """
+        Conta as ocorrências de cada símbolo do alfabeto em cada coluna.
+
+        Returns:
+            numpy.ndarray (L x |alfabeto|, int32) no caminho vetorizado; lista
+            de listas no caminho puro. A coluna ``k`` corresponde a
+            ``alphabet[k]``.
+        """
+        if self._column_counts is None:
+            if self.vectorized:
+                counts = np.zeros((self.L, len(self.alphabet)), dtype=np.int32)
+                for code in range(len(self.alphabet)):
+                    counts[:, code] = (self._matrix == code).sum(axis=0)
+            else:
+                index = {c: k for k, c in enumerate(self.alphabet)}
+                counts = [[0] * len(self.alphabet) for _ in range(self.L)]
+                for s in self.strings:
+                    for pos, c in enumerate(s):
+                        counts[pos][index[c]] += 1
+            self._column_counts = counts
+
+        return self._column_counts
+
+    def column_mismatch_counts(self) -> Any:
+        """
+        Conta, por coluna e símbolo, quantas strings diferem daquele símbolo.
+
+        ``column_mismatch_counts()[j][k]`` é o acréscimo na soma das distâncias
+        ao fixar ``alphabet[k]`` na posição ``j`` do centro.
+
+        Returns:
+            numpy.ndarray (L x |alfabeto|, int32) no caminho vetorizado; lista
+            de listas no caminho puro
+        """
+        counts = self.column_counts()
+        if self.vectorized:
+            return self.n - counts
+        return [[self.n - c for c in row] for row in counts]
+
+    def _check_length(self, candidate: str) -> None:
+        """Valida o comprimento de um candidato."""
+        if len(candidate) != self.L:
+            raise ValueError("Strings devem ter mesmo comprimento")
+
+    def _encode_many(self, strings: Sequence[str]) -> Any:
+        """Codifica várias strings de comprimento L em uma matriz uint8."""
+        raw = "".join(strings).translate(self._table).encode("latin-1")
+        return np.frombuffer(raw, dtype=np.uint8).reshape(len(strings), self.L)
+
+    def _rows_per_chunk(self) -> int:
+        """Linhas por bloco para limitar a matriz booleana temporária."""
+        return max(1, _CHUNK_BYTES // max(1, self.n * self.L))
+
+
+# Abaixo deste número de strings o avaliador incremental usa listas Python
+_INCREMENTAL_MIN_STRINGS = 32
+
+
+def _as_engine(strings: Any) -> HammingEngine:
+    """Reutiliza um HammingEngine existente ou em cache, ou cria um novo."""
+    if isinstance(strings, HammingEngine):
+        return strings
+    return _engine_for(strings) or HammingEngine(strings)
+
+
+class IncrementalEvaluator:
+    """
+    Avaliador incremental (delta) de fitness para buscas locais.
+
+    Mantém o vetor de distâncias do centro atual para cada string de
+    referência. Avaliar a troca do símbolo de uma posição custa O(n) em vez
+    de O(n * L); mudanças aplicadas ficam em um diário e podem ser
+    confirmadas (commit) ou desfeitas (rollback).
+
+    Example:
+        >>> ev = IncrementalEvaluator("AAAA", ["ACGT", "AGGT"])
+        >>> ev.fitness, ev.score(2, "G")
+        (3, 2)
+        >>> ev.apply(2, "G")
+        >>> ev.commit()
+        >>> ev.center
+        'AAGA'
+    """
+
+    def __init__(self, center: str, strings: Any):
+        """
+        Inicializa o avaliador para um centro.
+
+        Args:
+            center: String central inicial
+            strings: Strings de referência ou um HammingEngine já construído
+
+        Raises:
+            ValueError: Se o centro tiver comprimento diferente das strings
+        """
+        self.engine = _as_engine(strings)
+        self.engine._check_length(center)
+
+        self._center = list(center)
+        self._journal: List[tuple] = []
+        self._vectorized = (
+            self.engine.vectorized and self.engine.n >= _INCREMENTAL_MIN_STRINGS
+        )
+
+        if self._vectorized:
+            self._columns = self.engine.columns
+            codes = self.engine.encode(center)
+            self._mismatch = self._columns != codes[:, None]
+            self._dist = self._mismatch.sum(axis=0, dtype=np.int32)
+            self._max = int(self._dist.max())
+        else:
+            self._columns = [
+                "".join(s[pos] for s in self.engine.strings)
+                for pos in range(self.engine.L)
+            ]
+            self._mismatch = [
+                [int(c != ch) for c in column]
+                for column, ch in zip(self._columns, self._center)
+            ]
+            self._dist = [hamming_distance(center, s) for s in self.engine.strings]
+            self._max = max(self._dist)
+
+    @property
+    def center(self) -> str:
+        """Centro atual (incluindo mudanças ainda não confirmadas)."""
+        return "".join(self._center)
+
+    @property
+    def fitness(self) -> int:
+        """Distância máxima do centro atual."""
+        return self._max
+
+    @property
+    def distances(self) -> List[int]:
+        """Distâncias do centro atual para cada string de referência."""
+        if self._vectorized:
+            return self._dist.tolist()
+        return list(self._dist)
+
+    def score(self, pos: int, char: str) -> int:
+        """
+        Avalia, sem aplicar, a troca do símbolo na posição ``pos``.
+
+        Args:
+            pos: Posição a alterar
+            char: Novo símbolo
+
+        Returns:
+            int: Distância máxima resultante
+        """
+        if char == self._center[pos]:
+            return self._max
+
+        if self._vectorized:
+            code = self.engine.code_of(char)
+            delta = (self._columns[pos] != code).astype(np.int32) - self._mismatch[pos]
+            return int((self._dist + delta).max())
+
+        return max(
+            d - m + (c != char)
+            for d, m, c in zip(self._dist, self._mismatch[pos], self._columns[pos])
+        )
+
+    def score_changes(self, changes: Sequence[tuple]) -> int:
+        """
+        Avalia, sem aplicar, um conjunto de trocas em posições distintas.
+
+        Args:
+            changes: Pares (posição, novo símbolo)
+
+        Returns:
+            int: Distância máxima resultante
+        """
+        changes = [(pos, ch) for pos, ch in changes if ch != self._center[pos]]
+        if not changes:
+            return self._max
+        if len(changes) == 1:
+            return self.score(*changes[0])
+
+        if self._vectorized:
+            new_dist = self._dist.copy()
+            for pos, ch in changes:
+                new_dist += self._columns[pos] != self.engine.code_of(ch)
+                new_dist -= self._mismatch[pos]
+            return int(new_dist.max())
+
+        new_dist = list(self._dist)
+        for pos, ch in changes:
+            for k, (m, c) in enumerate(zip(self._mismatch[pos], self._columns[pos])):
+                new_dist[k] += (c != ch) - m
+        return max(new_dist)
+
+    def apply(self, pos: int, char: str) -> None:
+        """
+        Aplica a troca do símbolo na posição ``pos`` (registrada no diário).
+
+        Args:
+            pos: Posição a alterar
+            char: Novo símbolo
+        """
+        old = self._center[pos]
+        if char == old:
+            return
+        self._journal.append((pos, old))
+        self._set(pos, char)
+
+    def apply_changes(self, changes: Sequence[tuple]) -> None:
+        """Aplica um conjunto de trocas (posição, símbolo) em sequência."""
+        for pos, ch in changes:
+            self.apply(pos, ch)
+
+    def commit(self) -> None:
+        """Confirma as mudanças aplicadas desde o último commit/rollback."""
+        self._journal.clear()
+
+    def rollback(self) -> None:
+        """Desfaz as mudanças aplicadas desde o último commit/rollback."""
+        while self._journal:
+            pos, old = self._journal.pop()
+            self._set(pos, old)
+
+    def _set(self, pos: int, char: str) -> None:
+        """Troca o símbolo de uma posição atualizando distâncias e máximo."""
+        self._center[pos] = char
+
+        if self._vectorized:
+            new_row = self._columns[pos] != self.engine.code_of(char)
+            self._dist += new_row
+            self._dist -= self._mismatch[pos]
+            self._mismatch[pos] = new_row
+            self._max = int(self._dist.max())
+            return
+
+        new_row = [int(c != char) for c in self._columns[pos]]
+        self._dist = [
+            d - m + n for d, m, n in zip(self._dist, self._mismatch[pos], new_row)
+        ]
+        self._mismatch[pos] = new_row
+        self._max = max(self._dist)
+
+
+# Cache LRU de motores para as funções de módulo (max_distance etc.)
+_ENGINE_CACHE: "OrderedDict[tuple, HammingEngine]" = OrderedDict()
+_ENGINE_CACHE_SIZE = 8
+_ENGINE_LOCK = threading.Lock()
+
+
+def _engine_for(strings: Sequence[str]) -> Any:
+    """
+    Obtém um HammingEngine vetorizado para as strings, se compensar.
+
+    Retorna None quando NumPy não está disponível, o problema é pequeno
+    demais ou as strings não podem ser codificadas; nesses casos o chamador
+    usa o caminho puro.
+    """
+    if np is None or not isinstance(strings[0], str):
+        return None
+    if len(strings) * len(strings[0]) < _VECTORIZE_MIN_CELLS:
+        return None
+
+    try:
+        key = tuple(strings)
+        with _ENGINE_LOCK:
+            engine = _ENGINE_CACHE.get(key)
+            if engine is not None:
+                _ENGINE_CACHE.move_to_end(key)
+                return engine
+
+        engine = HammingEngine(key)
+    except (TypeError, ValueError):
+        return None
+
+    if not engine.vectorized:
+        return None
+
+    with _ENGINE_LOCK:
+        _ENGINE_CACHE[key] = engine
+        while len(_ENGINE_CACHE) > _ENGINE_CACHE_SIZE:
+            _ENGINE_CACHE.popitem(last=False)
+
+    return engine
+
+
 class DistanceCalculator:
     """Calculadora de distâncias com cache para otimização."""
 
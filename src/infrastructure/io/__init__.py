@@ -5,10 +5,24 @@ Implementações para entrada e saída de dados.
 """
 
 from .exporters import CsvExporter, FileExporter, JsonExporter, TxtExporter
+from .partial_results import (
+    PartialResultsStream,
+    PartialResultsWriter,
+    iter_partial_results,
+    iter_partial_results_ordered,
+    load_partial_results,
+    rewrite_partial_results,
+)
 
 __all__ = [
     "FileExporter",
     "CsvExporter",
     "JsonExporter",
     "TxtExporter",
+    "PartialResultsWriter",
+    "PartialResultsStream",
+    "iter_partial_results",
+    "iter_partial_results_ordered",
+    "load_partial_results",
+    "rewrite_partial_results",
 ]
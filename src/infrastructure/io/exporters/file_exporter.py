@@ -7,10 +7,84 @@ Implementa a interface ExportPort e fornece funcionalidade comum para todos os e
 import csv
 import json
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 from src.application.ports import ExportPort
 
+from ..partial_results import PartialResultsStream
+
+# Profundidade máxima em que streams de resultados são procurados nos dados
+_STREAM_SEARCH_DEPTH = 4
+
+
+# Indentação do JSON exportado
+_JSON_INDENT = 2
+
+
+class _LazyJsonList(list):
+    """Lista que percorre sob demanda uma fonte reiterável (CSV em duas passadas)."""
+
+    def __init__(self, source: Iterable[Any]):
+        super().__init__()
+        self._source = source
+
+    def __iter__(self):
+        return iter(self._source)
+
+    def __bool__(self) -> bool:
+        return next(iter(self._source), None) is not None
+
+
+def _dump_json(data: Any, f, level: int = 0, depth: int = _STREAM_SEARCH_DEPTH) -> None:
+    """
+    Escreve ``data`` em JSON indentado, com a mesma saída de ``json.dump``.
+
+    Streams de resultados (até ``depth`` níveis) são escritos explicitamente
+    como ``[``, um ``json.dumps`` por registro lido do disco, e ``]``; os
+    demais valores são serializados de uma vez.
+    """
+    if isinstance(data, PartialResultsStream):
+        entries = ((None, item, 0) for item in data)
+    elif (
+        depth > 0
+        and isinstance(data, dict)
+        and all(isinstance(key, str) for key in data)
+    ):
+        entries = ((key, value, depth - 1) for key, value in data.items())
+    elif depth > 0 and isinstance(data, (list, tuple)):
+        entries = ((None, value, depth - 1) for value in data)
+    else:
+        text = json.dumps(data, indent=_JSON_INDENT, ensure_ascii=False, default=str)
+        f.write(text.replace("\n", "\n" + " " * (_JSON_INDENT * level)))
+        return
+
+    opening, closing = ("{", "}") if isinstance(data, dict) else ("[", "]")
+    separator = "\n" + " " * (_JSON_INDENT * (level + 1))
+    f.write(opening)
+    empty = True
+    for key, value, child_depth in entries:
+        f.write(separator if empty else "," + separator)
+        empty = False
+        if key is not None:
+            f.write(json.dumps(key, ensure_ascii=False) + ": ")
+        _dump_json(value, f, level + 1, child_depth)
+    if not empty:
+        f.write("\n" + " " * (_JSON_INDENT * level))
+    f.write(closing)
+
+
+def _replace_streams(data: Any, convert, depth: int = _STREAM_SEARCH_DEPTH) -> Any:
+    """Substitui streams de resultados (até ``depth`` níveis) via ``convert``."""
+    if isinstance(data, PartialResultsStream):
+        return convert(data)
+    if depth <= 0:
+        return data
+    if isinstance(data, dict):
+        return {k: _replace_streams(v, convert, depth - 1) for k, v in data.items()}
+    if isinstance(data, list):
+        return [_replace_streams(v, convert, depth - 1) for v in data]
+    return data
+
 
 class FileExporter(ExportPort):
     """Exportador base para arquivos."""
@@ -49,9 +123,17 @@ class FileExporter(ExportPort):
         return str(dest_path)
 
     def export_batch_results(
-        self, batch_results: List[Dict[str, Any]], format_type: str, destination: str
+        self,
+        batch_results: Iterable[Dict[str, Any]],
+        format_type: str,
+        destination: str,
     ) -> str:
-        """Exporta resultados de batch."""
+        """
+        Exporta resultados de batch.
+
+        ``batch_results`` pode ser uma lista ou um ``PartialResultsStream``;
+        neste caso os resultados são lidos do disco durante a escrita.
+        """
         dest_path = self.output_path / destination
 
         # Se destination é um diretório, usar nome de arquivo fixo
@@ -62,14 +144,21 @@ class FileExporter(ExportPort):
 
         dest_path.parent.mkdir(parents=True, exist_ok=True)
 
+        # Uma única passada: batch_results pode ser um stream lido do disco
+        total = successful = failed = 0
+        for r in batch_results:
+            total += 1
+            if r.get("status") == "success":
+                successful += 1
+            elif r.get("status") == "error":
+                failed += 1
+
         batch_data = {
             "batch_results": batch_results,
             "summary": {
-                "total_experiments": len(batch_results),
-                "successful": sum(
-                    1 for r in batch_results if r.get("status") == "success"
-                ),
-                "failed": sum(1 for r in batch_results if r.get("status") == "error"),
+                "total_experiments": total,
+                "successful": successful,
+                "failed": failed,
             },
         }
 
@@ -110,10 +199,14 @@ class FileExporter(ExportPort):
     def _write_json(self, data: Any, dest_path: Path) -> None:
         """Escreve dados em formato JSON."""
         with open(dest_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+            _dump_json(data, f)
 
     def _write_csv(self, data: Any, dest_path: Path) -> None:
         """Escreve dados em formato CSV."""
+        if isinstance(data, PartialResultsStream):
+            # Duas passadas sobre o disco: cabeçalho e linhas
+            data = _LazyJsonList(data)
+
         if isinstance(data, list) and data:
             # Assumir lista de dicionários
             fieldnames = set()
@@ -142,6 +235,7 @@ class FileExporter(ExportPort):
 
     def _write_txt(self, data: Any, dest_path: Path) -> None:
         """Escreve dados em formato texto."""
+        data = _replace_streams(data, list)
         with open(dest_path, "w", encoding="utf-8") as f:
             if isinstance(data, (list, tuple)):
                 for item in data:
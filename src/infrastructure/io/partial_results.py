@@ -0,0 +1,273 @@
+"""
+Resultados Parciais em Streaming
+
+Grava resultados parciais em JSON Lines (um resultado por linha) através de
+uma thread de escrita em segundo plano, com fsync em lotes. A leitura
+reconstrói a lista de resultados tolerando uma última linha truncada,
+como a deixada por um processo interrompido no meio da escrita.
+
+O arquivo fica em ordem de conclusão; ``PartialResultsStream`` o percorre
+na ordem das tarefas do batch (campo ``task_index``).
+"""
+
+import json
+import os
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+from src.infrastructure.logging_config import get_logger
+
+_STOP = object()
+
+
+class PartialResultsWriter:
+    """
+    Escritor assíncrono de resultados parciais em JSON Lines.
+
+    Cada chamada a ``write`` apenas enfileira o resultado; a thread de
+    escrita serializa uma linha por resultado e executa ``fsync`` a cada
+    ``fsync_every`` registros ou ``fsync_interval`` segundos.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        fsync_every: int = 32,
+        fsync_interval: float = 2.0,
+        append: bool = False,
+    ):
+        """
+        Inicializa o escritor e inicia a thread de escrita.
+
+        Args:
+            path: Arquivo .jsonl de destino
+            fsync_every: Número de registros entre sincronizações
+            fsync_interval: Intervalo máximo (s) entre sincronizações
+            append: Se True, preserva registros já existentes no arquivo
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.fsync_every = max(1, int(fsync_every))
+        self.fsync_interval = fsync_interval
+        self.count = 0
+        self.error: Optional[Exception] = None
+        self._logger = get_logger(__name__)
+
+        if append:
+            _drop_truncated_tail(self.path)
+
+        self._queue: queue.Queue[Any] = queue.Queue()
+        self._file = open(self.path, "a" if append else "w", encoding="utf-8")
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run, name="partial-results-writer", daemon=True
+        )
+        self._thread.start()
+
+    def __enter__(self) -> "PartialResultsWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def write(self, result: Dict[str, Any]) -> None:
+        """Enfileira um resultado para gravação."""
+        if self._closed:
+            raise ValueError("PartialResultsWriter já foi fechado")
+        self.count += 1
+        self._queue.put(result)
+
+    def flush(self) -> None:
+        """Bloqueia até que todos os resultados enfileirados estejam em disco."""
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait()
+
+    def close(self) -> None:
+        """Grava os resultados pendentes, sincroniza e encerra a thread."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_STOP)
+        self._thread.join()
+        self._file.close()
+
+    def _sync(self) -> None:
+        """
+        Descarrega e sincroniza o arquivo.
+
+        Falhas (ex.: disco cheio) ficam em ``self.error``: a thread continua
+        processando a fila para que ``flush``/``close`` nunca fiquem bloqueados.
+        """
+        try:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+        except Exception as e:
+            self.error = e
+            self._logger.error(f"Erro ao sincronizar resultados parciais: {e}")
+
+    def _run(self) -> None:
+        """Laço da thread de escrita."""
+        pending = 0
+        last_sync = time.monotonic()
+
+        while True:
+            timeout = max(0.0, self.fsync_interval - (time.monotonic() - last_sync))
+            try:
+                item = self._queue.get(timeout=timeout if pending else None)
+            except queue.Empty:
+                item = None
+
+            if item is _STOP or isinstance(item, threading.Event):
+                if pending:
+                    self._sync()
+                    pending = 0
+                    last_sync = time.monotonic()
+                if item is _STOP:
+                    return
+                item.set()
+                continue
+
+            if item is not None:
+                try:
+                    line = json.dumps(item, ensure_ascii=False, default=str)
+                    self._file.write(line + "\n")
+                    pending += 1
+                except Exception as e:
+                    # Um resultado não serializável não deve derrubar o batch
+                    self.error = e
+                    self._logger.error(f"Erro ao gravar resultado parcial: {e}")
+
+            if pending and (
+                pending >= self.fsync_every
+                or time.monotonic() - last_sync >= self.fsync_interval
+            ):
+                self._sync()
+                pending = 0
+                last_sync = time.monotonic()
+
+
+def _drop_truncated_tail(path: Path) -> None:
+    """Remove uma última linha sem terminador (escrita interrompida)."""
+    if not path.exists():
+        return
+
+    with open(path, "rb+") as f:
+        size = f.seek(0, os.SEEK_END)
+        if size == 0:
+            return
+        f.seek(size - 1)
+        if f.read(1) == b"\n":
+            return
+
+        # Procurar o último terminador de linha a partir do fim
+        position = size
+        while position > 0:
+            step = min(4096, position)
+            position -= step
+            f.seek(position)
+            index = f.read(step).rfind(b"\n")
+            if index >= 0:
+                f.truncate(position + index + 1)
+                return
+        f.truncate(0)
+
+
+def iter_partial_results(path: Union[str, Path]) -> Iterator[Dict[str, Any]]:
+    """
+    Itera os resultados gravados em um arquivo JSON Lines.
+
+    Linhas vazias são ignoradas; uma última linha incompleta (escrita
+    interrompida) é descartada.
+    """
+    path = Path(path)
+    if not path.exists():
+        return
+
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                # Só pode acontecer na última linha, se a escrita foi cortada
+                continue
+
+
+def iter_partial_results_ordered(
+    path: Union[str, Path], key: str = "task_index"
+) -> Iterator[Dict[str, Any]]:
+    """
+    Itera os resultados ordenados pelo campo ``key``.
+
+    Uma primeira passada guarda apenas (chave, posição no arquivo) de cada
+    linha; os registros são relidos um a um na ordem final. Resultados sem
+    a chave (ex.: erros de carregamento de dataset) vêm primeiro, na ordem
+    do arquivo.
+    """
+    path = Path(path)
+    if not path.exists():
+        return
+
+    positions = []
+    with open(path, "rb") as f:
+        offset = 0
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                # Linha vazia ou última linha cortada
+                record = None
+            if isinstance(record, dict):
+                index = record.get(key)
+                positions.append((-1 if index is None else index, offset))
+            offset += len(line)
+
+        positions.sort()
+        for _, offset in positions:
+            f.seek(offset)
+            yield json.loads(f.readline())
+
+
+def load_partial_results(path: Union[str, Path]) -> List[Dict[str, Any]]:
+    """Reconstrói a lista completa de resultados parciais."""
+    return list(iter_partial_results(path))
+
+
+def rewrite_partial_results(
+    path: Union[str, Path], results: List[Dict[str, Any]]
+) -> None:
+    """Reescreve o arquivo de forma atômica com a lista de resultados dada."""
+    path = Path(path)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with PartialResultsWriter(tmp_path) as writer:
+        for result in results:
+            writer.write(result)
+    os.replace(tmp_path, path)
+
+
+class PartialResultsStream:
+    """
+    Visão reiterável de um arquivo de resultados parciais.
+
+    Permite que exportadores percorram os resultados diretamente do disco,
+    sem manter a lista completa em memória. A iteração segue a ordem das
+    tarefas do batch, não a ordem de conclusão gravada no arquivo.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return iter_partial_results_ordered(self.path)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in iter_partial_results(self.path))
+
+    def __repr__(self) -> str:
+        return f"PartialResultsStream({str(self.path)!r})"
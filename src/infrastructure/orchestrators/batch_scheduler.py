@@ -0,0 +1,159 @@
+"""
+Planejamento de Tarefas do Batch
+
+Expande um batch de execução em uma lista plana de repetições
+(dataset, algoritmo, parâmetros, repetição) e a ordena pelo custo esperado,
+para que as tarefas mais longas comecem primeiro e todos os workers fiquem
+ocupados até o fim do batch.
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from src.domain import Dataset
+from src.infrastructure.orchestrators.worker_pool import dataset_content_key
+
+# Identificadores do contexto que distinguem tarefas de mesmo conteúdo
+_FINGERPRINT_CONTEXT_KEYS = ("execution_name", "dataset_id", "algorithm_id")
+
+
+@dataclass
+class BatchTask:
+    """
+    Uma repetição de um algoritmo sobre um dataset.
+
+    Attributes:
+        index: Posição da tarefa na ordem original do batch
+        algorithm_name: Nome do algoritmo
+        dataset: Dataset a processar
+        params: Parâmetros do algoritmo
+        execution_context: Contexto hierárquico (execução, dataset, configuração)
+        repetition: Número da repetição (1-based)
+        total_repetitions: Total de repetições do algoritmo
+        item_id: Identificador do item no monitoramento
+        expected_cost: Custo relativo estimado
+        fingerprint: Impressão digital da tarefa, usada para retomar sessões
+            (calculada uma única vez na criação)
+    """
+
+    index: int
+    algorithm_name: str
+    dataset: Dataset
+    params: Dict[str, Any]
+    execution_context: Dict[str, Any]
+    repetition: int
+    total_repetitions: int
+    item_id: str = ""
+    expected_cost: float = 0.0
+    fingerprint: str = ""
+
+    def __post_init__(self) -> None:
+        if not self.fingerprint:
+            self.fingerprint = task_fingerprint(
+                dataset_content_key(self.dataset),
+                self.algorithm_name,
+                self.params,
+                self.repetition,
+                self.execution_context,
+            )
+
+
+def task_fingerprint(
+    dataset_key: str,
+    algorithm_name: str,
+    params: Dict[str, Any],
+    repetition: int,
+    execution_context: Optional[Dict[str, Any]] = None,
+) -> str:
+    """
+    Calcula a impressão digital de uma repetição.
+
+    Combina hash do conteúdo do dataset, algoritmo, parâmetros normalizados
+    (chaves ordenadas), repetição, seed e os identificadores de execução,
+    dataset e configuração do contexto — duas configurações com os mesmos
+    parâmetros continuam sendo tarefas distintas.
+    """
+    context = execution_context or {}
+    payload = json.dumps(
+        {
+            "context": {key: context.get(key) for key in _FINGERPRINT_CONTEXT_KEYS},
+            "dataset": dataset_key,
+            "algorithm": algorithm_name,
+            "params": params,
+            "repetition": repetition,
+            "seed": params.get("seed"),
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def estimate_task_cost(algorithm_name: str, dataset: Dataset) -> float:
+    """
+    Estima o custo relativo de uma repetição.
+
+    Usa o tamanho do dataset (n * L) ponderado pelo atributo
+    ``relative_cost`` da classe do algoritmo.
+    """
+    from algorithms import global_registry
+
+    algorithm_class = global_registry.get(algorithm_name)
+    weight = getattr(algorithm_class, "relative_cost", 1.0)
+    return float(weight) * dataset.size * dataset.length
+
+
+def build_repetition_tasks(
+    algorithm_name: str,
+    dataset: Dataset,
+    params: Dict[str, Any],
+    repetitions: int,
+    execution_context: Dict[str, Any],
+    start_index: int = 0,
+) -> List[BatchTask]:
+    """Cria as tarefas de todas as repetições de um algoritmo em um dataset."""
+    cost = estimate_task_cost(algorithm_name, dataset)
+    dataset_id = execution_context.get("dataset_id", "unknown")
+    return [
+        BatchTask(
+            index=start_index + rep,
+            algorithm_name=algorithm_name,
+            dataset=dataset,
+            params=params,
+            execution_context=execution_context,
+            repetition=rep + 1,
+            total_repetitions=repetitions,
+            item_id=f"{algorithm_name}_{dataset_id}_{rep + 1}",
+            expected_cost=cost,
+        )
+        for rep in range(repetitions)
+    ]
+
+
+def make_item_ids_unique(tasks: List[BatchTask]) -> None:
+    """
+    Garante item_id único no batch.
+
+    O mesmo algoritmo pode aparecer para o mesmo dataset em configurações
+    diferentes; como as tarefas agora rodam intercaladas, as repetições
+    seguintes recebem o ID da configuração como sufixo.
+    """
+    seen = set()
+    for task in tasks:
+        item_id = task.item_id
+        if item_id in seen:
+            algorithm_id = task.execution_context.get("algorithm_id", "")
+            item_id = f"{item_id}_{algorithm_id}"
+            suffix = 2
+            while item_id in seen:
+                item_id = f"{task.item_id}_{algorithm_id}_{suffix}"
+                suffix += 1
+            task.item_id = item_id
+        seen.add(item_id)
+
+
+def order_longest_first(tasks: List[BatchTask]) -> List[BatchTask]:
+    """Ordena por custo esperado decrescente, estável na ordem original."""
+    return sorted(tasks, key=lambda task: (-task.expected_cost, task.index))
@@ -5,19 +5,34 @@ Concentra toda a lógica de execução de algoritmos CSP,
 tanto para execuções únicas quanto batches.
 """
 
-import json
-import os
 import time
 import uuid
-from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures import as_completed
 from multiprocessing import cpu_count
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 from src.domain import Dataset
 from src.domain.errors import AlgorithmExecutionError
+from src.infrastructure.io.partial_results import (
+    PartialResultsStream,
+    PartialResultsWriter,
+    load_partial_results,
+    rewrite_partial_results,
+)
 from src.infrastructure.logging_config import get_logger
 from src.infrastructure.orchestrators.base_orchestrator import BaseOrchestrator
+from src.infrastructure.orchestrators.batch_scheduler import (
+    BatchTask,
+    build_repetition_tasks,
+    make_item_ids_unique,
+    order_longest_first,
+)
+from src.infrastructure.orchestrators.worker_pool import BatchWorkerPool
+from src.infrastructure.persistence.result_cache import (
+    ResultCache,
+    format_cache_report,
+)
 
 
 class ExecutionOrchestrator(BaseOrchestrator):
@@ -38,6 +53,12 @@ class ExecutionOrchestrator(BaseOrchestrator):
         self._executions: Dict[str, Dict[str, Any]] = {}
         self._current_batch_config: Optional[Dict[str, Any]] = None
         self._partial_results_file: Optional[str] = None
+        self._partial_results_writer: Optional[PartialResultsWriter] = None
+        self._completed_results: Dict[str, Dict[str, Any]] = {}
+        self._worker_pool: Optional[BatchWorkerPool] = None
+        self._result_cache: Optional[ResultCache] = None
+        # Progresso de cada par dataset/configuração (nível DATASET)
+        self._dataset_monitoring: Dict[Tuple[str, ...], Dict[str, Any]] = {}
         self._logger = get_logger(__name__)
 
     def execute(self, config: Dict[str, Any]) -> Dict[str, Any]:
@@ -57,6 +78,7 @@ class ExecutionOrchestrator(BaseOrchestrator):
     def set_batch_config(self, batch_config: Dict[str, Any]) -> None:
         """Define configuração do batch atual."""
         self._current_batch_config = batch_config
+        self._result_cache = None
         self._logger.debug(f"Configuração de batch definida: {type(batch_config)}")
 
         # Configurar salvamento parcial se habilitado
@@ -106,6 +128,14 @@ class ExecutionOrchestrator(BaseOrchestrator):
                 params["save_history"] = True
                 params["history_frequency"] = history_config.get("history_frequency", 1)
 
+        # Execuções reprodutíveis já calculadas são reaproveitadas do cache
+        cache = self._get_result_cache()
+        cache_key = None
+        cached = None
+        if cache is not None and ResultCache.is_cacheable(algorithm_class, params):
+            cache_key = cache.make_key(dataset, algorithm_name, algorithm_class, params)
+            cached = cache.get(cache_key)
+
         # Cria identificador único para execução
         execution_id = str(uuid.uuid4())
 
@@ -119,27 +149,49 @@ class ExecutionOrchestrator(BaseOrchestrator):
                 "params": params.copy(),
             }
 
-            # Instancia e executa algoritmo
-            algorithm = algorithm_class(
-                strings=dataset.sequences, alphabet=dataset.alphabet, **params
-            )
+            if cached is not None:
+                best_string = cached["best_string"]
+                max_distance = cached["max_distance"]
+                # Tempo reportado é o desta chamada; o da execução original
+                # fica nos metadados
+                metadata = dict(cached["metadata"] or {})
+                metadata["cache_hit"] = True
+                metadata["original_execution_time"] = cached["execution_time"]
+                elapsed = time.time() - start_time
+            else:
+                # Instancia e executa algoritmo
+                algorithm = algorithm_class(
+                    strings=dataset.sequences, alphabet=dataset.alphabet, **params
+                )
 
-            # Configurar callback de progresso se fornecido
-            if monitoring_service:
+                # Configurar callback de progresso se fornecido
+                if monitoring_service:
 
-                def progress_callback(message: str):
-                    # Usando algorithm_callback da MonitoringInterface
-                    monitoring_service.algorithm_callback(
-                        algorithm_name=algorithm_name,
-                        progress=0.5,  # Progresso genérico, algoritmo pode não informar progresso específico
-                        message=message,
-                        item_id=execution_id,
-                    )
+                    def progress_callback(message: str):
+                        # Usando algorithm_callback da MonitoringInterface
+                        monitoring_service.algorithm_callback(
+                            algorithm_name=algorithm_name,
+                            progress=0.5,  # Progresso genérico, algoritmo pode não informar progresso específico
+                            message=message,
+                            item_id=execution_id,
+                        )
 
-                algorithm.set_progress_callback(progress_callback)
+                    algorithm.set_progress_callback(progress_callback)
 
-            # Executa algoritmo
-            best_string, max_distance, metadata = algorithm.run()
+                # Executa algoritmo
+                best_string, max_distance, metadata = algorithm.run()
+                elapsed = time.time() - start_time
+
+                if cache_key is not None:
+                    cache.put(
+                        cache_key,
+                        {
+                            "best_string": best_string,
+                            "max_distance": max_distance,
+                            "metadata": metadata,
+                            "execution_time": elapsed,
+                        },
+                    )
             end_time = time.time()
 
             # Constroi resultado
@@ -147,7 +199,7 @@ class ExecutionOrchestrator(BaseOrchestrator):
                 "algorithm": algorithm_name,
                 "best_string": best_string,
                 "max_distance": max_distance,
-                "execution_time": end_time - start_time,
+                "execution_time": elapsed,
                 "execution_id": execution_id,
                 "params": params,
                 "metadata": metadata,
@@ -159,6 +211,9 @@ class ExecutionOrchestrator(BaseOrchestrator):
                 "status": "completed",
             }
 
+            if cache_key is not None:
+                result["cache_hit"] = cached is not None
+
             # Atualiza status
             self._executions[execution_id].update(
                 {"status": "completed", "result": result, "end_time": end_time}
@@ -200,6 +255,24 @@ class ExecutionOrchestrator(BaseOrchestrator):
             task_type = getattr(TaskType, task_type_str.upper(), TaskType.EXECUTION)
             monitoring_service.start_monitoring(task_type, batch_config)
 
+        try:
+            results = self._dispatch_batch(
+                batch_config, task_type_str, monitoring_service
+            )
+            self._report_result_cache(results)
+            return results
+        finally:
+            # Pool de workers e escritor de parciais vivem apenas durante o batch
+            self._shutdown_worker_pool()
+            self._close_partial_results()
+
+    def _dispatch_batch(
+        self,
+        batch_config: Dict[str, Any],
+        task_type_str: str,
+        monitoring_service=None,
+    ) -> List[Dict[str, Any]]:
+        """Encaminha o batch para o executor da estrutura correspondente."""
         results = []
 
         self._logger.debug(f"Task type detectado: {task_type_str}")
@@ -269,6 +342,9 @@ class ExecutionOrchestrator(BaseOrchestrator):
         dataset_repo = FileDatasetRepository("./datasets")
 
         results = []
+        tasks: List[BatchTask] = []
+        loaded_datasets: Dict[str, Dataset] = {}
+        self._dataset_monitoring = {}
         execution_index = 0
 
         for execution in executions:
@@ -307,16 +383,25 @@ class ExecutionOrchestrator(BaseOrchestrator):
                         )
                         continue
 
-                    # Atualizar informações do dataset no monitoramento
-                    if monitoring_service:
+                    # Carregar dataset e planejar as repetições desta configuração
+                    first_task = len(tasks)
+                    dataset_errors = self._plan_dataset_algorithms_for_config(
+                        execution,
+                        dataset_config,
+                        dataset_id,
+                        dataset_repo,
+                        algorithm_config,
+                        tasks,
+                        loaded_datasets,
+                    )
+                    results.extend(dataset_errors)
+
+                    # Informações do dataset para o monitoramento, emitidas
+                    # quando suas tarefas começam e terminam de executar
+                    if monitoring_service and len(tasks) > first_task:
                         # Contar algoritmos únicos desta configuração
                         unique_algorithms = set(algorithm_config["algorithms"])
 
-                        # Atualizar hierarquia de dataset (que já inclui execução)
-                        from src.presentation.monitoring.interfaces import (
-                            ExecutionLevel,
-                        )
-
                         # Obter nome do dataset
                         dataset_name = dataset_config.get("nome", dataset_id)
 
@@ -325,12 +410,17 @@ class ExecutionOrchestrator(BaseOrchestrator):
                             "nome", "Algoritmos"
                         )
 
-                        monitoring_service.monitor.update_hierarchy(
-                            level=ExecutionLevel.DATASET,
-                            level_id=f"{dataset_id}_{algorithm_id}",
-                            progress=0.0,
-                            message=f"Processando dataset {dataset_name}",
-                            data={
+                        key = (
+                            execution.get("nome", "unknown"),
+                            dataset_id,
+                            algorithm_id,
+                        )
+                        self._dataset_monitoring[key] = {
+                            "level_id": f"{dataset_id}_{algorithm_id}",
+                            "dataset_name": dataset_name,
+                            "pending": len(tasks) - first_task,
+                            "started": False,
+                            "data": {
                                 "execution_name": execution_name,
                                 "config_index": execution_index,
                                 "total_configs": len(executions),
@@ -342,22 +432,22 @@ class ExecutionOrchestrator(BaseOrchestrator):
                                 "total_algorithm_configs": len(algorithm_ids),
                                 "total_algorithms": len(unique_algorithms),
                             },
-                        )
+                        }
 
-                    # Carregar dataset e executar algoritmos desta configuração
-                    dataset_results = self._execute_dataset_algorithms_for_config(
-                        execution,
-                        dataset_config,
-                        dataset_id,
-                        dataset_repo,
-                        algorithm_config,
-                        monitoring_service,
-                    )
-                    results.extend(dataset_results)
+                    # Salvar erros de carregamento se habilitado
+                    if self._should_save_partial_results():
+                        for error_result in dataset_errors:
+                            self._save_partial_result(error_result)
 
             # Configurações completadas são controladas pela hierarquia
             # Não precisamos mais usar update_execution_data
 
+        # Todas as repetições do batch compartilham um único pool, com as
+        # tarefas mais longas submetidas primeiro
+        make_item_ids_unique(tasks)
+        self._logger.debug(f"Batch expandido em {len(tasks)} tarefas")
+        results.extend(self._run_batch_tasks(tasks, monitoring_service))
+
         return results
 
     def _execute_legacy_batch(
@@ -414,61 +504,142 @@ class ExecutionOrchestrator(BaseOrchestrator):
         result_config = infrastructure.get("result", {})
         return result_config.get("save_partial_results", False)
 
+    def _get_result_cache(self) -> Optional[ResultCache]:
+        """Cache de resultados (infrastructure.result_cache), se habilitado."""
+        if self._result_cache is None and self._current_batch_config:
+            infrastructure = self._current_batch_config.get("infrastructure", {})
+            self._result_cache = ResultCache.from_config(
+                infrastructure.get("result_cache")
+            )
+        return self._result_cache
+
+    def _report_result_cache(self, results: List[Dict[str, Any]]) -> None:
+        """
+        Exibe acertos/faltas do cache ao final do batch.
+
+        As contagens vêm da marca ``cache_hit`` dos resultados, pois as
+        repetições paralelas consultam o cache dentro dos workers.
+        """
+        if self._get_result_cache() is None:
+            return
+
+        hits = sum(1 for r in results if r.get("cache_hit") is True)
+        misses = sum(1 for r in results if r.get("cache_hit") is False)
+        print(format_cache_report(hits, misses))
+
+    def _get_resume_session(self) -> Optional[str]:
+        """Sessão a retomar (infrastructure.result.resume_session), se houver."""
+        if not self._current_batch_config:
+            return None
+
+        infrastructure = self._current_batch_config.get("infrastructure", {})
+        return infrastructure.get("result", {}).get("resume_session")
+
     def _setup_partial_results_file(self) -> None:
         """Configura arquivo para salvamento de resultados parciais."""
         from src.infrastructure import SessionManager
 
-        try:
-            session_manager = SessionManager(self._current_batch_config or {})
-            session_folder = session_manager.create_session()
-            results_dir = Path(session_manager.get_result_dir())
-            print(f"📁 Sessão criada: {session_folder}")
-            print(f"📁 Salvando resultados parciais em: {results_dir}")
-        except Exception as e:
-            # Fallback para diretório padrão
-            base_dir = Path("./outputs/results")
-            timestamp = time.strftime("%Y%m%d_%H%M%S")
-            results_dir = base_dir / timestamp
-            print(f"📁 Usando diretório fallback: {results_dir}, erro: {e}")
+        resume_session = self._get_resume_session()
+        self._completed_results = {}
+
+        if resume_session:
+            # Retomar sessão existente: nome da sessão ou caminho do diretório
+            results_dir = Path(resume_session)
+            if not results_dir.is_dir():
+                session_manager = SessionManager(self._current_batch_config or {})
+                results_dir = Path(session_manager.resolve_session(resume_session))
+            # Falhar antes de qualquer escrita no sistema de arquivos
+            if not (results_dir / "partial_results.jsonl").exists():
+                raise FileNotFoundError(
+                    f"Sessão '{resume_session}' não possui partial_results.jsonl"
+                )
+            print(f"♻️  Retomando sessão: {results_dir}")
+        else:
+            try:
+                session_manager = SessionManager(self._current_batch_config or {})
+                session_folder = session_manager.create_session()
+                results_dir = Path(session_manager.get_result_dir())
+                print(f"📁 Sessão criada: {session_folder}")
+                print(f"📁 Salvando resultados parciais em: {results_dir}")
+            except Exception as e:
+                # Fallback para diretório padrão
+                base_dir = Path("./outputs/results")
+                timestamp = time.strftime("%Y%m%d_%H%M%S")
+                results_dir = base_dir / timestamp
+                print(f"📁 Usando diretório fallback: {results_dir}, erro: {e}")
 
         results_dir.mkdir(parents=True, exist_ok=True)
-        self._partial_results_file = str(results_dir / "partial_results.json")
+        self._partial_results_file = str(results_dir / "partial_results.jsonl")
 
         print(f"💾 Arquivo de resultados parciais: {self._partial_results_file}")
 
-        # Inicializar arquivo com array vazio
-        with open(self._partial_results_file, "w", encoding="utf-8") as f:
-            json.dump([], f)
+        if resume_session:
+            self._load_completed_results()
+
+        # JSON Lines com escrita em segundo plano: cada resultado é uma linha
+        self._close_partial_results()
+        self._partial_results_writer = PartialResultsWriter(
+            self._partial_results_file, append=bool(resume_session)
+        )
 
         print(f"✅ Sistema de salvamento parcial inicializado")
 
+    def _load_completed_results(self) -> None:
+        """
+        Carrega as repetições concluídas da sessão retomada.
+
+        Resultados com erro são descartados do arquivo para que a repetição
+        seja executada novamente sem duplicar entradas.
+        """
+        previous = load_partial_results(self._partial_results_file)
+        kept = [r for r in previous if r.get("status") in ("success", "completed")]
+
+        if len(kept) != len(previous):
+            rewrite_partial_results(self._partial_results_file, kept)
+
+        self._completed_results = {
+            r["task_fingerprint"]: r for r in kept if "task_fingerprint" in r
+        }
+        print(
+            f"♻️  {len(self._completed_results)} repetições concluídas encontradas "
+            f"({len(previous) - len(kept)} com erro serão refeitas)"
+        )
+
     def _save_partial_result(self, result: Dict[str, Any]) -> None:
-        """Salva um resultado parcial no arquivo."""
-        if not self._partial_results_file:
+        """Enfileira um resultado parcial para gravação no arquivo."""
+        if not self._partial_results_writer:
             return
 
         try:
-            # Carregar resultados existentes
-            if os.path.exists(self._partial_results_file):
-                with open(self._partial_results_file, "r", encoding="utf-8") as f:
-                    existing_results = json.load(f)
-            else:
-                existing_results = []
-
-            # Adicionar novo resultado
-            existing_results.append(result)
-
-            # Salvar de volta
-            with open(self._partial_results_file, "w", encoding="utf-8") as f:
-                json.dump(existing_results, f, indent=2, ensure_ascii=False)
+            self._partial_results_writer.write(result)
 
             print(
-                f"💾 Resultado salvo [{len(existing_results)}]: {result.get('algorithm', 'N/A')} - {result.get('status', 'N/A')}"
+                f"💾 Resultado salvo [{self._partial_results_writer.count}]: {result.get('algorithm', 'N/A')} - {result.get('status', 'N/A')}"
             )
 
         except Exception as e:
             print(f"⚠️  Erro ao salvar resultado parcial: {e}")
 
+    def _close_partial_results(self) -> None:
+        """Grava resultados pendentes e fecha o arquivo de parciais."""
+        if self._partial_results_writer is not None:
+            self._partial_results_writer.close()
+            self._partial_results_writer = None
+
+    def get_partial_results_stream(self) -> Optional[PartialResultsStream]:
+        """
+        Retorna os resultados parciais gravados como stream do disco.
+
+        Returns:
+            Optional[PartialResultsStream]: Stream, ou None se o salvamento
+            parcial não está habilitado
+        """
+        if not self._partial_results_file:
+            return None
+        if self._partial_results_writer is not None:
+            self._partial_results_writer.flush()
+        return PartialResultsStream(self._partial_results_file)
+
     # Métodos auxiliares para organização do código...
     def _setup_monitoring_data(
         self, executions, datasets_config, algorithms_config, monitoring_service
@@ -537,32 +708,41 @@ class ExecutionOrchestrator(BaseOrchestrator):
             },
         )
 
-    def _execute_dataset_algorithms_for_config(
+    def _load_dataset_for_config(self, dataset_config, dataset_repo) -> Dataset:
+        """Carrega (arquivo) ou gera (sintético) o dataset de uma configuração."""
+        if dataset_config["tipo"] == "file":
+            filename = dataset_config["parametros"]["filename"]
+            return dataset_repo.load(filename)
+
+        # Para datasets sintéticos, criar usando gerador
+        return self._create_dataset_from_config(dataset_config)
+
+    def _plan_dataset_algorithms_for_config(
         self,
         execution,
         dataset_config,
         dataset_id,
         dataset_repo,
         algorithm_config,
-        monitoring_service,
-    ):
-        """Executa algoritmos de uma configuração específica para um dataset."""
-        results = []
+        tasks: List[BatchTask],
+        loaded_datasets: Dict[str, Dataset],
+    ) -> List[Dict[str, Any]]:
+        """
+        Planeja as repetições de uma configuração de algoritmos para um dataset.
 
+        As tarefas são acrescentadas a ``tasks``; o dataset é carregado uma
+        única vez por ID. Retorna apenas resultados de erro de carregamento.
+        """
         try:
-            # Carregar dataset
-            if dataset_config["tipo"] == "file":
-                filename = dataset_config["parametros"]["filename"]
-                dataset = dataset_repo.load(filename)
-            else:
-                # Para datasets sintéticos, criar usando gerador
-                dataset = self._create_dataset_from_config(dataset_config)
+            dataset = loaded_datasets.get(dataset_id)
+            if dataset is None:
+                dataset = self._load_dataset_for_config(dataset_config, dataset_repo)
+                loaded_datasets[dataset_id] = dataset
 
-            self._logger.info(
-                f"Dataset {dataset_id} carregado: {len(dataset.sequences)} sequências"
-            )
+                self._logger.info(
+                    f"Dataset {dataset_id} carregado: {len(dataset.sequences)} sequências"
+                )
 
-            # Executar algoritmos desta configuração
             algorithm_names = algorithm_config["algorithms"]
             algorithm_params = algorithm_config.get("algorithm_params", {})
             repetitions = execution.get("repetitions", 1)
@@ -571,27 +751,26 @@ class ExecutionOrchestrator(BaseOrchestrator):
                 # Obter parâmetros específicos do algoritmo
                 params = algorithm_params.get(algorithm_name, {})
 
-                # Executar repetições com paralelismo
-                algorithm_results = self._execute_algorithm_repetitions_parallel(
-                    algorithm_name=algorithm_name,
-                    dataset=dataset,
-                    params=params,
-                    repetitions=repetitions,
-                    execution_context={
-                        "execution_name": execution.get("nome", "unknown"),
-                        "dataset_id": dataset_id,
-                        "algorithm_id": algorithm_config["id"],
-                    },
-                    monitoring_service=monitoring_service,
+                tasks.extend(
+                    build_repetition_tasks(
+                        algorithm_name,
+                        dataset,
+                        params,
+                        repetitions,
+                        execution_context={
+                            "execution_name": execution.get("nome", "unknown"),
+                            "dataset_id": dataset_id,
+                            "algorithm_id": algorithm_config["id"],
+                        },
+                        start_index=len(tasks),
+                    )
                 )
 
-                results.extend(algorithm_results)
-
         except Exception as e:
             self._logger.error(
                 f"Erro no carregamento/processamento do dataset {dataset_id}: {e}"
             )
-            results.append(
+            return [
                 {
                     "execution_name": execution.get("nome", "unknown"),
                     "dataset_id": dataset_id,
@@ -599,9 +778,9 @@ class ExecutionOrchestrator(BaseOrchestrator):
                     "error": str(e),
                     "execution_time": 0.0,
                 }
-            )
+            ]
 
-        return results
+        return []
 
     def _execute_single_repetition(
         self,
@@ -685,93 +864,20 @@ class ExecutionOrchestrator(BaseOrchestrator):
         # Fallback para número de CPUs
         return cpu_count() or 1
 
-    def _execute_dataset_algorithms(
-        self,
-        execution,
-        dataset_config,
-        dataset_id,
-        dataset_repo,
-        algorithms_config,
-        monitoring_service,
-    ):
-        """Executa algoritmos para um dataset específico."""
-        results = []
-
-        try:
-            # Carregar dataset
-            if dataset_config["tipo"] == "file":
-                filename = dataset_config["parametros"]["filename"]
-                dataset = dataset_repo.load(filename)
-            else:
-                # Para datasets sintéticos, criar usando gerador
-                dataset = self._create_dataset_from_config(dataset_config)
-
-            self._logger.info(
-                f"Dataset {dataset_id} carregado: {len(dataset.sequences)} sequências"
+    def _get_worker_pool(self) -> BatchWorkerPool:
+        """Obtém o pool de workers do batch, criando-o na primeira chamada."""
+        if self._worker_pool is None:
+            self._worker_pool = BatchWorkerPool(
+                max_workers=self._get_max_workers(),
+                batch_config=self._current_batch_config,
             )
+        return self._worker_pool
 
-            # Obter configurações de algoritmos da execução
-            algorithm_ids = execution["algorithms"]
-            repetitions = execution.get("repetitions", 1)
-
-            for algorithm_id in algorithm_ids:
-                # Resolver configuração do algoritmo
-                algorithm_config = next(
-                    (a for a in algorithms_config if a["id"] == algorithm_id), None
-                )
-                if not algorithm_config:
-                    self._logger.error(
-                        f"Algoritmo com ID '{algorithm_id}' não encontrado"
-                    )
-                    results.append(
-                        {
-                            "execution_name": execution.get("nome", "unknown"),
-                            "dataset_id": dataset_id,
-                            "algorithm_id": algorithm_id,
-                            "status": "error",
-                            "error": f"Algoritmo com ID '{algorithm_id}' não encontrado",
-                        }
-                    )
-                    continue
-
-                # Executar cada algoritmo da configuração
-                algorithm_names = algorithm_config["algorithms"]
-                algorithm_params = algorithm_config.get("algorithm_params", {})
-
-                for algorithm_name in algorithm_names:
-                    # Obter parâmetros específicos do algoritmo
-                    params = algorithm_params.get(algorithm_name, {})
-
-                    # Executar repetições com paralelismo
-                    algorithm_results = self._execute_algorithm_repetitions_parallel(
-                        algorithm_name=algorithm_name,
-                        dataset=dataset,
-                        params=params,
-                        repetitions=repetitions,
-                        execution_context={
-                            "execution_name": execution.get("nome", "unknown"),
-                            "dataset_id": dataset_id,
-                            "algorithm_id": algorithm_id,
-                        },
-                        monitoring_service=monitoring_service,
-                    )
-
-                    results.extend(algorithm_results)
-
-        except Exception as e:
-            self._logger.error(
-                f"Erro no carregamento/processamento do dataset {dataset_id}: {e}"
-            )
-            results.append(
-                {
-                    "execution_name": execution.get("nome", "unknown"),
-                    "dataset_id": dataset_id,
-                    "status": "error",
-                    "error": f"Erro no dataset: {e}",
-                }
-            )
-
-        return results
+    def _shutdown_worker_pool(self) -> None:
+        """Encerra o pool de workers e libera a memória compartilhada."""
+        if self._worker_pool is not None:
+            self._worker_pool.shutdown()
+            self._worker_pool = None
 
     def _create_dataset_from_config(self, dataset_config: Dict[str, Any]):
         """Cria dataset a partir da configuração."""
@@ -836,249 +942,270 @@ class ExecutionOrchestrator(BaseOrchestrator):
 
         return False
 
-    def _execute_algorithm_repetitions_parallel(
-        self,
-        algorithm_name: str,
-        dataset: Dataset,
-        params: Dict[str, Any],
-        repetitions: int,
-        execution_context: Dict[str, Any],
-        monitoring_service=None,
+    def _run_batch_tasks(
+        self, tasks: List[BatchTask], monitoring_service=None
     ) -> List[Dict[str, Any]]:
         """
-        Executa repetições de um algoritmo em paralelo usando ProcessPoolExecutor.
+        Executa uma lista plana de tarefas do batch.
+
+        Com mais de um worker, as tarefas são submetidas ao pool do batch em
+        ordem de custo esperado decrescente; os resultados são devolvidos na
+        ordem original do batch.
 
         Args:
-            algorithm_name: Nome do algoritmo
-            dataset: Dataset para processamento
-            params: Parâmetros do algoritmo
-            repetitions: Número de repetições
-            execution_context: Contexto da execução
+            tasks: Tarefas planejadas
             monitoring_service: Serviço de monitoramento
 
         Returns:
-            List[Dict[str, Any]]: Lista de resultados das repetições
+            List[Dict[str, Any]]: Resultados na ordem das tarefas
         """
+        if not tasks:
+            return []
+
+        results_by_index: Dict[int, Dict[str, Any]] = {}
+
+        # Sessão retomada: reaproveitar repetições já concluídas
+        if self._completed_results:
+            pending = []
+            for task in tasks:
+                previous = self._completed_results.get(task.fingerprint)
+                if previous is not None:
+                    results_by_index[task.index] = previous
+                    self._dataset_task_finished(task, None)
+                else:
+                    pending.append(task)
+
+            if results_by_index:
+                print(
+                    f"♻️  {len(results_by_index)} tarefas já concluídas na sessão retomada"
+                )
+            tasks_to_run = pending
+        else:
+            tasks_to_run = tasks
+
         max_workers = self._get_max_workers()
 
         # Se max_workers = 1, usar execução sequencial
         if max_workers == 1:
-            return self._execute_algorithm_repetitions_sequential(
-                algorithm_name,
-                dataset,
-                params,
-                repetitions,
-                execution_context,
-                monitoring_service,
-            )
+            for task in tasks_to_run:
+                self._dataset_task_started(task, monitoring_service)
+                result = self._execute_task_inline(task, monitoring_service)
+                results_by_index[task.index] = self._record_task_result(task, result)
+                self._dataset_task_finished(task, monitoring_service)
+            return [results_by_index[task.index] for task in tasks]
 
-        # Execução paralela
         self._logger.debug(
-            f"Executando {repetitions} repetições de {algorithm_name} com {max_workers} workers"
+            f"Executando {len(tasks_to_run)} tarefas com {max_workers} workers"
         )
 
-        results = []
-
-        # Preparar argumentos para ProcessPoolExecutor
-        args_list = []
-        for rep in range(repetitions):
-            args_list.append(
-                (
-                    algorithm_name,
-                    dataset,
-                    params,
-                    execution_context,
-                    rep + 1,  # 1-based
-                    repetitions,
-                )
+        # Pool persistente do batch: cada dataset é publicado uma única vez em
+        # memória compartilhada e cada repetição envia só um descritor
+        pool = self._get_worker_pool()
+        future_to_task = {}
+        for task in order_longest_first(tasks_to_run):
+            future = pool.submit_repetition(
+                task.algorithm_name,
+                task.dataset,
+                task.params,
+                task.execution_context,
+                task.repetition,
+                task.total_repetitions,
             )
+            future_to_task[future] = task
 
-        # Executar em paralelo
-        with ProcessPoolExecutor(max_workers=max_workers) as executor:
-            # Submeter todas as tarefas
-            future_to_rep = {}
-            for i, args in enumerate(args_list):
-                future = executor.submit(self._execute_single_repetition, *args)
-                future_to_rep[future] = i + 1
-
-            # Coletar resultados conforme completam
-            for future in as_completed(future_to_rep):
-                rep_number = future_to_rep[future]
-                rep_id = f"{algorithm_name}_{execution_context.get('dataset_id', 'unknown')}_{rep_number}"
-
-                try:
-                    # Inicializar monitoramento se disponível
-                    if monitoring_service:
-                        from src.presentation.monitoring.interfaces import (
-                            HierarchicalContext,
-                        )
-
-                        context = HierarchicalContext(
-                            dataset_id=execution_context.get("dataset_id", "unknown"),
-                            algorithm_id=algorithm_name,
-                            repetition_id=f"{rep_number}/{repetitions}",
-                        )
-                        # Iniciar item antes da execução
-                        monitoring_service.start_item(rep_id, "repetition", context)
+        # Coletar resultados conforme completam
+        for future in as_completed(future_to_task):
+            task = future_to_task[future]
 
-                    # Obter resultado
-                    result = future.result()
-
-                    # Verificar se houve erro
-                    if result.get("status") == "error":
-                        self._logger.error(
-                            f"Erro na execução do algoritmo {algorithm_name} (rep {rep_number}): {result.get('error')}"
-                        )
-
-                        # Notificar monitoramento de erro
-                        if monitoring_service:
-                            monitoring_service.finish_item(
-                                rep_id,
-                                False,
-                                result,
-                                result.get("error", "Unknown error"),
-                            )
-                    else:
-                        self._logger.debug(
-                            f"Algoritmo {algorithm_name} executado com sucesso (rep {rep_number}/{repetitions})"
-                        )
-
-                        # Notificar monitoramento de conclusão
-                        if monitoring_service:
-                            monitoring_service.finish_item(rep_id, True, result)
+            try:
+                # Inicializar monitoramento se disponível
+                self._dataset_task_started(task, monitoring_service)
+                if monitoring_service:
+                    monitoring_service.start_item(
+                        task.item_id, "repetition", self._task_context(task)
+                    )
 
-                    results.append(result)
+                # Obter resultado
+                result = future.result()
 
-                except Exception as e:
+                # Verificar se houve erro
+                if result.get("status") == "error":
                     self._logger.error(
-                        f"Erro ao processar resultado da repetição {rep_number} de {algorithm_name}: {e}"
+                        f"Erro na execução do algoritmo {task.algorithm_name} (rep {task.repetition}): {result.get('error')}"
                     )
 
-                    error_result = {
-                        "execution_name": execution_context.get(
-                            "execution_name", "unknown"
-                        ),
-                        "dataset_id": execution_context.get("dataset_id", "unknown"),
-                        "algorithm_id": execution_context.get(
-                            "algorithm_id", "unknown"
-                        ),
-                        "algorithm_name": algorithm_name,
-                        "repetition": rep_number,
-                        "total_repetitions": repetitions,
-                        "status": "error",
-                        "error": str(e),
-                        "execution_time": 0.0,
-                    }
-
-                    results.append(error_result)
-
                     # Notificar monitoramento de erro
                     if monitoring_service:
                         monitoring_service.finish_item(
-                            rep_id, False, error_result, str(e)
+                            task.item_id,
+                            False,
+                            result,
+                            result.get("error", "Unknown error"),
                         )
+                else:
+                    self._logger.debug(
+                        f"Algoritmo {task.algorithm_name} executado com sucesso (rep {task.repetition}/{task.total_repetitions})"
+                    )
 
-        return results
+                    # Notificar monitoramento de conclusão
+                    if monitoring_service:
+                        monitoring_service.finish_item(task.item_id, True, result)
 
-    def _execute_algorithm_repetitions_sequential(
-        self,
-        algorithm_name: str,
-        dataset: Dataset,
-        params: Dict[str, Any],
-        repetitions: int,
-        execution_context: Dict[str, Any],
-        monitoring_service=None,
-    ) -> List[Dict[str, Any]]:
-        """
-        Executa repetições de um algoritmo sequencialmente (fallback).
+            except Exception as e:
+                self._logger.error(
+                    f"Erro ao processar resultado da repetição {task.repetition} de {task.algorithm_name}: {e}"
+                )
 
-        Args:
-            algorithm_name: Nome do algoritmo
-            dataset: Dataset para processamento
-            params: Parâmetros do algoritmo
-            repetitions: Número de repetições
-            execution_context: Contexto da execução
-            monitoring_service: Serviço de monitoramento
+                result = self._task_error_result(task, e)
 
-        Returns:
-            List[Dict[str, Any]]: Lista de resultados das repetições
-        """
-        results = []
+                # Notificar monitoramento de erro
+                if monitoring_service:
+                    monitoring_service.finish_item(task.item_id, False, result, str(e))
 
-        for rep in range(repetitions):
-            rep_id = f"{algorithm_name}_{execution_context.get('dataset_id', 'unknown')}_{rep+1}"
+            results_by_index[task.index] = self._record_task_result(task, result)
+            self._dataset_task_finished(task, monitoring_service)
 
-            try:
-                # Notificar monitoramento de novo item
-                if monitoring_service:
-                    from src.presentation.monitoring.interfaces import (
-                        HierarchicalContext,
-                    )
+        return [results_by_index[task.index] for task in tasks]
 
-                    context = HierarchicalContext(
-                        dataset_id=execution_context.get("dataset_id", "unknown"),
-                        algorithm_id=algorithm_name,
-                        repetition_id=f"{rep+1}/{repetitions}",
-                    )
-                    # Iniciar item antes da execução
-                    monitoring_service.start_item(rep_id, "repetition", context)
-                    monitoring_service.update_item(rep_id, 0.0, "Iniciando", context)
+    def _dataset_task_started(self, task: BatchTask, monitoring_service=None) -> None:
+        """Emite o início do dataset no monitoramento com sua primeira tarefa."""
+        entry = self._dataset_monitoring.get(self._dataset_key(task))
+        if not monitoring_service or entry is None or entry["started"]:
+            return
 
-                # Executar algoritmo
-                result = self.execute_single(
-                    algorithm_name, dataset, params, monitoring_service
-                )
+        from src.presentation.monitoring.interfaces import ExecutionLevel
 
-                # Adicionar informações de contexto
-                result.update(
-                    {
-                        "execution_name": execution_context.get(
-                            "execution_name", "unknown"
-                        ),
-                        "dataset_id": execution_context.get("dataset_id", "unknown"),
-                        "algorithm_id": execution_context.get(
-                            "algorithm_id", "unknown"
-                        ),
-                        "algorithm_name": algorithm_name,
-                        "repetition": rep + 1,
-                        "total_repetitions": repetitions,
-                        "status": "success",
-                    }
-                )
+        entry["started"] = True
+        monitoring_service.monitor.update_hierarchy(
+            level=ExecutionLevel.DATASET,
+            level_id=entry["level_id"],
+            progress=0.0,
+            message=f"Processando dataset {entry['dataset_name']}",
+            data=entry["data"],
+        )
 
-                results.append(result)
+    def _dataset_task_finished(self, task: BatchTask, monitoring_service=None) -> None:
+        """Contabiliza a tarefa e emite a conclusão do dataset com a última."""
+        entry = self._dataset_monitoring.get(self._dataset_key(task))
+        if entry is None:
+            return
 
-                # Notificar monitoramento de conclusão
-                if monitoring_service:
-                    monitoring_service.finish_item(rep_id, True, result)
+        entry["pending"] -= 1
+        if not monitoring_service or entry["pending"] > 0 or not entry["started"]:
+            return
 
-                self._logger.debug(
-                    f"Algoritmo {algorithm_name} executado com sucesso (rep {rep+1}/{repetitions})"
-                )
+        from src.presentation.monitoring.interfaces import ExecutionLevel
 
-            except Exception as e:
-                self._logger.error(
-                    f"Erro na execução do algoritmo {algorithm_name} (rep {rep+1}): {e}"
-                )
+        monitoring_service.monitor.update_hierarchy(
+            level=ExecutionLevel.DATASET,
+            level_id=entry["level_id"],
+            progress=1.0,
+            message=f"Dataset {entry['dataset_name']} concluído",
+            data=entry["data"],
+        )
 
-                error_result = {
+    @staticmethod
+    def _dataset_key(task: BatchTask) -> Tuple[str, ...]:
+        """Chave do par dataset/configuração de uma tarefa na sua execução."""
+        context = task.execution_context
+        return (
+            context.get("execution_name", "unknown"),
+            context.get("dataset_id", "unknown"),
+            context.get("algorithm_id", "unknown"),
+        )
+
+    def _record_task_result(
+        self, task: BatchTask, result: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Marca o resultado com a tarefa de origem e o salva."""
+        result["task_fingerprint"] = task.fingerprint
+        result["task_index"] = task.index
+
+        # Salvar resultado parcial se habilitado
+        if self._should_save_partial_results():
+            self._save_partial_result(result)
+
+        return result
+
+    def _execute_task_inline(
+        self, task: BatchTask, monitoring_service=None
+    ) -> Dict[str, Any]:
+        """Executa uma tarefa no processo atual, com monitoramento completo."""
+        try:
+            # Notificar monitoramento de novo item
+            if monitoring_service:
+                context = self._task_context(task)
+                # Iniciar item antes da execução
+                monitoring_service.start_item(task.item_id, "repetition", context)
+                monitoring_service.update_item(task.item_id, 0.0, "Iniciando", context)
+
+            # Executar algoritmo
+            result = self.execute_single(
+                task.algorithm_name, task.dataset, task.params, monitoring_service
+            )
+
+            # Adicionar informações de contexto
+            execution_context = task.execution_context
+            result.update(
+                {
                     "execution_name": execution_context.get(
                         "execution_name", "unknown"
                     ),
                     "dataset_id": execution_context.get("dataset_id", "unknown"),
                     "algorithm_id": execution_context.get("algorithm_id", "unknown"),
-                    "algorithm_name": algorithm_name,
-                    "repetition": rep + 1,
-                    "total_repetitions": repetitions,
-                    "status": "error",
-                    "error": str(e),
-                    "execution_time": 0.0,
+                    "algorithm_name": task.algorithm_name,
+                    "repetition": task.repetition,
+                    "total_repetitions": task.total_repetitions,
+                    "status": "success",
                 }
+            )
 
-                results.append(error_result)
+            # Notificar monitoramento de conclusão
+            if monitoring_service:
+                monitoring_service.finish_item(task.item_id, True, result)
 
-                # Notificar monitoramento de erro
-                if monitoring_service:
-                    monitoring_service.finish_item(rep_id, False, error_result, str(e))
+            self._logger.debug(
+                f"Algoritmo {task.algorithm_name} executado com sucesso (rep {task.repetition}/{task.total_repetitions})"
+            )
 
-        return results
+            return result
+
+        except Exception as e:
+            self._logger.error(
+                f"Erro na execução do algoritmo {task.algorithm_name} (rep {task.repetition}): {e}"
+            )
+
+            error_result = self._task_error_result(task, e)
+
+            # Notificar monitoramento de erro
+            if monitoring_service:
+                monitoring_service.finish_item(
+                    task.item_id, False, error_result, str(e)
+                )
+
+            return error_result
+
+    def _task_context(self, task: BatchTask):
+        """Contexto hierárquico de monitoramento de uma tarefa."""
+        from src.presentation.monitoring.interfaces import HierarchicalContext
+
+        return HierarchicalContext(
+            dataset_id=task.execution_context.get("dataset_id", "unknown"),
+            algorithm_id=task.algorithm_name,
+            repetition_id=f"{task.repetition}/{task.total_repetitions}",
+        )
+
+    def _task_error_result(self, task: BatchTask, error: Exception) -> Dict[str, Any]:
+        """Resultado de erro de uma tarefa, com o mesmo contexto do sucesso."""
+        execution_context = task.execution_context
+        return {
+            "execution_name": execution_context.get("execution_name", "unknown"),
+            "dataset_id": execution_context.get("dataset_id", "unknown"),
+            "algorithm_id": execution_context.get("algorithm_id", "unknown"),
+            "algorithm_name": task.algorithm_name,
+            "repetition": task.repetition,
+            "total_repetitions": task.total_repetitions,
+            "status": "error",
+            "error": str(error),
+            "execution_time": 0.0,
+        }
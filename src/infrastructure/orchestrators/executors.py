@@ -20,6 +20,7 @@ class Executor(ExecutorInterface):
         """Inicializa executor como roteador puro."""
         self._logger = get_logger(__name__)
         self._current_batch_config = None
+        self._partial_results_stream = None
 
     def set_batch_config(self, batch_config: Dict[str, Any]) -> None:
         """Define configuração do batch atual (delegado para orquestradores)."""
@@ -60,12 +61,18 @@ class Executor(ExecutorInterface):
             )
 
             # Delegar execução
-            return orchestrator.execute_batch(batch_config, monitoring_service)
+            results = orchestrator.execute_batch(batch_config, monitoring_service)
+            self._partial_results_stream = orchestrator.get_partial_results_stream()
+            return results
 
         except Exception as e:
             self._logger.error(f"Erro na execução do batch: {e}")
             raise AlgorithmExecutionError(f"Erro na execução do batch: {e}") from e
 
+    def get_partial_results_stream(self):
+        """Retorna o stream de resultados parciais do último batch (ou None)."""
+        return self._partial_results_stream
+
     def execute_optimization(
         self,
         algorithm_name: str,
@@ -3,14 +3,20 @@ Optimization Orchestrator - Orquestração de Otimização com Optuna
 
 Coordena a execução de otimização de hiperparâmetros usando Optuna,
 incluindo salvamento incremental, relatórios avançados e sistema de recovery.
+
+Com ``optuna_config.n_workers > 1`` os trials rodam em processos locais que
+compartilham um único estudo por meio de um storage em arquivo (SQLite ou
+journal do Optuna), evitando que o GIL serialize os algoritmos CPU-bound.
 """
 
 import json
 import logging
+import multiprocessing as mp
 import os
 import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional
 
 import optuna
 from optuna.pruners import MedianPruner, SuccessiveHalvingPruner
@@ -22,6 +28,119 @@ from src.infrastructure.logging_config import get_logger
 from src.infrastructure.orchestrators.optimization_report_generator import (
     OptimizationReportGenerator,
 )
+from src.infrastructure.persistence.result_cache import (
+    ResultCache,
+    format_cache_report,
+)
+
+# Intervalo (s) entre consultas ao storage enquanto os workers executam
+_POLL_INTERVAL = 1.0
+
+_FINISHED_STATES = (
+    optuna.trial.TrialState.COMPLETE,
+    optuna.trial.TrialState.PRUNED,
+    optuna.trial.TrialState.FAIL,
+)
+
+# Atributo do trial (no storage) com o resultado parcial registrado no worker
+_TRIAL_RESULT_ATTR = "partial_result"
+
+# Estado por processo worker da otimização em processos
+_WORKER_STATE: Dict[str, Any] = {}
+
+
+def _file_storage(storage: str):
+    """
+    Storage compartilhável entre processos.
+
+    URLs (``sqlite:///estudo.db``, ``postgresql://...``) são repassadas ao
+    Optuna; qualquer outro valor é tratado como caminho de um arquivo journal.
+    """
+    if "://" in storage:
+        return storage
+    try:
+        from optuna.storages.journal import JournalFileBackend
+    except ImportError:  # pragma: no cover - Optuna < 4.0
+        return optuna.storages.JournalStorage(
+            optuna.storages.JournalFileStorage(storage)
+        )
+    return optuna.storages.JournalStorage(JournalFileBackend(storage))
+
+
+def _init_optimization_worker(state: Dict[str, Any], stop_event) -> None:
+    """Inicializador dos workers: recebe dataset e configuração uma única vez."""
+    _WORKER_STATE.clear()
+    _WORKER_STATE.update(state)
+    _WORKER_STATE["stop_event"] = stop_event
+    _WORKER_STATE["dataset"] = Dataset(
+        list(state["sequences"]), dict(state["metadata"])
+    )
+
+
+def _stop_if_requested(study: optuna.Study, trial) -> None:
+    """Callback dos workers: encerra quando o processo principal pede parada."""
+    if _WORKER_STATE["stop_event"].is_set():
+        study.stop()
+
+
+def _run_optimization_worker(worker_index: int, n_trials: int) -> Dict[str, Any]:
+    """Executa ``n_trials`` trials do estudo compartilhado dentro do worker."""
+    optuna.logging.set_verbosity(optuna.logging.WARNING)
+    orchestrator = OptimizationOrchestrator._worker_instance(_WORKER_STATE)
+    study = optuna.load_study(
+        study_name=_WORKER_STATE["study_name"],
+        storage=_file_storage(_WORKER_STATE["storage"]),
+        sampler=orchestrator._create_sampler(worker_index),
+        pruner=orchestrator._create_pruner(),
+    )
+    algorithm_class = _WORKER_STATE["algorithm_class"]
+    dataset = _WORKER_STATE["dataset"]
+    cache = orchestrator.result_cache
+    counters = ("hits", "misses", "evictions")
+    before = {name: getattr(cache, name) if cache else 0 for name in counters}
+
+    def objective(trial: optuna.trial.Trial) -> float:
+        value = orchestrator._objective_function(trial, algorithm_class, dataset)
+        # O resultado do trial segue pelo storage: o processo principal o lê
+        # assim que o trial termina e salva os checkpoints
+        trial_result = orchestrator.partial_results.pop()
+        trial.set_user_attr(
+            _TRIAL_RESULT_ATTR, json.loads(json.dumps(trial_result, default=str))
+        )
+        return value
+
+    study.optimize(
+        objective,
+        n_trials=n_trials,
+        timeout=_WORKER_STATE["timeout"],
+        callbacks=[_stop_if_requested],
+        show_progress_bar=False,
+    )
+
+    # Contadores do cache relativos a esta tarefa (o cache veio copiado)
+    return {
+        f"cache_{name}": getattr(cache, name) - before[name] if cache else 0
+        for name in counters
+    }
+
+
+class _StudyView:
+    """
+    Estudo visto pelos callbacks no processo principal.
+
+    Delega tudo ao estudo carregado do storage, exceto ``stop``, que sinaliza
+    aos workers para encerrarem após o trial atual.
+    """
+
+    def __init__(self, study: optuna.Study, stop_event):
+        self._study = study
+        self._stop_event = stop_event
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._study, name)
+
+    def stop(self) -> None:
+        self._stop_event.set()
 
 
 class OptimizationOrchestrator:
@@ -82,6 +201,12 @@ class OptimizationOrchestrator:
         )
         self.timeout_per_trial = self.optimization_config.get("timeout_per_trial", 300)
 
+        # Workers em processos (1 = trials em threads no próprio processo)
+        n_workers = int(
+            self.optimization_config.get("optuna_config", {}).get("n_workers", 1)
+        )
+        self.n_workers = n_workers if n_workers > 0 else (os.cpu_count() or 1)
+
         # Configuração de salvamento usando SessionManager
         from pathlib import Path
 
@@ -132,6 +257,13 @@ class OptimizationOrchestrator:
         self.trial_count = 0
         self.start_time = None
 
+        # Cache de resultados: trials com parâmetros repetidos não reexecutam
+        cache_config = self.optimization_config.get(
+            "result_cache",
+            settings.get("infrastructure", {}).get("result_cache"),
+        )
+        self.result_cache = ResultCache.from_config(cache_config)
+
         # Criar diretório de destino
         Path(self.destination).mkdir(parents=True, exist_ok=True)
 
@@ -154,8 +286,9 @@ class OptimizationOrchestrator:
             # Configurar logging do Optuna para ser menos verboso
             optuna.logging.set_verbosity(optuna.logging.WARNING)
 
-            # Configurar Optuna
-            study = self._create_study()
+            # Configurar Optuna (storage em arquivo quando há workers em processos)
+            storage = self._process_storage() if self.n_workers > 1 else None
+            study = self._create_study(storage)
 
             # Carregar dataset
             dataset = self._load_dataset()
@@ -215,18 +348,30 @@ class OptimizationOrchestrator:
             callbacks = self._setup_callbacks()
 
             # Executar otimização
-            study.optimize(
-                objective,
-                n_trials=self.n_trials,
-                timeout=self.timeout_per_trial * self.n_trials,
-                callbacks=callbacks,
-                n_jobs=self.resources_config.get("parallel", {}).get("n_jobs", 1),
-                show_progress_bar=False,  # Desabilitar barra de progresso do Optuna
-            )
+            if self.n_workers > 1:
+                study = self._optimize_in_processes(
+                    study, storage, algorithm_class, dataset, callbacks
+                )
+            else:
+                study.optimize(
+                    objective,
+                    n_trials=self.n_trials,
+                    timeout=self.timeout_per_trial * self.n_trials,
+                    callbacks=callbacks,
+                    n_jobs=self.resources_config.get("parallel", {}).get("n_jobs", 1),
+                    show_progress_bar=False,  # Desabilitar barra de progresso do Optuna
+                )
 
             # Processar resultados finais
             results = self._process_final_results(study)
 
+            if self.result_cache is not None:
+                self.logger.info(
+                    format_cache_report(
+                        self.result_cache.hits, self.result_cache.misses
+                    )
+                )
+
             # Finalizar monitoramento se disponível
             if self.monitoring_service:
                 algorithm_name = self.config.get("algorithm", "algoritmo")
@@ -246,9 +391,14 @@ class OptimizationOrchestrator:
             self.logger.error(f"Erro durante otimização: {e}")
             raise
 
-    def _create_study(self) -> optuna.Study:
-        """Cria estudo Optuna com configurações específicas."""
-        # Configurar sampler
+    def _create_sampler(self, worker_index: int = 0):
+        """
+        Cria o sampler configurado.
+
+        Args:
+            worker_index: Índice do worker; desloca a seed do RandomSampler
+                para que workers não sorteiem os mesmos parâmetros
+        """
         sampler_config = self.optimization_config.get("optuna_config", {})
         sampler_name = sampler_config.get("sampler", "TPESampler")
 
@@ -259,7 +409,10 @@ class OptimizationOrchestrator:
                 multivariate=sampler_config.get("multivariate", False),
             )
         elif sampler_name == "RandomSampler":
-            sampler = RandomSampler(seed=sampler_config.get("seed", None))
+            seed = sampler_config.get("seed", None)
+            if seed is not None:
+                seed += worker_index
+            sampler = RandomSampler(seed=seed)
         elif sampler_name == "CmaEsSampler":
             sampler = CmaEsSampler(
                 n_startup_trials=sampler_config.get("n_startup_trials", 1),
@@ -268,7 +421,11 @@ class OptimizationOrchestrator:
         else:
             sampler = TPESampler()
 
-        # Configurar pruner
+        return sampler
+
+    def _create_pruner(self):
+        """Cria o pruner configurado."""
+        sampler_config = self.optimization_config.get("optuna_config", {})
         pruner_name = sampler_config.get("pruner", "MedianPruner")
 
         if pruner_name == "MedianPruner":
@@ -288,15 +445,45 @@ class OptimizationOrchestrator:
         else:
             pruner = MedianPruner()
 
-        # Configurar storage se especificado
-        storage_url = os.getenv("OPTUNA_STORAGE", sampler_config.get("storage", None))
+        return pruner
+
+    def _storage_url(self) -> Optional[str]:
+        """Storage configurado (variável OPTUNA_STORAGE ou optuna_config)."""
+        sampler_config = self.optimization_config.get("optuna_config", {})
+        return os.getenv("OPTUNA_STORAGE", sampler_config.get("storage", None))
+
+    def _process_storage(self) -> str:
+        """
+        Storage compartilhado pelos workers em processos.
+
+        Usa o storage configurado ou, na falta dele, um arquivo journal do
+        Optuna no diretório de destino.
+        """
+        storage = self._storage_url()
+        if storage:
+            return storage
+        return str(Path(self.destination) / f"{self._study_name()}.optuna.journal")
+
+    def _study_name(self) -> str:
+        """Nome do estudo (variável OPTUNA_STUDY_NAME ou configuração)."""
+        return os.getenv("OPTUNA_STUDY_NAME", self.study_name)
+
+    def _create_study(self, storage: Optional[str] = None) -> optuna.Study:
+        """
+        Cria estudo Optuna com configurações específicas.
+
+        Args:
+            storage: Storage compartilhado (URL ou arquivo journal); se None,
+                usa o storage configurado ou memória
+        """
+        storage_url = _file_storage(storage) if storage else self._storage_url()
 
         # Criar estudo
         study = optuna.create_study(
-            study_name=os.getenv("OPTUNA_STUDY_NAME", self.study_name),
+            study_name=self._study_name(),
             direction=self.direction,
-            sampler=sampler,
-            pruner=pruner,
+            sampler=self._create_sampler(),
+            pruner=self._create_pruner(),
             storage=storage_url,
             load_if_exists=self.monitoring_config.get("checkpointing", {}).get(
                 "recovery", True
@@ -306,6 +493,159 @@ class OptimizationOrchestrator:
         self.logger.info(f"Estudo criado: {study.study_name}")
         return study
 
+    def _optimize_in_processes(
+        self,
+        study: optuna.Study,
+        storage: str,
+        algorithm_class: type[CSPAlgorithm],
+        dataset: Dataset,
+        callbacks: List,
+    ) -> optuna.Study:
+        """
+        Executa os trials em ``n_workers`` processos sobre o estudo compartilhado.
+
+        O dataset e a configuração são enviados uma vez por worker (via
+        inicializador). Enquanto os workers executam, os trials concluídos são
+        lidos do storage e repassados aos callbacks no processo principal
+        (monitoramento, log e early stopping) e registrados em
+        ``partial_results``, com checkpoints como no modo em threads. Ao final,
+        os contadores de cache dos workers são consolidados.
+
+        Returns:
+            optuna.Study: Estudo recarregado do storage com todos os trials
+        """
+        n_workers = min(self.n_workers, self.n_trials) or 1
+        trials_per_worker = [
+            self.n_trials // n_workers + (i < self.n_trials % n_workers)
+            for i in range(n_workers)
+        ]
+        state = {
+            "sequences": tuple(dataset.sequences),
+            "metadata": dict(dataset.metadata),
+            "algorithm_class": algorithm_class,
+            "config": self.config,
+            "study_name": study.study_name,
+            "storage": storage,
+            "timeout": self.timeout_per_trial * self.n_trials,
+            "result_cache": self.result_cache,
+        }
+        self.logger.info(f"Otimização em {n_workers} processos (storage: {storage})")
+
+        ctx = mp.get_context()
+        stop_event = ctx.Event()
+        view = _StudyView(study, stop_event)
+        reported: set = set()
+
+        def report_finished_trials() -> None:
+            trials = study.get_trials(deepcopy=False, states=_FINISHED_STATES)
+            for trial in sorted(trials, key=lambda t: t.number):
+                if trial.number in reported:
+                    continue
+                reported.add(trial.number)
+                self._record_worker_trial(trial)
+                for callback in callbacks:
+                    callback(view, trial)
+
+        worker_results = []
+        with ProcessPoolExecutor(
+            max_workers=n_workers,
+            mp_context=ctx,
+            initializer=_init_optimization_worker,
+            initargs=(state, stop_event),
+        ) as executor:
+            pending = {
+                executor.submit(_run_optimization_worker, index, n_trials)
+                for index, n_trials in enumerate(trials_per_worker)
+            }
+            try:
+                while pending:
+                    done, pending = wait(
+                        pending, timeout=_POLL_INTERVAL, return_when=FIRST_COMPLETED
+                    )
+                    for future in done:
+                        worker_results.append(future.result())
+                    report_finished_trials()
+            except BaseException:
+                stop_event.set()
+                raise
+
+        self._merge_worker_results(worker_results)
+        return optuna.load_study(
+            study_name=study.study_name, storage=_file_storage(storage)
+        )
+
+    def _record_worker_trial(self, trial: optuna.trial.FrozenTrial) -> None:
+        """
+        Registra um trial concluído por um worker, lido do storage.
+
+        Atualiza melhor resultado e contagem como ``_objective_function`` e
+        salva o checkpoint a cada ``checkpoint_interval`` trials.
+        """
+        trial_result = trial.user_attrs.get(_TRIAL_RESULT_ATTR)
+        if trial_result is None:
+            # Trial interrompido antes de registrar seu resultado
+            trial_result = {
+                "trial_number": trial.number,
+                "trial_params": dict(trial.params),
+                "timestamp": time.time(),
+                "trial_id": trial.number,
+                "state": trial.state.name,
+            }
+        self.partial_results.append(trial_result)
+        if trial_result["state"] != "COMPLETE":
+            return
+
+        self.trial_count += 1
+        value = trial_result["max_distance"]
+        if (
+            self.best_value is None
+            or (self.direction == "minimize" and value < self.best_value)
+            or (self.direction == "maximize" and value > self.best_value)
+        ):
+            self.best_value = value
+            self.best_params = trial_result["final_params"].copy()
+
+        if (
+            self.checkpoint_interval
+            and self.trial_count % self.checkpoint_interval == 0
+        ):
+            self._save_partial_results()
+
+    def _merge_worker_results(self, worker_results: List[Dict[str, Any]]) -> None:
+        """Consolida os contadores de cache dos workers e salva o resultado final."""
+        if self.result_cache is not None:
+            for name in ("hits", "misses", "evictions"):
+                total = sum(w[f"cache_{name}"] for w in worker_results)
+                setattr(
+                    self.result_cache, name, getattr(self.result_cache, name) + total
+                )
+
+        self.partial_results.sort(key=lambda r: r["trial_number"])
+        self._save_partial_results()
+
+    @classmethod
+    def _worker_instance(cls, state: Dict[str, Any]) -> "OptimizationOrchestrator":
+        """
+        Orquestrador local de um worker em processo.
+
+        Construído sem ``__init__``: não cria sessão, diretórios, relatórios
+        nem salvamento parcial, que ficam a cargo do processo principal.
+        """
+        orchestrator = cls.__new__(cls)
+        orchestrator.config = state["config"]
+        orchestrator.optimization_config = state["config"].get("optimization", {})
+        orchestrator.direction = orchestrator.optimization_config.get(
+            "direction", "minimize"
+        )
+        orchestrator.logger = get_logger(__name__)
+        orchestrator.result_cache = state["result_cache"]
+        orchestrator.partial_results = []
+        orchestrator.best_value = None
+        orchestrator.best_params = None
+        orchestrator.trial_count = 0
+        orchestrator.checkpoint_interval = 0
+        return orchestrator
+
     def _load_dataset(self) -> Dataset:
         """Carrega dataset para otimização."""
         dataset_id = self.config.get("dataset")
@@ -353,13 +693,41 @@ class OptimizationOrchestrator:
             base_params = self.config.get("base_params", {})
             params = {**base_params, **trial_params}
 
-            # Executar algoritmo usando a interface correta
-            # A interface CSPAlgorithm espera: __init__(strings, alphabet, **params) e run()
-            algorithm_instance = algorithm_class(
-                strings=dataset.sequences, alphabet=dataset.alphabet, **params
-            )
+            # Trials reprodutíveis já executados vêm do cache
+            cache_key = None
+            cached = None
+            if self.result_cache is not None and ResultCache.is_cacheable(
+                algorithm_class, params
+            ):
+                cache_key = self.result_cache.make_key(
+                    dataset, self.config.get("algorithm", ""), algorithm_class, params
+                )
+                cached = self.result_cache.get(cache_key)
+
+            if cached is not None:
+                best_string = cached["best_string"]
+                max_distance = cached["max_distance"]
+                metadata = cached["metadata"]
+            else:
+                # Executar algoritmo usando a interface correta
+                # A interface CSPAlgorithm espera: __init__(strings, alphabet, **params) e run()
+                algorithm_instance = algorithm_class(
+                    strings=dataset.sequences, alphabet=dataset.alphabet, **params
+                )
+
+                run_start = time.time()
+                best_string, max_distance, metadata = algorithm_instance.run()
 
-            best_string, max_distance, metadata = algorithm_instance.run()
+                if cache_key is not None:
+                    self.result_cache.put(
+                        cache_key,
+                        {
+                            "best_string": best_string,
+                            "max_distance": max_distance,
+                            "metadata": metadata,
+                            "execution_time": time.time() - run_start,
+                        },
+                    )
 
             # Salvar resultado parcial
             trial_result = {
@@ -388,7 +756,10 @@ class OptimizationOrchestrator:
 
             # Salvar progresso incremental
             self.trial_count += 1
-            if self.trial_count % self.checkpoint_interval == 0:
+            if (
+                self.checkpoint_interval
+                and self.trial_count % self.checkpoint_interval == 0
+            ):
                 self._save_partial_results()
 
             return max_distance
@@ -627,7 +998,7 @@ class OptimizationOrchestrator:
         for handler in optuna_logger.handlers[:]:
             if (
                 isinstance(handler, logging.StreamHandler)
-                and handler.stream.name == "<stderr>"
+                and getattr(handler.stream, "name", None) == "<stderr>"
             ):
                 optuna_logger.removeHandler(handler)
 
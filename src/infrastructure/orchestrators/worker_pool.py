@@ -0,0 +1,262 @@
+"""
+Pool de Workers do Batch
+
+Mantém um único ProcessPoolExecutor durante todo o batch. Cada dataset é
+publicado uma única vez em memória compartilhada (matriz de sequências
+codificada em uint8) e os workers recebem apenas descritores pequenos de
+tarefa, anexando e decodificando o dataset na primeira vez que o encontram.
+"""
+
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+try:  # pragma: no cover - numpy é dependência do projeto
+    from multiprocessing import shared_memory
+
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+    shared_memory = None
+
+from src.domain import Dataset
+from src.infrastructure.logging_config import get_logger
+
+
+@dataclass(frozen=True)
+class SharedDatasetHandle:
+    """
+    Descritor leve de um dataset publicado para os workers.
+
+    Attributes:
+        key: Identificador do dataset (hash do conteúdo)
+        shm_name: Nome do bloco de memória compartilhada (None se não publicado)
+        shape: Formato (n, L) da matriz codificada
+        alphabet: Alfabeto usado na codificação (índice -> caractere)
+        metadata: Metadados originais do dataset
+        sequences: Sequências em texto, usadas apenas sem memória compartilhada
+    """
+
+    key: str
+    shm_name: Optional[str]
+    shape: Tuple[int, int]
+    alphabet: str
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    sequences: Optional[Tuple[str, ...]] = None
+
+
+@dataclass(frozen=True)
+class RepetitionTask:
+    """Descritor de uma repetição enviada a um worker."""
+
+    dataset: SharedDatasetHandle
+    algorithm_name: str
+    params: Dict[str, Any]
+    execution_context: Dict[str, Any]
+    repetition: int
+    total_repetitions: int
+
+
+def dataset_content_key(dataset: Dataset) -> str:
+    """Retorna a chave estável do conteúdo (memorizada no próprio dataset)."""
+    return dataset.content_key
+
+
+# Estado por processo worker
+_WORKER_BATCH_CONFIG: Optional[Dict[str, Any]] = None
+_WORKER_DATASETS: Dict[str, Dataset] = {}
+_WORKER_ORCHESTRATOR = None
+
+
+def _init_worker(batch_config: Optional[Dict[str, Any]]) -> None:
+    """Inicializador dos workers: recebe a configuração do batch uma vez."""
+    global _WORKER_BATCH_CONFIG, _WORKER_ORCHESTRATOR
+    _WORKER_BATCH_CONFIG = batch_config
+    _WORKER_DATASETS.clear()
+    _WORKER_ORCHESTRATOR = None
+
+
+def _decode_shared_dataset(handle: SharedDatasetHandle) -> List[str]:
+    """Lê a matriz codificada da memória compartilhada e reconstrói as strings."""
+    shm = shared_memory.SharedMemory(name=handle.shm_name)
+    try:
+        n, L = handle.shape
+        matrix = np.ndarray((n, L), dtype=np.uint8, buffer=shm.buf)
+        chars = np.array(list(handle.alphabet), dtype="<U1")
+        # (n, L) de U1 contíguo pode ser visto como (n, 1) de U{L}
+        rows = np.ascontiguousarray(chars[matrix]).view(f"<U{L}")[:, 0]
+        sequences = rows.tolist()
+        del matrix
+    finally:
+        shm.close()
+    return sequences
+
+
+def _worker_dataset(handle: SharedDatasetHandle) -> Dataset:
+    """Obtém o dataset no worker, anexando-o apenas na primeira vez."""
+    dataset = _WORKER_DATASETS.get(handle.key)
+    if dataset is None:
+        if handle.sequences is not None:
+            sequences = list(handle.sequences)
+        else:
+            sequences = _decode_shared_dataset(handle)
+        dataset = Dataset(sequences, metadata=dict(handle.metadata))
+        _WORKER_DATASETS[handle.key] = dataset
+    return dataset
+
+
+def _worker_orchestrator():
+    """Orquestrador local do worker (sem monitoramento nem salvamento parcial)."""
+    global _WORKER_ORCHESTRATOR
+    if _WORKER_ORCHESTRATOR is None:
+        from src.infrastructure.orchestrators.execution_orchestrator import (
+            ExecutionOrchestrator,
+        )
+
+        orchestrator = ExecutionOrchestrator(
+            algorithm_registry=None, dataset_repository=None
+        )
+        # Atribuição direta: set_batch_config criaria arquivos de sessão
+        orchestrator._current_batch_config = _WORKER_BATCH_CONFIG
+        _WORKER_ORCHESTRATOR = orchestrator
+    return _WORKER_ORCHESTRATOR
+
+
+def _run_repetition(task: RepetitionTask) -> Dict[str, Any]:
+    """Executa uma repetição dentro do worker."""
+    orchestrator = _worker_orchestrator()
+    dataset = _worker_dataset(task.dataset)
+    result = orchestrator._execute_single_repetition(
+        task.algorithm_name,
+        dataset,
+        task.params,
+        task.execution_context,
+        task.repetition,
+        task.total_repetitions,
+    )
+    # O histórico de execuções do worker não é consultado; evita crescimento
+    orchestrator._executions.clear()
+    return result
+
+
+class BatchWorkerPool:
+    """
+    Pool de processos com tempo de vida de um batch.
+
+    O executor é criado na primeira submissão e reutilizado até
+    ``shutdown``; os datasets são publicados uma vez por conteúdo.
+    """
+
+    def __init__(self, max_workers: int, batch_config: Optional[Dict[str, Any]] = None):
+        """
+        Inicializa o pool.
+
+        Args:
+            max_workers: Número de processos worker
+            batch_config: Configuração do batch repassada aos workers
+        """
+        self.max_workers = max_workers
+        self._batch_config = batch_config
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._handles: Dict[str, SharedDatasetHandle] = {}
+        self._segments: Dict[str, Any] = {}
+        self._logger = get_logger(__name__)
+
+    def __enter__(self) -> "BatchWorkerPool":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.shutdown()
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        """Executor de processos, criado sob demanda."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=_init_worker,
+                initargs=(self._batch_config,),
+            )
+            self._logger.debug(f"Pool de workers iniciado ({self.max_workers})")
+        return self._executor
+
+    def register_dataset(self, dataset: Dataset) -> SharedDatasetHandle:
+        """
+        Publica o dataset para os workers (idempotente por conteúdo).
+
+        Args:
+            dataset: Dataset a publicar
+
+        Returns:
+            SharedDatasetHandle: Descritor a ser enviado nas tarefas
+        """
+        key = dataset_content_key(dataset)
+        handle = self._handles.get(key)
+        if handle is not None:
+            return handle
+
+        metadata = dict(dataset.metadata)
+        engine = dataset.distance_engine
+        shape = (engine.n, engine.L)
+
+        if shared_memory is None or not engine.vectorized or engine.n * engine.L == 0:
+            handle = SharedDatasetHandle(
+                key=key,
+                shm_name=None,
+                shape=shape,
+                alphabet=engine.alphabet,
+                metadata=metadata,
+                sequences=tuple(dataset.sequences),
+            )
+        else:
+            matrix = engine.matrix
+            shm = shared_memory.SharedMemory(create=True, size=matrix.nbytes)
+            view = np.ndarray(matrix.shape, dtype=np.uint8, buffer=shm.buf)
+            view[:] = matrix
+            del view
+            self._segments[key] = shm
+            handle = SharedDatasetHandle(
+                key=key,
+                shm_name=shm.name,
+                shape=shape,
+                alphabet=engine.alphabet,
+                metadata=metadata,
+            )
+
+        self._handles[key] = handle
+        return handle
+
+    def submit_repetition(
+        self,
+        algorithm_name: str,
+        dataset: Dataset,
+        params: Dict[str, Any],
+        execution_context: Dict[str, Any],
+        repetition: int,
+        total_repetitions: int,
+    ) -> Future:
+        """Submete uma repetição ao pool e retorna o Future correspondente."""
+        task = RepetitionTask(
+            dataset=self.register_dataset(dataset),
+            algorithm_name=algorithm_name,
+            params=params,
+            execution_context=execution_context,
+            repetition=repetition,
+            total_repetitions=total_repetitions,
+        )
+        return self.executor.submit(_run_repetition, task)
+
+    def shutdown(self) -> None:
+        """Encerra os workers e libera a memória compartilhada."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+        for shm in self._segments.values():
+            try:
+                shm.close()
+                shm.unlink()
+            except FileNotFoundError:
+                pass
+        self._segments.clear()
+        self._handles.clear()
@@ -6,8 +6,10 @@ Implementações para armazenamento e recuperação de dados.
 
 from .algorithm_registry import DomainAlgorithmRegistry
 from .dataset_repository import FileDatasetRepository
+from .result_cache import ResultCache
 
 __all__ = [
     "FileDatasetRepository",
     "DomainAlgorithmRegistry",
+    "ResultCache",
 ]
@@ -0,0 +1,264 @@
+"""
+Cache de Resultados em Disco
+
+Armazena o resultado de execuções reprodutíveis (algoritmos determinísticos
+ou execuções com seed fixa), indexado por hash do conteúdo do dataset,
+nome e versão do algoritmo, parâmetros normalizados e seed. Cada entrada é
+um arquivo JSON; o tamanho total é limitado com descarte LRU pela data de
+último acesso (mtime), o que permite compartilhar o diretório entre os
+processos worker do batch.
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from src.domain import Dataset
+from src.infrastructure.logging_config import get_logger
+
+DEFAULT_CACHE_DIR = "./outputs/cache/results"
+DEFAULT_MAX_SIZE_MB = 512.0
+
+_VERSION_CACHE: Dict[type, str] = {}
+
+# Código compartilhado cujo comportamento afeta os resultados de todos os
+# algoritmos (distâncias e métricas); entra no hash de versão de cada um
+_SHARED_SOURCES = (Path(__file__).resolve().parents[2] / "domain" / "metrics.py",)
+
+
+def _json_default(value: Any) -> Any:
+    """Converte tipos numpy e similares para tipos JSON nativos."""
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    if hasattr(value, "item"):
+        return value.item()
+    return str(value)
+
+
+def algorithm_version(algorithm_class: type) -> str:
+    """
+    Versão de um algoritmo para fins de cache.
+
+    Combina o atributo ``version`` da classe (se existir) com o hash do
+    código-fonte de todos os módulos do pacote do plugin (incluindo ``ops/``)
+    e de ``src/domain/metrics.py``, de modo que qualquer alteração no
+    algoritmo ou no cálculo de distâncias invalida as entradas antigas.
+    """
+    cached = _VERSION_CACHE.get(algorithm_class)
+    if cached is not None:
+        return cached
+
+    digest = hashlib.sha1(str(getattr(algorithm_class, "version", "")).encode())
+    module = sys.modules.get(algorithm_class.__module__)
+    module_file = getattr(module, "__file__", None)
+    if module_file:
+        package_dir = Path(module_file).parent
+        for source in sorted(package_dir.rglob("*.py")):
+            digest.update(source.relative_to(package_dir).as_posix().encode())
+            digest.update(source.read_bytes())
+    else:
+        try:
+            digest.update(inspect.getsource(algorithm_class).encode("utf-8"))
+        except (OSError, TypeError):
+            pass
+
+    for source in _SHARED_SOURCES:
+        if source.is_file():
+            digest.update(source.name.encode())
+            digest.update(source.read_bytes())
+
+    version = digest.hexdigest()[:16]
+    _VERSION_CACHE[algorithm_class] = version
+    return version
+
+
+class ResultCache:
+    """
+    Cache LRU de resultados em disco com tamanho máximo.
+
+    Attributes:
+        directory: Diretório das entradas
+        max_bytes: Tamanho máximo total das entradas
+        hits: Consultas atendidas pelo cache
+        misses: Consultas sem entrada válida
+        evictions: Entradas descartadas por excesso de tamanho
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path] = DEFAULT_CACHE_DIR,
+        max_size_mb: float = DEFAULT_MAX_SIZE_MB,
+    ):
+        """
+        Inicializa o cache.
+
+        Args:
+            directory: Diretório das entradas (criado se necessário)
+            max_size_mb: Tamanho máximo do cache em MB
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = int(float(max_size_mb) * 1024 * 1024)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._approx_size: Optional[int] = None
+        self._logger = get_logger(__name__)
+
+    @classmethod
+    def from_config(
+        cls, cache_config: Optional[Dict[str, Any]]
+    ) -> Optional["ResultCache"]:
+        """
+        Cria o cache a partir da seção ``result_cache`` da configuração.
+
+        Returns:
+            Optional[ResultCache]: Cache, ou None se desabilitado
+        """
+        cache_config = cache_config or {}
+        if not cache_config.get("enabled", False):
+            return None
+        return cls(
+            directory=cache_config.get("directory", DEFAULT_CACHE_DIR),
+            max_size_mb=cache_config.get("max_size_mb", DEFAULT_MAX_SIZE_MB),
+        )
+
+    @staticmethod
+    def is_cacheable(algorithm_class: type, params: Dict[str, Any]) -> bool:
+        """Resultado é reprodutível: algoritmo determinístico ou seed fixa."""
+        if getattr(algorithm_class, "is_deterministic", False):
+            return True
+        return params.get("seed") is not None
+
+    def make_key(
+        self,
+        dataset: Dataset,
+        algorithm_name: str,
+        algorithm_class: type,
+        params: Dict[str, Any],
+    ) -> str:
+        """Calcula a chave de cache de uma execução."""
+        from src.infrastructure.orchestrators.worker_pool import dataset_content_key
+
+        payload = json.dumps(
+            {
+                "dataset": dataset_content_key(dataset),
+                "algorithm": algorithm_name,
+                "version": algorithm_version(algorithm_class),
+                "params": params,
+                "seed": params.get("seed"),
+            },
+            sort_keys=True,
+            default=_json_default,
+        )
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Busca um resultado no cache.
+
+        Returns:
+            Optional[Dict[str, Any]]: Resultado armazenado, ou None
+        """
+        path = self._entry_path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                result = json.load(f)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (OSError, json.JSONDecodeError) as e:
+            # Entrada corrompida é descartada e tratada como ausente
+            self._logger.warning(f"Entrada de cache inválida {path.name}: {e}")
+            path.unlink(missing_ok=True)
+            self.misses += 1
+            return None
+
+        # Atualiza o mtime: a ordem LRU usa o último acesso
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self.hits += 1
+        return result
+
+    def put(self, key: str, result: Dict[str, Any]) -> None:
+        """Armazena um resultado e aplica o limite de tamanho."""
+        path = self._entry_path(key)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            data = json.dumps(result, ensure_ascii=False, default=_json_default)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            self._logger.warning(f"Não foi possível gravar no cache: {e}")
+            tmp_path.unlink(missing_ok=True)
+            return
+
+        if self._approx_size is None:
+            self._approx_size = self.size_bytes()
+        else:
+            self._approx_size += len(data.encode("utf-8"))
+
+        if self._approx_size > self.max_bytes:
+            self._evict()
+
+    def size_bytes(self) -> int:
+        """Tamanho total atual das entradas em disco."""
+        total = 0
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".json"):
+                try:
+                    total += entry.stat().st_size
+                except FileNotFoundError:
+                    pass
+        return total
+
+    def _evict(self) -> None:
+        """Remove as entradas menos recentemente usadas até caber no limite."""
+        entries = []
+        for entry in os.scandir(self.directory):
+            if not entry.name.endswith(".json"):
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.unlink(path)
+                self.evictions += 1
+            except FileNotFoundError:
+                pass
+            total -= size
+
+        self._approx_size = total
+
+    def clear(self) -> None:
+        """Remove todas as entradas."""
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".json"):
+                Path(entry.path).unlink(missing_ok=True)
+        self._approx_size = 0
+
+
+def format_cache_report(hits: int, misses: int) -> str:
+    """Resumo de acertos/faltas do cache de resultados."""
+    total = hits + misses
+    rate = (hits / total * 100.0) if total else 0.0
+    return (
+        f"🗄️  Cache de resultados: {hits} hits, {misses} misses ({rate:.1f}% de acerto)"
+    )
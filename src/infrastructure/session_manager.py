@@ -78,6 +78,19 @@ class SessionManager:
 
         return self._session_folder
 
+    def resolve_session(self, session_name: str) -> str:
+        """
+        Seleciona uma sessão existente sem criar diretórios.
+
+        Args:
+            session_name: Nome da pasta da sessão
+
+        Returns:
+            str: Diretório de resultados da sessão
+        """
+        self._session_folder = session_name if self._create_session_folders else ""
+        return self.get_result_dir()
+
     def get_session_folder(self) -> str:
         """Retorna o nome da pasta da sessão atual."""
         return self._session_folder or ""
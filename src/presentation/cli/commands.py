@@ -176,6 +176,11 @@ def register_commands(app: typer.Typer, experiment_service_getter) -> None:
         verbose: bool = typer.Option(
             False, "--verbose", "-v", help="Mostrar detalhes dos resultados"
         ),
+        resume: Optional[str] = typer.Option(
+            None,
+            "--resume",
+            help="Retoma a sessão informada, pulando repetições já concluídas",
+        ),
     ):
         """Executa um arquivo de batch (runs, otimizações ou sensibilidade)."""
         try:
@@ -183,8 +188,10 @@ def register_commands(app: typer.Typer, experiment_service_getter) -> None:
             assert service is not None
 
             typer.echo(f"📋 Executando batch: {cfg}...")
+            if resume:
+                typer.echo(f"♻️  Retomando sessão: {resume}")
 
-            result = service.run_batch(str(cfg))
+            result = service.run_batch(str(cfg), resume_session=resume)
 
             if verbose:
                 typer.echo(f"📊 Resultados detalhados:")
@@ -0,0 +1,41 @@
+"""
+Testes unitários para o consenso guloso do Baseline.
+"""
+
+import random
+
+import pytest
+
+from algorithms.baseline.implementation import greedy_consensus
+from src.domain import metrics
+
+
+def _reference_greedy(strings, alphabet):
+    """Versão original: recalcula a distância do prefixo a cada símbolo."""
+    consensus = []
+    for pos in range(len(strings[0])):
+        best_char, best_max = None, float("inf")
+        for char in alphabet:
+            partial = consensus + [char]
+            max_dist = max(
+                sum(partial[i] != s[i] for i in range(pos + 1)) for s in strings
+            )
+            if max_dist < best_max:
+                best_char, best_max = char, max_dist
+        consensus.append(best_char)
+    return "".join(consensus)
+
+
+@pytest.mark.parametrize("vectorized", [True, False])
+def test_greedy_consensus_matches_reference(vectorized, monkeypatch):
+    if not vectorized:
+        monkeypatch.setattr(metrics, "np", None)
+    rnd = random.Random(0)
+    for alphabet in ["ACGT", "TGCA", "AACG", "ACGTN"]:
+        strings = [
+            "".join(rnd.choice("ACGT") for _ in range(25))
+            for _ in range(rnd.randint(1, 8))
+        ]
+        assert greedy_consensus(strings, alphabet) == _reference_greedy(
+            strings, alphabet
+        )
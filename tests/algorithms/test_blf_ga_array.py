@@ -0,0 +1,132 @@
+"""
+Testes unitários para o motor de população em matriz do BLF-GA.
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+from algorithms.blf_ga.implementation import BLFGA
+from algorithms.blf_ga.ops import array_ops, genetic_ops
+from src.domain.metrics import max_distance
+
+
+def _instance(n=8, L=40, seed=0):
+    rnd = random.Random(seed)
+    base = "".join(rnd.choice("ACGT") for _ in range(L))
+    return [
+        "".join(c if rnd.random() > 0.2 else rnd.choice("ACGT") for c in base)
+        for _ in range(n)
+    ]
+
+
+def test_codec_roundtrip_with_symbol_outside_alphabet():
+    codec = array_ops.PopulationCodec("ACGT", ["ACGN", "TTGA"])
+    assert codec.k == 4
+    assert codec.decode_many(codec.targets) == ["ACGN", "TTGA"]
+
+
+def test_fitness_and_diversity_match_string_versions():
+    strings = _instance()
+    codec = array_ops.PopulationCodec("ACGT", strings)
+    rng = np.random.default_rng(1)
+    matrix = array_ops.random_rows(30, codec.L, codec.k, rng)
+    pop = codec.decode_many(matrix)
+
+    fitness = array_ops.population_fitness(matrix, codec.targets)
+    assert fitness.tolist() == [max_distance(s, strings) for s in pop]
+
+    counts = array_ops.column_counts(matrix, len(codec.symbols))
+    assert array_ops.mean_pairwise_hamming(counts, len(pop)) == pytest.approx(
+        genetic_ops.mean_hamming_distance(pop)
+    )
+
+
+def test_batched_operators_preserve_invariants():
+    rng = np.random.default_rng(2)
+    a = array_ops.random_rows(50, 20, 4, rng)
+    b = array_ops.random_rows(50, 20, 4, rng)
+    active = rng.random(50) < 0.5
+
+    c1, c2 = array_ops.crossover_one_point_batch(a, b, active, rng)
+    assert np.array_equal(c1[~active], a[~active])
+    # Cada posição vem de um dos pais e os filhos são complementares
+    assert np.array_equal(np.where(c1 == a, b, a), c2)
+
+    blocks = [(0, 5), (5, 12), (12, 20)]
+    c1, _ = array_ops.crossover_blend_blocks_batch(a, b, blocks, active, rng)
+    for start, end in blocks:
+        seg_from_a = (c1[:, start:end] == a[:, start:end]).all(axis=1)
+        seg_from_b = (c1[:, start:end] == b[:, start:end]).all(axis=1)
+        assert (seg_from_a | seg_from_b).all()
+
+    for mutate in (
+        array_ops.mutate_inversion_batch,
+        array_ops.mutate_transposition_batch,
+    ):
+        mutated = mutate(a, rng)
+        assert np.array_equal(np.sort(mutated, axis=1), np.sort(a, axis=1))
+
+    mutated = array_ops.mutate_multi_batch(a, 4, 2, rng)
+    changed = (mutated != a).sum(axis=1)
+    assert changed.max() <= 2 and changed.min() >= 1
+    assert mutated.max() < 4
+
+
+@pytest.mark.parametrize("crossover_type", ["one_point", "uniform", "blend_blocks"])
+def test_array_engine_run(crossover_type):
+    strings = _instance(n=10, L=60, seed=3)
+    params = {
+        "seed": 7,
+        "population_engine": "array",
+        "crossover_type": crossover_type,
+        "pop_size": 40,
+        "max_gens": 25,
+        "immigrant_freq": 5,
+        "restart_patience": 4,
+        "rediv_freq": 5,
+    }
+
+    best, best_val, history = BLFGA(strings, "ACGT", **params).run()
+    assert best_val == max_distance(best, strings)
+    assert best_val == min(history)
+
+    # Mesma seed, mesmo resultado
+    assert BLFGA(strings, "ACGT", **params).run() == (best, best_val, history)
+
+
+@pytest.mark.parametrize("engine", ["list", "array"])
+def test_fitness_cache_does_not_change_results(engine):
+    strings = _instance(n=8, L=30, seed=4)
+    params = {"seed": 11, "population_engine": engine, "pop_size": 30, "max_gens": 20}
+
+    cached = BLFGA(strings, "ACGT", **params)
+    uncached = BLFGA(strings, "ACGT", fitness_cache_size=0, **params)
+    assert cached.run() == uncached.run()
+
+    stats = cached.fitness_cache.stats()
+    assert stats["hits"] > 0 and stats["saved_evaluations"] == stats["hits"]
+    assert uncached.fitness_cache.stats()["entries"] == 0
+    assert uncached.fitness_cache.stats()["lookups"] == 0
+
+
+@pytest.mark.parametrize("radius", [0, 2, 6, 30, 100])
+def test_niche_select_matches_pairwise_loop(radius):
+    rng = np.random.default_rng(radius)
+    base = array_ops.random_rows(1, 40, 4, rng)
+    noise = array_ops.random_rows(60, 40, 4, rng)
+    matrix = np.where(rng.random((60, 40)) < 0.15, noise, base)
+    order = rng.permutation(60)
+
+    expected = []
+    for i in order:
+        too_close = any(
+            np.count_nonzero(matrix[i] != matrix[j]) < radius for j in expected
+        )
+        if not too_close or len(expected) < 10:
+            expected.append(i)
+        if len(expected) >= 40:
+            break
+
+    assert array_ops.niche_select(matrix, order, radius, 10, 40) == expected
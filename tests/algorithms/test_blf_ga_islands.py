@@ -0,0 +1,40 @@
+"""
+Testes unitários para o modelo de ilhas do BLF-GA.
+"""
+
+import random
+
+import pytest
+
+from algorithms.blf_ga.algorithm import BLFGAAlgorithm
+from algorithms.blf_ga.islands import migration_targets
+from src.domain.metrics import max_distance
+
+
+def test_migration_targets():
+    assert migration_targets("ring", 3) == [[1], [2], [0]]
+    assert migration_targets("fully_connected", 3) == [[1, 2], [0, 2], [0, 1]]
+    assert migration_targets("star", 3) == [[1, 2], [0], [0]]
+    with pytest.raises(ValueError):
+        migration_targets("mesh", 3)
+
+
+def test_island_run_returns_best_of_islands():
+    rnd = random.Random(5)
+    strings = ["".join(rnd.choice("ACGT") for _ in range(40)) for _ in range(8)]
+    algorithm = BLFGAAlgorithm(
+        strings,
+        "ACGT",
+        seed=2,
+        islands=2,
+        max_gens=12,
+        migration_interval=2,
+        no_improve_patience=0,
+    )
+
+    best, best_val, metadata = algorithm.run()
+    islands = metadata["islands"]
+
+    assert best_val == max_distance(best, strings)
+    assert best_val == min(islands["best_fitness_per_island"])
+    assert islands["migrants_sent"] > 0
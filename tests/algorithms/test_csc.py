@@ -0,0 +1,79 @@
+"""
+Testes unitários para as etapas do CSC.
+"""
+
+import random
+from itertools import product
+
+import numpy as np
+import pytest
+from sklearn.cluster import DBSCAN
+
+from algorithms.csc import implementation as csc
+from src.domain.metrics import max_distance
+
+
+def _instance(n=20, L=50, seed=0):
+    rnd = random.Random(seed)
+    centers = ["".join(rnd.choice("ACGT") for _ in range(L)) for _ in range(3)]
+    return [
+        "".join(
+            c if rnd.random() > 0.1 else rnd.choice("ACGT")
+            for c in centers[i % len(centers)]
+        )
+        for i in range(n)
+    ]
+
+
+def test_cluster_strings_matches_callable_metric():
+    strings = _instance(n=30, seed=1)
+    d, _ = csc.auto_parameters(strings)
+
+    arr, _ = csc.strings_to_array(strings)
+    labels = DBSCAN(
+        eps=d, min_samples=2, metric=lambda x, y: np.sum(x != y)
+    ).fit_predict(arr)
+    expected = {}
+    for s, label in zip(strings, labels):
+        if label != -1:
+            expected.setdefault(label, []).append(s)
+
+    assert csc.cluster_strings(strings, d) == list(expected.values())
+
+
+@pytest.mark.parametrize("n_blocks", [1, 3, 5])
+def test_branch_and_bound_matches_exhaustive_recombination(n_blocks):
+    strings = _instance(n=24, L=23, seed=n_blocks)
+    consensos = [csc.consensus_string(strings[i::4]) for i in range(4)]
+    consensos.append(consensos[0])
+    blocks = [csc.split_blocks(c, n_blocks) for c in consensos]
+    # Enumeração original: um bloco por consenso, normalizado para L
+    candidates = []
+    for t in product(*blocks):
+        cand = csc.recombine_blocks(t)
+        candidates.append((cand + consensos[0][len(cand) :])[:23])
+    expected = min(candidates, key=lambda cand: max_distance(cand, strings))
+
+    best, stats = csc.recombine_branch_and_bound(consensos, strings, n_blocks)
+    assert best == expected
+    assert stats["best_distance"] == max_distance(expected, strings)
+    assert stats["scored"] + stats["pruned"] == stats["unique_candidates"]
+
+
+@pytest.mark.parametrize("mode", ["best", "first"])
+def test_local_search_never_worsens_and_reports_moves(mode):
+    strings = _instance(n=15, L=40, seed=5)
+    start = strings[0]
+    stats = {}
+    refined = csc.local_search(start, strings, mode=mode, seed=3, stats=stats)
+
+    assert len(refined) == len(start)
+    assert stats["best_distance"] == max_distance(refined, strings)
+    assert max_distance(refined, strings) <= max_distance(start, strings)
+    assert stats["moves"] > 0 and stats["iterations"] <= 50
+
+    # Ótimo local: nenhuma troca reduz a distância máxima
+    for pos in range(len(refined)):
+        for c in "ACGT":
+            probe = refined[:pos] + c + refined[pos + 1 :]
+            assert max_distance(probe, strings) >= stats["best_distance"]
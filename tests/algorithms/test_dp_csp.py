@@ -0,0 +1,200 @@
+"""
+Testes unitários para o DP-CSP.
+
+Verifica a exatidão da fronteira compacta contra força bruta e compara o pico
+de memória (RSS) com a implementação anterior baseada em tuplas/dicionário.
+"""
+
+import itertools
+import json
+import random
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from algorithms.dp_csp.implementation import _dp_decision, exact_dp_closest_string
+from src.domain import SyntheticDatasetGenerator
+from src.domain.metrics import max_distance
+
+ROOT = Path(__file__).resolve().parents[2]
+
+
+def _brute_force_radius(strings, alphabet):
+    return min(
+        max_distance("".join(c), strings)
+        for c in itertools.product(alphabet, repeat=len(strings[0]))
+    )
+
+
+def _legacy_dp_decision(strings, alphabet, d):
+    """Implementação anterior (set de tuplas + dict global de pais)."""
+    n, L = len(strings), len(strings[0])
+    delta = []
+    for pos in range(L):
+        col = [s[pos] for s in strings]
+        delta.append({a: tuple(int(a != c) for c in col) for a in alphabet})
+
+    start = (d,) * n
+    frontier = {start}
+    parent = {(0, start): (None, "")}
+    for pos in range(L):
+        nxt = set()
+        for rem in frontier:
+            for a, dv in delta[pos].items():
+                new_rem = tuple(r - v for r, v in zip(rem, dv))
+                if min(new_rem) < 0:
+                    continue
+                key = (pos + 1, new_rem)
+                if key in parent:
+                    continue
+                parent[key] = (rem, a)
+                nxt.add(new_rem)
+        frontier = nxt
+        if not frontier:
+            return None
+
+    chars, pos, rem = [], L, next(iter(frontier))
+    while pos > 0:
+        prev_rem, a = parent[(pos, rem)]
+        chars.append(a)
+        pos -= 1
+        rem = prev_rem
+    return "".join(reversed(chars))
+
+
+# Script executado em subprocesso para medir o pico de RSS isoladamente
+_RSS_SCRIPT = """
+import json, resource, sys
+sys.path.insert(0, {root!r})
+from tests.algorithms.test_dp_csp import _legacy_dp_decision
+from algorithms.dp_csp.implementation import _dp_decision
+from src.infrastructure import FileDatasetRepository
+
+strings = FileDatasetRepository({datasets!r}).load({name!r}).sequences
+alphabet = "".join(sorted(set("".join(strings))))
+solver = _legacy_dp_decision if {legacy!r} else _dp_decision
+before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+d = 0
+while solver(strings, alphabet, d) is None:
+    d += 1
+after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({{"d": d, "peak_kb": after - before}}))
+"""
+
+
+def _peak_rss(dataset, legacy):
+    script = _RSS_SCRIPT.format(
+        root=str(ROOT), datasets=str(ROOT / "datasets"), name=dataset, legacy=legacy
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=ROOT,
+        timeout=600,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+class TestDPDecision:
+    """Testes de exatidão da fronteira compacta."""
+
+    @pytest.mark.parametrize("dominance", [False, True])
+    @pytest.mark.parametrize("seed", range(15))
+    def test_matches_brute_force(self, seed, dominance):
+        rng = random.Random(seed)
+        alphabet = "ACGT"[: rng.randint(2, 4)]
+        L = rng.randint(1, 6)
+        strings = [
+            "".join(rng.choice(alphabet) for _ in range(L))
+            for _ in range(rng.randint(2, 5))
+        ]
+        strings += strings[: rng.randint(0, 2)]  # strings idênticas
+
+        center, d = exact_dp_closest_string(
+            strings, alphabet, dominance_pruning=dominance
+        )
+
+        assert d == _brute_force_radius(strings, alphabet)
+        assert max_distance(center, strings) == d
+
+    def test_radius_search_reports_bounds(self):
+        center = "".join(random.Random(3).choice("ACGT") for _ in range(20))
+        dataset = SyntheticDatasetGenerator.generate_from_center(
+            center, n=8, noise_rate=0.25, alphabet="ACGT", seed=3
+        )
+        stats = {}
+
+        _, d = exact_dp_closest_string(dataset.sequences, "ACGT", stats=stats)
+
+        assert stats["lower_bound"] <= d <= stats["upper_bound"]
+        assert d in stats["radii_tested"]
+        assert all(r >= stats["lower_bound"] for r in stats["radii_tested"])
+
+    def test_dominance_pruning_shrinks_frontier(self):
+        center = "".join(random.Random(5).choice("ACGT") for _ in range(15))
+        dataset = SyntheticDatasetGenerator.generate_from_center(
+            center, n=8, noise_rate=0.3, alphabet="ACGT", seed=5
+        )
+        d = max_distance(dataset.sequences[0], dataset.sequences)
+        plain, pruned = {}, {}
+
+        assert _dp_decision(dataset.sequences, "ACGT", d, counters=plain)
+        assert _dp_decision(
+            dataset.sequences, "ACGT", d, dominance_pruning=True, counters=pruned
+        )
+
+        assert plain["states_dominated"] == 0
+        assert pruned["states_dominated"] > 0
+        assert pruned["max_frontier"] < plain["max_frontier"]
+
+    def test_unpackable_radix_uses_row_dedup(self):
+        # (d+1)^n excede int64: deduplicação por linhas em vez de chaves
+        rng = random.Random(7)
+        base = "".join(rng.choice("ACGT") for _ in range(24))
+        strings = []
+        for _ in range(40):
+            chars = list(base)
+            chars[rng.randrange(24)] = rng.choice("ACGT")
+            strings.append("".join(chars))
+        d = 2  # 3^40 > 2^63
+
+        center = _dp_decision(strings, "ACGT", d)
+
+        assert center is not None
+        assert max_distance(center, strings) <= d
+
+    def test_n12_instance_within_limits(self):
+        # (d+1)^n ≈ 2.8e11 no pior caso: antes abortava pela estimativa
+        center = "".join(random.Random(0).choice("ACGT") for _ in range(20))
+        dataset = SyntheticDatasetGenerator.generate_from_center(
+            center, n=12, noise_rate=0.3, alphabet="ACGT", seed=1
+        )
+
+        found, d = exact_dp_closest_string(dataset.sequences, "ACGT")
+
+        assert max_distance(found, dataset.sequences) == d
+        assert _dp_decision(dataset.sequences, "ACGT", d - 1) is None
+
+    def test_state_limit_raises(self, sample_sequences):
+        with pytest.raises(RuntimeError):
+            _dp_decision(sample_sequences, "ACGT", 3, max_states=1)
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize(
+    "dataset",
+    ["synthetic_n10_L20_noise0.1_ACTG.fasta", "synthetic_n20_L50_noise0.1_ACTG.fasta"],
+)
+def test_peak_rss_against_legacy(dataset, record_property):
+    """Benchmark de memória: pico de RSS da fronteira compacta vs. anterior."""
+    legacy = _peak_rss(dataset, legacy=True)
+    compact = _peak_rss(dataset, legacy=False)
+
+    record_property("peak_kb_legacy", legacy["peak_kb"])
+    record_property("peak_kb_compact", compact["peak_kb"])
+    assert compact["d"] == legacy["d"]
+    assert compact["peak_kb"] <= max(legacy["peak_kb"], 1024)
@@ -0,0 +1,109 @@
+"""
+Testes unitários para os geradores de candidatos por bloco do H³-CSP.
+"""
+
+import itertools
+import random
+
+import pytest
+
+from algorithms.h3_csp.implementation import (
+    H3CSP,
+    _beam_search_block,
+    _exhaustive_block,
+    consensus_block,
+)
+from src.domain.metrics import max_distance
+
+
+def _reference_beam(strings, alphabet, start, end, beam_width, k):
+    """Beam search por recontagem completa do prefixo (versão original)."""
+    beam = [""]
+    for _ in range(end - start):
+        extended = []
+        for prefix in beam:
+            for char in alphabet:
+                candidate = prefix + char
+                score = max_distance(
+                    candidate, [s[start : start + len(candidate)] for s in strings]
+                )
+                extended.append((score, candidate))
+        extended.sort(key=lambda x: x[0])
+        beam = [c for _, c in extended[:beam_width]]
+    final = sorted(
+        ((max_distance(c, [s[start:end] for s in strings]), c) for c in beam),
+        key=lambda x: x[0],
+    )
+    return [c for _, c in final[:k]]
+
+
+@pytest.mark.parametrize("beam_width, k", [(1, 1), (4, 3), (16, 5), (200, 50)])
+def test_beam_search_matches_reference(beam_width, k):
+    rnd = random.Random(beam_width)
+    strings = ["".join(rnd.choice("ACGTN") for _ in range(12)) for _ in range(7)]
+
+    assert _beam_search_block(strings, "ACGT", 2, 10, beam_width, k) == _reference_beam(
+        strings, "ACGT", 2, 10, beam_width, k
+    )
+
+
+def test_exhaustive_block_finds_optimal_candidates():
+    rnd = random.Random(3)
+    strings = ["".join(rnd.choice("ACGTN") for _ in range(9)) for _ in range(6)]
+    segments = [s[1:7] for s in strings]
+    ranked = sorted(
+        ("".join(c) for c in itertools.product("ACGT", repeat=6)),
+        key=lambda c: max_distance(c, segments),
+    )
+
+    result = _exhaustive_block(strings, "ACGT", 1, 7, 4)
+    assert result == ranked[:4]
+
+    # Acima do limite, apenas segmentos originais e consenso são avaliados
+    fallback = _exhaustive_block(strings, "ACGT", 1, 7, 4, limit=100)
+    assert set(fallback) <= set(segments) | {consensus_block(strings, 1, 7)}
+
+    # O custo |Σ|^m × n também é limitado (4^6 × 6 strings > 20000)
+    bounded = _exhaustive_block(strings, "ACGT", 1, 7, 4, work_limit=20_000)
+    assert bounded == fallback
+
+
+def test_parallel_smart_core_matches_sequential():
+    rnd = random.Random(8)
+    base = "".join(rnd.choice("ACGT") for _ in range(120))
+    strings = [
+        "".join(c if rnd.random() > 0.1 else rnd.choice("ACGT") for c in base)
+        for _ in range(6)
+    ]
+
+    sequential = H3CSP(strings, "ACGT", block_workers=1)
+    parallel = H3CSP(strings, "ACGT", block_workers=2)
+
+    assert parallel._smart_core() == sequential._smart_core()
+    stats = parallel.block_stats
+    assert stats["workers"] == 2
+    assert sum(stats["techniques"].values()) == len(parallel.blocks)
+    assert len(stats["block_seconds"]) == len(parallel.blocks)
+
+
+def test_fusion_search_finds_best_combination():
+    rnd = random.Random(11)
+    strings = ["".join(rnd.choice("ACGT") for _ in range(16)) for _ in range(5)]
+    h3 = H3CSP(strings, "ACGT", k_candidates=3, fusion_beam_width=10_000)
+    block_candidates = h3._smart_core()
+
+    best_radius = min(
+        max_distance("".join(combo), strings)
+        for combo in itertools.product(*block_candidates)
+    )
+    greedy_radius = max_distance("".join(c[0] for c in block_candidates), strings)
+    fused = "".join(h3._fusion_search(block_candidates))
+
+    assert max_distance(fused, strings) == min(best_radius, greedy_radius)
+    assert h3.fusion_stats["fused_distance"] == max_distance(fused, strings)
+    assert h3.fusion_stats["greedy_distance"] == greedy_radius
+
+    # Sem fusão a escolha gulosa também é registrada
+    h3.params["fusion_beam_width"] = 0
+    assert h3._fusion_search(block_candidates) == [c[0] for c in block_candidates]
+    assert h3.fusion_stats["fused_distance"] == greedy_radius
@@ -0,0 +1,3 @@
+"""
+Módulo de testes para a camada de domínio.
+"""
@@ -0,0 +1,43 @@
+"""
+Testes unitários para a entidade Dataset.
+
+Verifica que as estatísticas derivadas e a chave de conteúdo são
+calculadas sob demanda e descartadas quando as sequências mudam.
+"""
+
+from src.domain import Dataset, metrics
+
+
+def test_dataset_statistics_are_lazy_and_invalidated(sample_sequences, monkeypatch):
+    calls = []
+    original = Dataset._calculate_diversity
+
+    def counting(self):
+        calls.append(1)
+        return original(self)
+
+    monkeypatch.setattr(Dataset, "_calculate_diversity", counting)
+    dataset = Dataset(list(sample_sequences))
+    sample = dataset.sample(3, seed=1)
+    assert not calls and "diversity" not in sample.metadata
+
+    assert dataset.diversity == dataset.get_statistics()["diversity"]
+    assert len(calls) == 1
+    assert sample.diversity == metrics.diversity_metric(sample.sequences)
+
+    dataset.add_sequence("N" * dataset.length)
+    assert "N" in dataset.alphabet
+    assert dataset.diversity == metrics.diversity_metric(dataset.sequences)
+    dataset.remove_sequence(dataset.size - 1)
+    assert "N" not in dataset.alphabet
+
+
+def test_dataset_content_key_is_cached_and_invalidated(sample_sequences):
+    dataset = Dataset(list(sample_sequences))
+    key = dataset.content_key
+
+    assert key == Dataset(list(sample_sequences)).content_key
+    dataset.add_sequence("ACGTACGA")
+    assert dataset.content_key != key
+    dataset.remove_sequence(dataset.size - 1)
+    assert dataset.content_key == key
@@ -0,0 +1,209 @@
+"""
+Testes unitários para o motor vetorizado de distâncias de Hamming.
+
+Compara o HammingEngine com a implementação pura de referência e mede o
+ganho de desempenho em um micro-benchmark.
+"""
+
+import random
+import time
+
+import pytest
+
+from src.domain import (
+    Dataset,
+    HammingEngine,
+    IncrementalEvaluator,
+    hamming_distance,
+    max_distance,
+    mean_pairwise_hamming,
+    metrics,
+)
+
+
+def _random_strings(n, L, alphabet="ACGT", seed=0):
+    rng = random.Random(seed)
+    return ["".join(rng.choice(alphabet) for _ in range(L)) for _ in range(n)]
+
+
+def _pure_max_distance(center, strings):
+    return max(hamming_distance(center, s) for s in strings)
+
+
+class TestHammingEngine:
+    """Testes de equivalência com o caminho puro."""
+
+    @pytest.fixture
+    def strings(self):
+        return _random_strings(30, 60, seed=1)
+
+    def test_distances_match_pure(self, strings):
+        engine = HammingEngine(strings)
+        center = strings[0][::-1]
+
+        assert engine.distances(center) == [
+            hamming_distance(center, s) for s in strings
+        ]
+        assert engine.max_distance(center) == _pure_max_distance(center, strings)
+
+    def test_max_distance_many(self, strings):
+        engine = HammingEngine(strings)
+        candidates = _random_strings(25, 60, seed=2)
+
+        expected = [_pure_max_distance(c, strings) for c in candidates]
+        assert engine.max_distance_many(candidates) == expected
+
+    def test_unknown_symbols_never_match(self, strings):
+        engine = HammingEngine(strings)
+        center = "N" * 60
+
+        assert engine.max_distance(center) == 60
+
+    def test_distance_matrix(self, strings):
+        engine = HammingEngine(strings)
+        matrix = engine.distance_matrix()
+
+        for i in (0, 7, 29):
+            for j in (0, 3, 29):
+                assert matrix[i][j] == hamming_distance(strings[i], strings[j])
+
+    @pytest.mark.parametrize("dtype", ["float32", "uint16"])
+    def test_distance_matrix_dtype_and_chunks(self, strings, dtype, monkeypatch):
+        # Lotes pequenos para exercitar a divisão por colunas
+        monkeypatch.setattr(metrics, "_CHUNK_BYTES", 4 * 30 * 7)
+        matrix = HammingEngine(strings).distance_matrix(dtype)
+
+        assert matrix.dtype == dtype
+        assert matrix.tolist() == [
+            [hamming_distance(a, b) for b in strings] for a in strings
+        ]
+        with pytest.raises(ValueError):
+            HammingEngine(["A" * 300, "C" * 300]).distance_matrix("uint8")
+
+    def test_column_mismatch_counts(self, sample_sequences):
+        engine = HammingEngine(sample_sequences)
+        mismatches = engine.column_mismatch_counts()
+
+        for pos in range(engine.L):
+            for k, symbol in enumerate(engine.alphabet):
+                expected = sum(s[pos] != symbol for s in sample_sequences)
+                assert mismatches[pos][k] == expected
+
+    def test_length_mismatch_raises(self, strings):
+        engine = HammingEngine(strings)
+
+        with pytest.raises(ValueError):
+            engine.max_distance("ACGT")
+        with pytest.raises(ValueError):
+            max_distance("ACGT", strings)
+
+    def test_pure_fallback(self, strings, monkeypatch):
+        monkeypatch.setattr(metrics, "np", None)
+        engine = HammingEngine(strings)
+        center = strings[3]
+
+        assert not engine.vectorized
+        assert engine.max_distance_many([center]) == [
+            _pure_max_distance(center, strings)
+        ]
+
+    def test_module_function_delegates(self, strings):
+        center = strings[5]
+        assert max_distance(center, strings) == _pure_max_distance(center, strings)
+
+    def test_dataset_engine_is_cached_and_invalidated(self, sample_sequences):
+        dataset = Dataset(list(sample_sequences))
+        engine = dataset.distance_engine
+
+        assert dataset.distance_engine is engine
+        dataset.add_sequence("ACGTACGA")
+        assert dataset.distance_engine is not engine
+        assert dataset.distance_engine.n == len(sample_sequences) + 1
+
+
+class TestIncrementalEvaluator:
+    """Testes do avaliador incremental usado pelas buscas locais."""
+
+    @pytest.mark.parametrize("n", [5, 40])
+    def test_score_matches_full_evaluation(self, n):
+        strings = _random_strings(n, 25, seed=n)
+        center = _random_strings(1, 25, seed=99)[0]
+        evaluator = IncrementalEvaluator(center, strings)
+
+        for pos in (0, 12, 24):
+            for char in "ACGT":
+                probe = center[:pos] + char + center[pos + 1 :]
+                assert evaluator.score(pos, char) == _pure_max_distance(probe, strings)
+
+        changes = [(3, "A"), (7, "C"), (20, "T")]
+        probe = list(center)
+        for pos, char in changes:
+            probe[pos] = char
+        assert evaluator.score_changes(changes) == _pure_max_distance(
+            "".join(probe), strings
+        )
+
+    @pytest.mark.parametrize("n", [5, 40])
+    def test_commit_and_rollback(self, n):
+        strings = _random_strings(n, 20, seed=n + 1)
+        center = strings[0]
+        evaluator = IncrementalEvaluator(center, strings)
+
+        evaluator.apply(0, "T" if center[0] != "T" else "A")
+        evaluator.commit()
+        committed = evaluator.center
+
+        evaluator.apply_changes([(1, "G"), (2, "C")])
+        evaluator.rollback()
+
+        assert evaluator.center == committed
+        assert evaluator.fitness == _pure_max_distance(committed, strings)
+        assert evaluator.distances == [hamming_distance(committed, s) for s in strings]
+
+
+@pytest.mark.parametrize("n, L", [(6, 10), (40, 100)])
+def test_mean_pairwise_hamming_matches_pairs(n, L, monkeypatch):
+    strings = _random_strings(n, L, seed=n)
+    pairs = [
+        hamming_distance(strings[i], strings[j])
+        for i in range(n)
+        for j in range(i + 1, n)
+    ]
+    expected = sum(pairs) / len(pairs)
+
+    assert mean_pairwise_hamming(strings) == pytest.approx(expected)
+    monkeypatch.setattr(metrics, "np", None)
+    assert mean_pairwise_hamming(strings) == pytest.approx(expected)
+
+
+def test_mean_pairwise_hamming_sampled_estimate():
+    strings = _random_strings(400, 50, seed=9)
+    exact = mean_pairwise_hamming(strings)
+    estimate = mean_pairwise_hamming(strings, sample_size=100, seed=1)
+
+    assert estimate == mean_pairwise_hamming(strings, sample_size=100, seed=1)
+    assert estimate == pytest.approx(exact, rel=0.05)
+
+
+@pytest.mark.slow
+def test_max_distance_many_benchmark(record_property):
+    """Micro-benchmark: registra o ganho da avaliação em lote (sem limiar)."""
+    strings = _random_strings(50, 1000, seed=3)
+    candidates = _random_strings(100, 1000, seed=4)
+    engine = HammingEngine(strings)
+    engine.max_distance_many(candidates[:2])  # aquecimento
+
+    start = time.perf_counter()
+    expected = [_pure_max_distance(c, strings) for c in candidates]
+    pure_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = engine.max_distance_many(candidates)
+    engine_time = time.perf_counter() - start
+
+    assert result == expected
+    # Tempo de parede varia com a carga da máquina: o ganho é registrado e
+    # só um piso folgado é exigido, para detectar o retorno ao caminho puro
+    speedup = pure_time / max(engine_time, 1e-9)
+    record_property("speedup", speedup)
+    assert speedup > 2
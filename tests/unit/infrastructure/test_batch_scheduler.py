@@ -0,0 +1,144 @@
+"""
+Testes unitários para o planejamento plano do batch.
+
+Verifica a ordenação por custo esperado e que o batch estruturado,
+executado em um único pool, preserva o contexto hierárquico e a ordem
+original dos resultados.
+"""
+
+from unittest.mock import MagicMock
+
+from src.domain import Dataset
+from src.infrastructure.orchestrators.batch_scheduler import (
+    build_repetition_tasks,
+    make_item_ids_unique,
+    order_longest_first,
+)
+from src.infrastructure.orchestrators.execution_orchestrator import (
+    ExecutionOrchestrator,
+)
+
+
+def test_longest_expected_first(sample_sequences, large_sequences):
+    small = Dataset(list(sample_sequences))
+    large = Dataset(list(large_sequences))
+    context = {"dataset_id": "ds", "algorithm_id": "cfg"}
+
+    tasks = build_repetition_tasks("Baseline", small, {}, 2, context)
+    tasks += build_repetition_tasks("Baseline", large, {}, 1, context, len(tasks))
+    tasks += build_repetition_tasks("DP-CSP", small, {}, 1, context, len(tasks))
+
+    ordered = order_longest_first(tasks)
+    assert [t.algorithm_name for t in ordered][0] == "DP-CSP"
+    assert [t.index for t in ordered] == [3, 2, 0, 1]
+
+
+def test_item_ids_unique_across_configs(sample_sequences):
+    dataset = Dataset(list(sample_sequences))
+    tasks = build_repetition_tasks("Baseline", dataset, {}, 2, {"dataset_id": "d"})
+    tasks += build_repetition_tasks(
+        "Baseline", dataset, {}, 2, {"dataset_id": "d", "algorithm_id": "b"}, 2
+    )
+    make_item_ids_unique(tasks)
+    assert len({t.item_id for t in tasks}) == 4
+    assert tasks[0].item_id == "Baseline_d_1"
+
+
+def test_structured_batch_runs_flat_task_list():
+    batch_config = {
+        "task": {"type": "execution"},
+        "resources": {"parallel": {"max_workers": 2}},
+        "datasets": [
+            {
+                "id": "a",
+                "tipo": "synthetic",
+                "parametros": {"n": 5, "L": 12, "seed": 1},
+            },
+            {
+                "id": "b",
+                "tipo": "synthetic",
+                "parametros": {"n": 6, "L": 30, "seed": 2},
+            },
+        ],
+        "algorithms": [
+            {"id": "cfg1", "algorithms": ["Baseline", "H³-CSP"]},
+            {"id": "cfg2", "algorithms": ["Baseline"]},
+        ],
+        "execution": {
+            "executions": [
+                {
+                    "nome": "exec",
+                    "datasets": ["a", "b"],
+                    "algorithms": ["cfg1", "cfg2"],
+                    "repetitions": 2,
+                }
+            ]
+        },
+    }
+
+    results = ExecutionOrchestrator(None, None).execute_batch(batch_config)
+
+    keys = [
+        (r["algorithm_id"], r["dataset_id"], r["algorithm_name"], r["repetition"])
+        for r in results
+    ]
+    assert keys == [
+        (cfg, ds, algo, rep)
+        for cfg, algos in (("cfg1", ["Baseline", "H³-CSP"]), ("cfg2", ["Baseline"]))
+        for ds in ("a", "b")
+        for algo in algos
+        for rep in (1, 2)
+    ]
+    assert all(r["status"] == "success" for r in results)
+    assert all(r["execution_name"] == "exec" for r in results)
+
+
+def test_dataset_monitoring_follows_task_completion():
+    events = []
+    monitoring = MagicMock()
+    monitoring.start_item.side_effect = lambda item_id, *a, **k: events.append(
+        ("start", item_id)
+    )
+    monitoring.finish_item.side_effect = lambda item_id, *a, **k: events.append(
+        ("finish", item_id)
+    )
+    monitoring.monitor.update_hierarchy.side_effect = lambda **k: events.append(
+        (k["level"].name, k["level_id"], k["progress"])
+    )
+    batch_config = {
+        "task": {"type": "execution"},
+        "resources": {"parallel": {"max_workers": 1}},
+        "datasets": [
+            {"id": ds, "tipo": "synthetic", "parametros": {"n": 4, "L": 8}}
+            for ds in ("a", "b")
+        ],
+        "algorithms": [{"id": "cfg", "algorithms": ["Baseline"]}],
+        "execution": {
+            "executions": [
+                {
+                    "nome": "exec",
+                    "datasets": ["a", "b"],
+                    "algorithms": ["cfg"],
+                    "repetitions": 2,
+                }
+            ]
+        },
+    }
+
+    ExecutionOrchestrator(None, None).execute_batch(batch_config, monitoring)
+
+    datasets = [e for e in events if e[0] != "EXECUTION"]
+    assert datasets == [
+        ("DATASET", "a_cfg", 0.0),
+        ("start", "Baseline_a_1"),
+        ("finish", "Baseline_a_1"),
+        ("start", "Baseline_a_2"),
+        ("finish", "Baseline_a_2"),
+        ("DATASET", "a_cfg", 1.0),
+        ("DATASET", "b_cfg", 0.0),
+        ("start", "Baseline_b_1"),
+        ("finish", "Baseline_b_1"),
+        ("start", "Baseline_b_2"),
+        ("finish", "Baseline_b_2"),
+        ("DATASET", "b_cfg", 1.0),
+    ]
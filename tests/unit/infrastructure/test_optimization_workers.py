@@ -0,0 +1,80 @@
+"""
+Testes unitários para a otimização com workers em processos.
+"""
+
+import json
+from types import SimpleNamespace
+
+from algorithms.baseline.algorithm import BaselineAlg
+from src.domain import SyntheticDatasetGenerator
+from src.infrastructure.orchestrators.optimization_orchestrator import (
+    OptimizationOrchestrator,
+)
+
+
+def _orchestrator(destination, n_workers, n_trials):
+    dataset = SyntheticDatasetGenerator.generate_random(
+        n=8, length=30, alphabet="ACGT", seed=1
+    )
+    config = {
+        "algorithm": "Baseline",
+        "dataset": "d",
+        "optimization": {
+            "study_name": "estudo",
+            "n_trials": n_trials,
+            "parameters": {"x": {"type": "int", "low": 0, "high": 100}},
+            "optuna_config": {
+                "sampler": "RandomSampler",
+                "seed": 3,
+                "n_workers": n_workers,
+            },
+            "result_cache": {"enabled": False},
+        },
+        "export": {"enabled": False, "destination": str(destination)},
+    }
+    return OptimizationOrchestrator(
+        SimpleNamespace(
+            algorithm_exists=lambda n: True, get_algorithm=lambda n: BaselineAlg
+        ),
+        SimpleNamespace(exists=lambda i: True, load=lambda i: dataset),
+        config,
+    )
+
+
+def test_process_workers_share_one_study(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    orchestrator = _orchestrator(tmp_path / "out", n_workers=3, n_trials=7)
+    orchestrator.checkpoint_interval = 2
+    checkpoints = []
+    save = orchestrator._save_partial_results
+    monkeypatch.setattr(
+        orchestrator,
+        "_save_partial_results",
+        lambda: (checkpoints.append(orchestrator.trial_count), save()),
+    )
+    results = orchestrator.run_optimization()
+
+    assert results["n_trials"] == 7
+    assert sorted(t["number"] for t in results["trials"]) == list(range(7))
+    assert (tmp_path / "out" / "estudo.optuna.journal").exists()
+
+    partial = json.loads((tmp_path / "out" / "partial_results.json").read_text())
+    assert [t["trial_number"] for t in partial["trials"]] == list(range(7))
+    assert partial["best_value"] == results["best_value"]
+    # Checkpoints salvos conforme os trials terminam, não só ao final
+    assert checkpoints[:3] == [2, 4, 6]
+
+
+def test_merge_worker_cache_counters(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    orchestrator = _orchestrator(tmp_path / "out", n_workers=2, n_trials=2)
+    orchestrator.result_cache = SimpleNamespace(hits=1, misses=2, evictions=0)
+    orchestrator._merge_worker_results(
+        [
+            {"cache_hits": 3, "cache_misses": 1, "cache_evictions": 2},
+            {"cache_hits": 0, "cache_misses": 4, "cache_evictions": 1},
+        ]
+    )
+
+    cache = orchestrator.result_cache
+    assert (cache.hits, cache.misses, cache.evictions) == (4, 7, 3)
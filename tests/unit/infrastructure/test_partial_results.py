@@ -0,0 +1,117 @@
+"""
+Testes unitários para o salvamento de resultados parciais em JSON Lines.
+"""
+
+import json
+import threading
+
+from src.infrastructure.io import (
+    FileExporter,
+    PartialResultsStream,
+    PartialResultsWriter,
+    load_partial_results,
+    partial_results,
+)
+
+
+def _results(count):
+    return [
+        {"algorithm": "Baseline", "repetition": i, "status": "success", "x": "ç"}
+        for i in range(count)
+    ] + [{"algorithm": "CSC", "status": "error", "error": "boom"}]
+
+
+def test_writer_roundtrip_and_flush(tmp_path):
+    path = tmp_path / "partial_results.jsonl"
+    results = _results(50)
+
+    with PartialResultsWriter(path, fsync_every=8) as writer:
+        for result in results[:10]:
+            writer.write(result)
+        writer.flush()
+        assert load_partial_results(path) == results[:10]
+
+        for result in results[10:]:
+            writer.write(result)
+        assert writer.count == len(results)
+
+    assert load_partial_results(path) == results
+    assert len(path.read_text(encoding="utf-8").splitlines()) == len(results)
+
+
+def test_reader_ignores_truncated_last_line(tmp_path):
+    path = tmp_path / "partial_results.jsonl"
+    with PartialResultsWriter(path) as writer:
+        writer.write({"repetition": 1})
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"repetition": 2, "sta')
+
+    assert load_partial_results(path) == [{"repetition": 1}]
+
+    # Retomada em modo append preserva o que já estava gravado
+    with PartialResultsWriter(path, append=True) as writer:
+        writer.write({"repetition": 3})
+    assert [r["repetition"] for r in load_partial_results(path)] == [1, 3]
+
+
+def test_exporters_stream_from_disk(tmp_path):
+    path = tmp_path / "partial_results.jsonl"
+    results = _results(5)
+    with PartialResultsWriter(path) as writer:
+        for result in results:
+            writer.write(result)
+
+    exporter = FileExporter(str(tmp_path / "out"))
+    stream = PartialResultsStream(path)
+    for fmt in ("json", "csv", "txt"):
+        from_list = exporter.export_batch_results(results, fmt, f"list.{fmt}")
+        from_stream = exporter.export_batch_results(stream, fmt, f"stream.{fmt}")
+        with open(from_list, encoding="utf-8") as a, open(
+            from_stream, encoding="utf-8"
+        ) as b:
+            assert a.read() == b.read()
+
+    # Dados aninhados (formato do ExperimentService) também são transmitidos
+    nested = [{"batch_summary": {"total": 6}, "detailed_results": stream}]
+    exported = exporter.export_batch_results(nested, "json", "nested.json")
+    with open(exported, encoding="utf-8") as f:
+        data = json.load(f)
+    assert data["batch_results"][0]["detailed_results"] == results
+
+
+def test_stream_follows_task_order(tmp_path):
+    path = tmp_path / "partial_results.jsonl"
+    with PartialResultsWriter(path) as writer:
+        for index in (2, 0, 3, 1):
+            writer.write({"task_index": index, "status": "success"})
+        writer.write({"dataset_id": "x", "status": "error"})
+
+    stream = PartialResultsStream(path)
+    assert [r.get("task_index") for r in stream] == [None, 0, 1, 2, 3]
+    assert len(stream) == 5
+
+    exported = FileExporter(str(tmp_path / "out")).export_batch_results(
+        stream, "json", "ordered.json"
+    )
+    with open(exported, encoding="utf-8") as f:
+        data = json.load(f)
+    assert data["batch_results"] == list(stream)
+
+
+def test_writer_survives_sync_errors(tmp_path, monkeypatch):
+    def failing_fsync(fd):
+        raise OSError("disco cheio")
+
+    monkeypatch.setattr(partial_results.os, "fsync", failing_fsync)
+    writer = PartialResultsWriter(tmp_path / "partial_results.jsonl", fsync_every=1)
+    writer.write({"repetition": 1})
+
+    # flush não pode ficar bloqueado com a thread de escrita morta
+    flusher = threading.Thread(target=writer.flush, daemon=True)
+    flusher.start()
+    flusher.join(timeout=5)
+    assert not flusher.is_alive()
+    assert isinstance(writer.error, OSError)
+
+    writer.write({"repetition": 2})
+    writer.close()
@@ -0,0 +1,104 @@
+"""
+Testes unitários para o cache de resultados em disco.
+"""
+
+import os
+
+from algorithms import global_registry
+from src.domain import Dataset
+from src.infrastructure.orchestrators.execution_orchestrator import (
+    ExecutionOrchestrator,
+)
+from src.infrastructure.persistence import result_cache
+from src.infrastructure.persistence.result_cache import ResultCache
+
+
+def _dataset():
+    return Dataset(["ACGTACGT", "ACGTTCGT", "ACCTACGA"])
+
+
+def test_key_depends_on_dataset_params_and_seed(tmp_path):
+    cache = ResultCache(tmp_path)
+    baseline = global_registry["Baseline"]
+    key = cache.make_key(_dataset(), "Baseline", baseline, {"tie_break": "lex"})
+
+    assert key == cache.make_key(_dataset(), "Baseline", baseline, {"tie_break": "lex"})
+    assert key != cache.make_key(
+        Dataset(["ACGTACGT", "ACGTTCGT", "ACCTACGG"]),
+        "Baseline",
+        baseline,
+        {"tie_break": "lex"},
+    )
+    assert key != cache.make_key(
+        _dataset(), "Baseline", baseline, {"tie_break": "lex", "seed": 1}
+    )
+
+
+def test_cacheable_only_when_reproducible():
+    class Random:
+        is_deterministic = False
+
+    class Deterministic:
+        is_deterministic = True
+
+    assert ResultCache.is_cacheable(Deterministic, {})
+    assert ResultCache.is_cacheable(Random, {"seed": 3})
+    assert not ResultCache.is_cacheable(Random, {})
+    assert not ResultCache.is_cacheable(Random, {"seed": None})
+
+
+def test_algorithm_version_tracks_shared_sources(tmp_path, monkeypatch):
+    shared = tmp_path / "metrics.py"
+    shared.write_text("A = 1\n")
+    monkeypatch.setattr(result_cache, "_SHARED_SOURCES", (shared,))
+    monkeypatch.setattr(result_cache, "_VERSION_CACHE", {})
+    baseline = global_registry["Baseline"]
+    before = result_cache.algorithm_version(baseline)
+
+    shared.write_text("A = 2\n")
+    result_cache._VERSION_CACHE.clear()
+
+    assert result_cache.algorithm_version(baseline) != before
+
+
+def test_lru_eviction_respects_size_limit(tmp_path):
+    cache = ResultCache(tmp_path, max_size_mb=0.002)  # ~2 KB
+    payload = {"best_string": "A" * 500}
+
+    for i in range(3):
+        cache.put(f"k{i}", payload)
+        os.utime(tmp_path / f"k{i}.json", (i, i))
+
+    # Acesso a k0 o torna o mais recente; k1 deve ser o descartado
+    assert cache.get("k0") == payload
+    cache.put("k3", payload)
+    cache.put("k4", payload)
+
+    assert cache.size_bytes() <= cache.max_bytes
+    assert cache.get("k1") is None
+    assert cache.get("k0") == payload
+    assert cache.evictions >= 1
+
+
+def test_execute_single_reuses_cached_result(tmp_path):
+    config = {
+        "infrastructure": {
+            "result_cache": {"enabled": True, "directory": str(tmp_path)}
+        }
+    }
+    first = ExecutionOrchestrator(None, None)
+    first._current_batch_config = config
+    result = first.execute_single("Baseline", _dataset())
+    assert result["cache_hit"] is False
+
+    second = ExecutionOrchestrator(None, None)
+    second._current_batch_config = config
+    cached = second.execute_single("Baseline", _dataset())
+
+    assert cached["cache_hit"] is True
+    assert cached["best_string"] == result["best_string"]
+    assert cached["max_distance"] == result["max_distance"]
+    assert cached["execution_id"] != result["execution_id"]
+    assert cached["metadata"]["cache_hit"] is True
+    assert cached["metadata"]["original_execution_time"] == result["execution_time"]
+    assert second._get_result_cache().hits == 1
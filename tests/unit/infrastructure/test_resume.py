@@ -0,0 +1,100 @@
+"""
+Testes unitários para a retomada de sessões de batch (--resume).
+"""
+
+import json
+
+import pytest
+
+from src.infrastructure.io import load_partial_results
+from src.infrastructure.orchestrators.execution_orchestrator import (
+    ExecutionOrchestrator,
+)
+
+
+def _batch_config(result_dir, resume_session=None):
+    result = {"save_partial_results": True, "base_result_dir": str(result_dir)}
+    if resume_session:
+        result["resume_session"] = resume_session
+    return {
+        "task": {"type": "execution"},
+        "infrastructure": {"result": result},
+        "resources": {"parallel": {"max_workers": 1}},
+        "datasets": [
+            {"id": "a", "tipo": "synthetic", "parametros": {"n": 5, "L": 12, "seed": 1}}
+        ],
+        "algorithms": [{"id": "cfg", "algorithms": ["Baseline", "CSC"]}],
+        "execution": {
+            "executions": [
+                {
+                    "nome": "e",
+                    "datasets": ["a"],
+                    "algorithms": ["cfg"],
+                    "repetitions": 3,
+                }
+            ]
+        },
+    }
+
+
+def test_resume_skips_completed_tasks(tmp_path):
+    first = ExecutionOrchestrator(None, None)
+    results = first.execute_batch(_batch_config(tmp_path))
+    path = first.get_partial_results_stream().path
+    assert len(results) == 6
+    assert len({r["task_fingerprint"] for r in results}) == 6
+
+    # Simular queda: duas repetições perdidas, uma com erro, linha truncada
+    lines = path.read_text(encoding="utf-8").splitlines()
+    failed = json.loads(lines[2])
+    failed["status"] = "error"
+    path.write_text(
+        "\n".join(lines[:2] + [json.dumps(failed)] + lines[3:4]) + '\n{"stat',
+        encoding="utf-8",
+    )
+
+    resumed = ExecutionOrchestrator(None, None)
+    results_resumed = resumed.execute_batch(_batch_config(tmp_path, str(path.parent)))
+
+    # Só as 3 repetições ausentes/com erro foram executadas novamente
+    assert len(resumed._executions) == 3
+    assert [r["task_fingerprint"] for r in results_resumed] == [
+        r["task_fingerprint"] for r in results
+    ]
+    assert all(r["status"] == "success" for r in results_resumed)
+
+    saved = load_partial_results(path)
+    assert sorted(r["task_fingerprint"] for r in saved) == sorted(
+        r["task_fingerprint"] for r in results
+    )
+
+
+def test_configs_with_same_params_are_distinct_tasks(tmp_path):
+    config = _batch_config(tmp_path)
+    config["algorithms"] = [
+        {"id": "cfg1", "algorithms": ["Baseline"]},
+        {"id": "cfg2", "algorithms": ["Baseline"]},
+    ]
+    config["execution"]["executions"][0]["algorithms"] = ["cfg1", "cfg2"]
+
+    first = ExecutionOrchestrator(None, None)
+    results = first.execute_batch(config)
+    assert len({r["task_fingerprint"] for r in results}) == 6
+
+    path = first.get_partial_results_stream().path
+    resumed = ExecutionOrchestrator(None, None)
+    config["infrastructure"]["result"]["resume_session"] = str(path.parent)
+    results_resumed = resumed.execute_batch(config)
+
+    assert len(resumed._executions) == 0
+    assert sorted(r["algorithm_id"] for r in results_resumed) == sorted(
+        r["algorithm_id"] for r in results
+    )
+
+
+def test_resume_unknown_session_creates_nothing(tmp_path):
+    orchestrator = ExecutionOrchestrator(None, None)
+
+    with pytest.raises(FileNotFoundError):
+        orchestrator.execute_batch(_batch_config(tmp_path, "missing"))
+    assert not (tmp_path / "missing").exists()
@@ -0,0 +1,60 @@
+"""
+Testes unitários para o pool de workers do batch.
+
+Verifica que o dataset publicado em memória compartilhada é reconstruído
+fielmente nos workers e que o pool é reutilizado entre submissões.
+"""
+
+from multiprocessing import shared_memory
+
+import pytest
+
+from src.domain import Dataset
+from src.infrastructure.orchestrators.execution_orchestrator import (
+    ExecutionOrchestrator,
+)
+from src.infrastructure.orchestrators.worker_pool import (
+    BatchWorkerPool,
+    _decode_shared_dataset,
+)
+
+
+@pytest.fixture
+def dataset(large_sequences):
+    return Dataset(list(large_sequences), metadata={"name": "pool_test"})
+
+
+def test_shared_dataset_roundtrip(dataset):
+    with BatchWorkerPool(max_workers=2) as pool:
+        handle = pool.register_dataset(dataset)
+        assert handle.shm_name is not None
+        assert handle.shape == (dataset.size, dataset.length)
+        assert _decode_shared_dataset(handle) == dataset.sequences
+        # Mesmo conteúdo em outro objeto reutiliza o mesmo bloco
+        assert pool.register_dataset(Dataset(list(dataset.sequences))) is handle
+
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=handle.shm_name)
+
+
+def test_pool_runs_repetitions_with_context(dataset):
+    context = {"execution_name": "exec", "dataset_id": "ds", "algorithm_id": "cfg"}
+    expected = ExecutionOrchestrator(None, None).execute_single("Baseline", dataset)
+
+    with BatchWorkerPool(max_workers=2) as pool:
+        futures = [
+            pool.submit_repetition("Baseline", dataset, {}, context, rep, 3)
+            for rep in (1, 2, 3)
+        ]
+        executor = pool.executor
+        results = [f.result() for f in futures]
+        # Submissões posteriores reutilizam os mesmos processos
+        pool.submit_repetition("Baseline", dataset, {}, context, 1, 1).result()
+        assert pool.executor is executor
+
+    assert [r["repetition"] for r in results] == [1, 2, 3]
+    for result in results:
+        assert result["status"] == "success"
+        assert result["dataset_id"] == "ds"
+        assert result["best_string"] == expected["best_string"]
+        assert result["max_distance"] == expected["max_distance"]